@@ -1,5 +1,5 @@
 from .caida_as_graph import CAIDAASGraph
-from .base import ASGraph, AS
+from .base import ASGraph, AS, PropagationSchedule
 from .base import ASGraphCollector
 from .base import ASGraphInfo
 from .base import CustomerProviderLink, Link, PeerLink
@@ -10,6 +10,7 @@ from .caida_as_graph import CAIDAASGraphConstructor
 __all__ = [
     "ASGraph",
     "AS",
+    "PropagationSchedule",
     "ASGraphCollector",
     "ASGraphInfo",
     "CustomerProviderLink",
@@ -1,4 +1,4 @@
-from .as_graph import ASGraph, AS
+from .as_graph import ASGraph, AS, PropagationSchedule
 from .as_graph_collector import ASGraphCollector
 from .as_graph_constructor import ASGraphConstructor
 from .as_graph_info import ASGraphInfo
@@ -7,6 +7,7 @@ from .links import CustomerProviderLink, Link, PeerLink
 __all__ = [
     "ASGraph",
     "AS",
+    "PropagationSchedule",
     "ASGraphCollector",
     "ASGraphConstructor",
     "ASGraphInfo",
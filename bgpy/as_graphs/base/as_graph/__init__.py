@@ -1,4 +1,5 @@
 from .base_as import AS
 from .as_graph import ASGraph
+from .propagation_schedule import PropagationSchedule
 
-__all__ = ["AS", "ASGraph"]
+__all__ = ["AS", "ASGraph", "PropagationSchedule"]
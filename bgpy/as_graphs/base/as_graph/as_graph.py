@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Callable, Optional
 from weakref import proxy
 
@@ -5,6 +6,7 @@ from frozendict import frozendict
 from yamlable import yaml_info, YamlAble, yaml_info_decorate
 
 from .base_as import AS
+from .propagation_schedule import PropagationSchedule
 
 from bgpy.enums import ASGroups
 
@@ -231,6 +233,15 @@ class ASGraph(YamlAble):
             }
         )
 
+    @cached_property
+    def propagation_schedule(self) -> PropagationSchedule:
+        """Returns the propagation ranks and neighbors as index arrays
+
+        Computed once, since the graph never changes after it's created
+        """
+
+        return PropagationSchedule.from_as_graph(self)
+
     ##############
     # Yaml funcs #
     ##############
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bgpy.enums import Relationships
+
+if TYPE_CHECKING:
+    from .as_graph import ASGraph
+
+
+# (senders, receivers) index arrays
+Edges = tuple[NDArray[np.int64], NDArray[np.int64]]
+
+
+@dataclass(frozen=True, slots=True)
+class PropagationSchedule:
+    """The propagation order of an ASGraph, compiled into index arrays
+
+    ASes are referred to by their index in as_graph.ases, so that engines
+    can iterate over the phases and neighbors without touching AS objects.
+    Use ASGraph.propagation_schedule, which is only computed once.
+
+    Neighbors are stored in CSR format: the neighbors of the AS at index
+    i are indices[indptr[i]:indptr[i + 1]], in the same order as the
+    AS's tuple of neighbors (see get_neighbors).
+
+    The edges are (senders, receivers) for each phase. Edges are grouped
+    by receiver, and the receivers are in propagation rank order.
+    """
+
+    asns: NDArray[np.int64]
+    # AS indexes per propagation rank, from the stubs to the input clique
+    up_ranks: tuple[NDArray[np.int64], ...]
+    # AS indexes in the order that they propagate to peers (as_graph order)
+    peer_phase: NDArray[np.int64]
+    # AS indexes per propagation rank, from the input clique to the stubs
+    down_ranks: tuple[NDArray[np.int64], ...]
+    # Neighbors of each AS (CSR)
+    provider_indptr: NDArray[np.int64]
+    provider_indices: NDArray[np.int64]
+    peer_indptr: NDArray[np.int64]
+    peer_indices: NDArray[np.int64]
+    customer_indptr: NDArray[np.int64]
+    customer_indices: NDArray[np.int64]
+    # Customers to providers, for every up rank after the first
+    up_edges: tuple[Edges, ...]
+    # All peering edges
+    peer_edges: Edges
+    # Providers to customers, for every down rank after the first
+    down_edges: tuple[Edges, ...]
+
+    @classmethod
+    def from_as_graph(cls, as_graph: "ASGraph") -> "PropagationSchedule":
+        """Compiles the schedule for the AS graph"""
+
+        indexes = {x.asn: i for i, x in enumerate(as_graph.ases)}
+        provider_indptr, provider_indices = _get_csr(as_graph, indexes, "providers")
+        peer_indptr, peer_indices = _get_csr(as_graph, indexes, "peers")
+        customer_indptr, customer_indices = _get_csr(as_graph, indexes, "customers")
+
+        up_ranks = tuple(
+            np.array([indexes[x.asn] for x in rank], dtype=np.int64)
+            for rank in as_graph.propagation_ranks
+        )
+        down_ranks = tuple(reversed(up_ranks))
+        peer_phase = np.arange(len(as_graph.ases), dtype=np.int64)
+
+        return cls(
+            asns=np.array([x.asn for x in as_graph.ases], dtype=np.int64),
+            up_ranks=up_ranks,
+            peer_phase=peer_phase,
+            down_ranks=down_ranks,
+            provider_indptr=provider_indptr,
+            provider_indices=provider_indices,
+            peer_indptr=peer_indptr,
+            peer_indices=peer_indices,
+            customer_indptr=customer_indptr,
+            customer_indices=customer_indices,
+            up_edges=tuple(
+                _get_edges(rank, customer_indptr, customer_indices)
+                for rank in up_ranks[1:]
+            ),
+            peer_edges=_get_edges(peer_phase, peer_indptr, peer_indices),
+            down_edges=tuple(
+                _get_edges(rank, provider_indptr, provider_indices)
+                for rank in down_ranks[1:]
+            ),
+        )
+
+    def get_neighbors(self, as_idx: int, rel: Relationships) -> NDArray[np.int64]:
+        """Returns the indexes of an AS's neighbors with that relationship
+
+        rel is the relationship of the neighbors to the AS
+        """
+
+        if rel.value == Relationships.PROVIDERS.value:
+            indptr, indices = self.provider_indptr, self.provider_indices
+        elif rel.value == Relationships.PEERS.value:
+            indptr, indices = self.peer_indptr, self.peer_indices
+        elif rel.value == Relationships.CUSTOMERS.value:
+            indptr, indices = self.customer_indptr, self.customer_indices
+        else:
+            raise NotImplementedError(f"No neighbors for {rel}")
+        return indices[indptr[as_idx] : indptr[as_idx + 1]]
+
+
+def _get_csr(
+    as_graph: "ASGraph", indexes: dict[int, int], attr: str
+) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Returns (indptr, indices) of the neighbors in the attr of every AS"""
+
+    indptr = np.zeros(len(as_graph.ases) + 1, dtype=np.int64)
+    indices: list[int] = list()
+    for i, as_obj in enumerate(as_graph.ases):
+        indices.extend(indexes[x.asn] for x in getattr(as_obj, attr))
+        indptr[i + 1] = len(indices)
+    return indptr, np.array(indices, dtype=np.int64)
+
+
+def _get_edges(
+    receivers: NDArray[np.int64],
+    indptr: NDArray[np.int64],
+    indices: NDArray[np.int64],
+) -> Edges:
+    """Returns (senders, receivers) from the neighbors of every receiver"""
+
+    starts = indptr[receivers]
+    counts = indptr[receivers + 1] - starts
+    # Position of each edge within its receiver's neighbors
+    offsets = np.arange(counts.sum(), dtype=np.int64) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    return (
+        indices[np.repeat(starts, counts) + offsets],
+        np.repeat(receivers, counts),
+    )
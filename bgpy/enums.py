@@ -31,6 +31,19 @@ class Outcomes(YamlAbleEnum):
     UNDETERMINED: int = 3
 
 
+class PacketOutcomes(YamlAbleEnum):
+    """Where a (spoofed) packet ends up on the data plane"""
+
+    # Reached the reflector and was accepted there
+    DELIVERED: int = 0
+    # Dropped by source address validation
+    DROPPED_BY_SAV: int = 1
+    # No route to the reflector (or the route ended at another AS)
+    DISCONNECTED: int = 2
+    # The next hops loop without reaching the reflector
+    LOOP: int = 3
+
+
 class Relationships(YamlAbleEnum):
     # Must start at one for the priority
     PROVIDERS: int = 1
@@ -1,10 +1,30 @@
 from .announcement import Announcement
+from .announcement import get_roa_validity
+from .lazy_path_announcement import LazyASPath
+from .lazy_path_announcement import LazyPathAnnouncement
+from .interned_path_announcement import InternedASPath
+from .interned_path_announcement import InternedPathAnnouncement
+from .announcement_family import CoreAnnouncement
+from .announcement_family import ROAAnnMixin
+from .announcement_family import BGPSecAnnMixin
+from .announcement_family import OnlyToCustomersAnnMixin
+from .announcement_family import WithdrawAnnMixin
+from .announcement_family import get_ann_cls
+from .announcement_family import get_ann_cls_for_policies
+from .wire_announcement import WireAnnouncement
+from .wire_announcement import get_wire_ann_cls
 
 from .ann_containers import LocalRIB
+from .ann_containers import OriginIndexedLocalRIB
 from .ann_containers import RIBsIn
 from .ann_containers import RIBsOut
 from .ann_containers import SendQueue
 from .ann_containers import RecvQueue
+from .ann_containers import BestRecvQueue
+from .ann_containers import RIBStore
+from .ann_containers import LocalRIBView
+
+from .forwarding_tree import ForwardingTree
 
 from .policies import Policy
 from .policies import BGP
@@ -47,14 +67,35 @@ from .policies import ASPAFull as ASPAPolicy
 
 from .simulation_engines import BaseSimulationEngine
 from .simulation_engines import SimulationEngine
+from .simulation_engines import ArraySimulationEngine
+from .simulation_engines import ParallelArraySimulationEngine
 
 __all__ = [
     "Announcement",
+    "get_roa_validity",
+    "LazyASPath",
+    "LazyPathAnnouncement",
+    "InternedASPath",
+    "InternedPathAnnouncement",
+    "CoreAnnouncement",
+    "ROAAnnMixin",
+    "BGPSecAnnMixin",
+    "OnlyToCustomersAnnMixin",
+    "WithdrawAnnMixin",
+    "get_ann_cls",
+    "get_ann_cls_for_policies",
+    "WireAnnouncement",
+    "get_wire_ann_cls",
     "LocalRIB",
+    "LocalRIBView",
+    "OriginIndexedLocalRIB",
+    "RIBStore",
     "RIBsIn",
     "RIBsOut",
     "SendQueue",
     "RecvQueue",
+    "BestRecvQueue",
+    "ForwardingTree",
     "BGP",
     "BGPFull",
     "PeerROV",
@@ -88,6 +129,8 @@ __all__ = [
     "ASPAPolicy",
     "BaseSimulationEngine",
     "SimulationEngine",
+    "ArraySimulationEngine",
+    "ParallelArraySimulationEngine",
     "BaseSAVPolicy",
     "StrictuRPF",
     "FeasiblePathuRPF",
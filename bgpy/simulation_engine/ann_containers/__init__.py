@@ -1,15 +1,20 @@
-from .recv_queue import RecvQueue
+from .recv_queue import RecvQueue, BestRecvQueue
 from .send_queue import SendQueue, SendInfo
-from .local_rib import LocalRIB
+from .local_rib import LocalRIB, OriginIndexedLocalRIB
 from .ribs_out import RIBsOut
 from .ribs_in import RIBsIn, AnnInfo
+from .rib_store import RIBStore, LocalRIBView
 
 __all__ = [
     "RecvQueue",
+    "BestRecvQueue",
     "SendQueue",
     "SendInfo",
     "LocalRIB",
+    "OriginIndexedLocalRIB",
     "RIBsOut",
     "RIBsIn",
     "AnnInfo",
+    "RIBStore",
+    "LocalRIBView",
 ]
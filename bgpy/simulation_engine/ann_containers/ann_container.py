@@ -1,32 +1,56 @@
 from collections import UserDict
+from collections.abc import Mapping, MutableMapping
+import platform
 import pprint
-from typing import Any, Generic, TypeVar
+from typing import (
+    Any,
+    Generic,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Optional,
+    TYPE_CHECKING,
+    TypeVar,
+    ValuesView,
+)
 
 KeyType = TypeVar("KeyType")
 ValueType = TypeVar("ValueType")
+ContainerType = TypeVar("ContainerType", bound="_AnnContainerBase")
 
 
-class AnnContainer(UserDict[KeyType, ValueType], Generic[KeyType, ValueType]):
-    """Container for announcements that can dump to YamlAble
+class _AnnContainerBase:
+    """Everything the AnnContainer implementations share
 
-    Inherits from UserDict so that it can easily be dumped to YAML
-    and also avoid the PyPy changes to the way it accesses dict values
-
-    Where PyPy differs for accessing dictionary subclasses:
-    https://doc.pypy.org/en/latest/cpython_differences.html#subclasses-of-built-in-types
-    UserDict source (notice how it's implemented get, which won't conflict with PyPy):
-    https://github.com/python/cpython/blob/main/Lib/collections/__init__.py#L1117
+    Subclasses of the AnnContainer (LocalRIB, RecvQueue, etc) are
+    registered here so that we can easily assign yaml tags
     """
 
-    subclasses: set["AnnContainer[Any, Any]"] = set()
+    __slots__ = ()
+
+    data: dict[Any, Any]
+
+    subclasses: set[type["_AnnContainerBase"]] = set()
 
     def __init_subclass__(cls, *args, **kwargs):
         """This method essentially creates a list of all subclasses
         This is allows us to easily assign yaml tags
+
+        The AnnContainer implementations in this file are not included,
+        and neither are containers that dump as another container
         """
 
         super().__init_subclass__(*args, **kwargs)
-        AnnContainer.subclasses.add(cls)  # type: ignore
+        if cls.__module__ != __name__ and cls.yaml_cls() is cls:
+            _AnnContainerBase.subclasses.add(cls)
+
+    def clear(self) -> None:
+        """Removes everything in place
+
+        UserDict's clear pops items one at a time, which is much slower
+        """
+
+        self.data.clear()
 
     def __str__(self) -> str:
         """Returns contents of the container as str"""
@@ -34,17 +58,171 @@ class AnnContainer(UserDict[KeyType, ValueType], Generic[KeyType, ValueType]):
         # https://stackoverflow.com/a/521545/8903959
         return pprint.pformat(self.data, indent=4)
 
+    @classmethod
+    def yaml_cls(cls) -> type["_AnnContainerBase"]:
+        """Class that this container dumps and loads as"""
+
+        return cls
+
     @classmethod
     def yaml_suffix(cls):
-        return cls.__name__
+        return cls.yaml_cls().__name__
 
     def __to_yaml_dict__(self) -> dict[Any, Any]:
         """This optional method is called when you call yaml.dump()"""
 
-        return self.data
+        return AnnContainerYamlAdapter.to_yaml_dict(self)
 
     @classmethod
-    def __from_yaml_dict__(cls, dct, yaml_tag) -> "AnnContainer[KeyType, ValueType]":
+    def __from_yaml_dict__(cls, dct, yaml_tag):
         """This optional method is called when you call yaml.load()"""
 
-        return cls(dct)
+        return AnnContainerYamlAdapter.from_yaml_dict(cls, dct)
+
+
+class DictAnnContainer(
+    _AnnContainerBase, MutableMapping[KeyType, ValueType], Generic[KeyType, ValueType]
+):
+    """Container for announcements that stores a dict directly
+
+    Has the same API as the UserDict, but every method goes straight to
+    the dict in the data slot, rather than through the MutableMapping
+    methods that UserDict inherits (for example, UserDict.get calls
+    __contains__ and then __getitem__). Used on CPython, where most of
+    the time spent propagating is spent in these lookups
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(
+        self, mapping: Optional[Mapping[KeyType, ValueType]] = None, /, **kwargs: Any
+    ) -> None:
+        self.data: dict[KeyType, ValueType] = {}
+        if mapping is not None:
+            self.data.update(mapping)
+        if kwargs:
+            self.data.update(kwargs)  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[KeyType]:
+        return iter(self.data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def __getitem__(self, key: KeyType) -> ValueType:
+        return self.data[key]
+
+    def __setitem__(self, key: KeyType, value: ValueType) -> None:
+        self.data[key] = value
+
+    def __delitem__(self, key: KeyType) -> None:
+        del self.data[key]
+
+    def get(self, key, default=None):  # type: ignore
+        return self.data.get(key, default)
+
+    def keys(self) -> KeysView[KeyType]:
+        return self.data.keys()
+
+    def items(self) -> ItemsView[KeyType, ValueType]:
+        return self.data.items()
+
+    def values(self) -> ValuesView[ValueType]:
+        return self.data.values()
+
+    def pop(self, *args):  # type: ignore
+        return self.data.pop(*args)
+
+    def popitem(self) -> tuple[KeyType, ValueType]:
+        """Pops the first item, like UserDict (not the last, like dict)"""
+
+        try:
+            key = next(iter(self.data))
+        except StopIteration:
+            raise KeyError("popitem(): container is empty") from None
+        return key, self.data.pop(key)
+
+    def setdefault(self, key, default=None):  # type: ignore
+        return self.data.setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore
+        self.data.update(*args, **kwargs)
+
+    def copy(self):  # type: ignore
+        """Shallow copy, just like UserDict.copy"""
+
+        return self.__class__(self.data)
+
+    def __copy__(self):  # type: ignore
+        return self.copy()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _AnnContainerBase):
+            return self.data == other.data
+        elif isinstance(other, Mapping):
+            return self.data == dict(other.items())
+        else:
+            return NotImplemented
+
+    # Mutable and compared by value, same as dict
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+
+class UserDictAnnContainer(
+    _AnnContainerBase, UserDict[KeyType, ValueType], Generic[KeyType, ValueType]
+):
+    """Container for announcements that inherits from UserDict
+
+    Used on PyPy (and other implementations), to avoid the PyPy changes
+    to the way it accesses dict values
+
+    Where PyPy differs for accessing dictionary subclasses:
+    https://doc.pypy.org/en/latest/cpython_differences.html#subclasses-of-built-in-types
+    UserDict source (notice how it's implemented get, which won't conflict with PyPy):
+    https://github.com/python/cpython/blob/main/Lib/collections/__init__.py#L1117
+    """
+
+    __slots__ = ()
+
+
+class AnnContainerYamlAdapter:
+    """Converts AnnContainers to and from the dicts in the YAML files
+
+    The containers only get dumped through this (and not, for example,
+    as a dict or UserDict), so that both implementations of the
+    AnnContainer dump and load the same way
+    """
+
+    @staticmethod
+    def get_yaml_cls(container: _AnnContainerBase) -> type[_AnnContainerBase]:
+        """Returns the class that the container dumps and loads as"""
+
+        return container.yaml_cls()
+
+    @staticmethod
+    def to_yaml_dict(container: _AnnContainerBase) -> dict[Any, Any]:
+        """Returns the dict to dump for the container"""
+
+        return container.data
+
+    @staticmethod
+    def from_yaml_dict(
+        Cls: type[ContainerType], dct: Mapping[Any, Any]
+    ) -> ContainerType:
+        """Returns a container of class Cls from a loaded dict"""
+
+        return Cls(dct)  # type: ignore
+
+
+# Chosen at import time, and every container subclasses this
+# mypy only ever sees the DictAnnContainer
+if TYPE_CHECKING or platform.python_implementation() == "CPython":
+    AnnContainer = DictAnnContainer
+else:
+    AnnContainer = UserDictAnnContainer  # type: ignore
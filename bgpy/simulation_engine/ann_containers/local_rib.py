@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from .ann_container import AnnContainer
 
@@ -10,7 +10,108 @@ if TYPE_CHECKING:
 class LocalRIB(AnnContainer[str, "Ann"]):
     """Local RIB for a BGP AS"""
 
+    __slots__ = ()
+
     def add_ann(self, ann: "Ann"):
         """Adds an announcement to local rib with prefix as key"""
 
         self.data[ann.prefix] = ann
+
+
+class OriginIndexedLocalRIB(LocalRIB):
+    """LocalRIB that is also indexed by the origin of each ann
+
+    {origin: {prefix: ann}}, so that source address validation can find
+    the route to a source (and the next hop of that route) without
+    searching the whole local RIB. The index is kept up to date by
+    every method that modifies the local RIB (but not by changes to
+    data itself). Dumps and loads as a LocalRIB
+    """
+
+    __slots__ = ("origin_index",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.origin_index: dict[int, dict[str, "Ann"]] = dict()
+        for prefix, ann in self.data.items():
+            self._index_origin(prefix, ann)
+
+    @classmethod
+    def yaml_cls(cls) -> type[LocalRIB]:
+        return LocalRIB
+
+    def get_origin_ann(self, origin_asn: int) -> Optional["Ann"]:
+        """Returns the ann from origin_asn that comes last in the local RIB
+
+        This is the same ann that searching every ann in the local RIB
+        (and keeping the last match) would find
+        """
+
+        prefix_anns = self.origin_index.get(origin_asn)
+        if not prefix_anns:
+            return None
+        elif len(prefix_anns) == 1:
+            return next(iter(prefix_anns.values()))
+        for prefix in reversed(self.data):
+            ann = prefix_anns.get(prefix)
+            if ann is not None:
+                return ann
+        raise AssertionError("Origin index is out of date")
+
+    def add_ann(self, ann: "Ann"):
+        """Adds an announcement to local rib with prefix as key"""
+
+        self[ann.prefix] = ann
+
+    def __setitem__(self, prefix: str, ann: "Ann") -> None:
+        old_ann = self.data.get(prefix)
+        if old_ann is not None:
+            self._unindex_origin(prefix, old_ann)
+        self.data[prefix] = ann
+        self._index_origin(prefix, ann)
+
+    def __delitem__(self, prefix: str) -> None:
+        self._unindex_origin(prefix, self.data.pop(prefix))
+
+    def pop(self, prefix, *args):  # type: ignore
+        if prefix in self.data:
+            ann = self.data.pop(prefix)
+            self._unindex_origin(prefix, ann)
+            return ann
+        else:
+            return self.data.pop(prefix, *args)
+
+    def popitem(self) -> tuple[str, "Ann"]:
+        """Pops the first item, like UserDict"""
+
+        for prefix in self.data:
+            return prefix, self.pop(prefix)
+        raise KeyError("popitem(): container is empty")
+
+    def setdefault(self, prefix, default=None):  # type: ignore
+        if prefix not in self.data:
+            self[prefix] = default
+        return self.data[prefix]
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore
+        for prefix, ann in dict(*args, **kwargs).items():
+            self[prefix] = ann
+
+    def clear(self) -> None:
+        """Removes everything in place"""
+
+        self.data.clear()
+        self.origin_index.clear()
+
+    def _index_origin(self, prefix: str, ann: "Ann") -> None:
+        prefix_anns = self.origin_index.get(ann.origin)
+        if prefix_anns is None:
+            self.origin_index[ann.origin] = {prefix: ann}
+        else:
+            prefix_anns[prefix] = ann
+
+    def _unindex_origin(self, prefix: str, ann: "Ann") -> None:
+        prefix_anns = self.origin_index[ann.origin]
+        del prefix_anns[prefix]
+        if not prefix_anns:
+            del self.origin_index[ann.origin]
@@ -10,6 +10,8 @@ class RecvQueue(AnnContainer[str, list["Ann"]]):
     {prefix: list_of_ann}
     """
 
+    __slots__ = ()
+
     def add_ann(self, ann: "Ann"):
         """Appends ann to the list of recieved ann for that prefix
 
@@ -32,3 +34,40 @@ class RecvQueue(AnnContainer[str, list["Ann"]]):
 
         # mypy can't handle this, just ignore
         return self.data.get(prefix, list())  # type: ignore
+
+
+class BestRecvQueue(RecvQueue):
+    """RecvQueue that only keeps the best ann it received for each prefix
+
+    The policy scores each ann as it's received (see
+    BGP._receive_best_ann), so instead of a list of every ann for each
+    prefix, this holds a list with only the ann with the best score.
+    Ties keep the ann that was received first, just like processing the
+    full list would. Dumps and loads as a RecvQueue
+    """
+
+    __slots__ = ("keys_by_prefix",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Score of the ann kept for each prefix
+        self.keys_by_prefix: dict[str, int] = dict()
+
+    @classmethod
+    def yaml_cls(cls) -> type[RecvQueue]:
+        return RecvQueue
+
+    def add_best_ann(self, ann: "Ann", key: int) -> None:
+        """Keeps the ann if its key beats the key of the ann for its prefix"""
+
+        prefix = ann.prefix
+        keys_by_prefix = self.keys_by_prefix
+        if key > keys_by_prefix.get(prefix, -1):
+            keys_by_prefix[prefix] = key
+            self.data[prefix] = [ann]
+
+    def clear(self) -> None:
+        """Removes everything in place"""
+
+        self.data.clear()
+        self.keys_by_prefix.clear()
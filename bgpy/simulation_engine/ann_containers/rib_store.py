@@ -0,0 +1,204 @@
+from typing import Any, Iterator, Optional, TYPE_CHECKING
+
+from .local_rib import LocalRIB
+
+if TYPE_CHECKING:
+    from bgpy.simulation_engine import Announcement as Ann
+
+
+class RIBStore:
+    """Local RIBs of every AS in an engine, stored as one column per prefix
+
+    Each prefix that is in use gets a prefix id, and the column for that
+    id holds the ann for every AS index (the index of the AS in
+    as_graph.ases), or None. So there is a single list per prefix,
+    rather than a dict per AS that usually holds only one or two anns.
+
+    Clearing the store fills the columns that are in use with None, and
+    the columns are kept (and reused by the next prefixes), so resetting
+    between scenarios doesn't reallocate anything
+    """
+
+    __slots__ = (
+        "num_ases",
+        "prefix_ids",
+        "prefixes",
+        "columns",
+        "local_ribs",
+        "_empty_column",
+    )
+
+    def __init__(self, num_ases: int) -> None:
+        self.num_ases: int = num_ases
+        # Prefixes in use, mapped to their prefix id
+        self.prefix_ids: dict[str, int] = dict()
+        # Prefixes in use, in order of their prefix id
+        self.prefixes: list[str] = list()
+        # Column for each prefix id (columns past len(prefixes) are unused)
+        self.columns: list[list[Optional["Ann"]]] = list()
+        # LocalRIBView for each AS index
+        self.local_ribs: tuple["LocalRIBView", ...] = tuple(
+            LocalRIBView(self, i) for i in range(num_ases)
+        )
+        self._empty_column: list[Optional["Ann"]] = [None] * num_ases
+
+    def get_column(self, prefix: str) -> Optional[list[Optional["Ann"]]]:
+        """Returns the ann at every AS index for a prefix, if it's in use"""
+
+        prefix_id = self.prefix_ids.get(prefix)
+        return None if prefix_id is None else self.columns[prefix_id]
+
+    def get_prefix_id(self, prefix: str) -> int:
+        """Returns the prefix id, adding the prefix if it's not in use"""
+
+        prefix_id = self.prefix_ids.get(prefix)
+        if prefix_id is None:
+            prefix_id = len(self.prefixes)
+            self.prefix_ids[prefix] = prefix_id
+            self.prefixes.append(prefix)
+            if prefix_id == len(self.columns):
+                self.columns.append(self._empty_column.copy())
+        return prefix_id
+
+    def clear(self) -> None:
+        """Removes every ann, keeping the columns for reuse"""
+
+        empty_column = self._empty_column
+        for column in self.columns[: len(self.prefixes)]:
+            column[:] = empty_column
+        self.prefix_ids.clear()
+        self.prefixes.clear()
+
+
+class LocalRIBView(LocalRIB):
+    """LocalRIB of a single AS, stored in a RIBStore
+
+    Has the same API as the LocalRIB, and dumps and loads as a LocalRIB.
+    data returns a new dict of the anns, so changes to it are not
+    stored. Use the methods of this class to modify the local RIB
+    """
+
+    __slots__ = ("_rib_store", "_as_index")
+
+    def __init__(self, rib_store: RIBStore, as_index: int) -> None:
+        self._rib_store: RIBStore = rib_store
+        self._as_index: int = as_index
+
+    @classmethod
+    def yaml_cls(cls) -> type[LocalRIB]:
+        return LocalRIB
+
+    @property  # type: ignore
+    def data(self) -> dict[str, "Ann"]:  # type: ignore
+        """Returns a new dict of prefix to ann for this AS"""
+
+        return dict(self.items())
+
+    def add_ann(self, ann: "Ann"):
+        """Adds an announcement to local rib with prefix as key"""
+
+        rib_store = self._rib_store
+        rib_store.columns[rib_store.get_prefix_id(ann.prefix)][self._as_index] = ann
+
+    def get(self, prefix, default=None):  # type: ignore
+        rib_store = self._rib_store
+        prefix_id = rib_store.prefix_ids.get(prefix)
+        if prefix_id is not None:
+            ann = rib_store.columns[prefix_id][self._as_index]
+            if ann is not None:
+                return ann
+        return default
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __contains__(self, prefix: object) -> bool:
+        return self.get(prefix) is not None
+
+    def __getitem__(self, prefix: str) -> "Ann":
+        ann = self.get(prefix)
+        if ann is None:
+            raise KeyError(prefix)
+        return ann  # type: ignore
+
+    def __setitem__(self, prefix: str, ann: "Ann") -> None:
+        rib_store = self._rib_store
+        rib_store.columns[rib_store.get_prefix_id(prefix)][self._as_index] = ann
+
+    def __delitem__(self, prefix: str) -> None:
+        column = self._rib_store.get_column(prefix)
+        if column is None or column[self._as_index] is None:
+            raise KeyError(prefix)
+        column[self._as_index] = None
+
+    def keys(self) -> list[str]:  # type: ignore
+        i = self._as_index
+        rib_store = self._rib_store
+        return [
+            prefix
+            for prefix, column in zip(rib_store.prefixes, rib_store.columns)
+            if column[i] is not None
+        ]
+
+    def values(self) -> list["Ann"]:  # type: ignore
+        i = self._as_index
+        rib_store = self._rib_store
+        return [
+            column[i]  # type: ignore
+            for column in rib_store.columns[: len(rib_store.prefixes)]
+            if column[i] is not None
+        ]
+
+    def items(self) -> list[tuple[str, "Ann"]]:  # type: ignore
+        i = self._as_index
+        rib_store = self._rib_store
+        return [
+            (prefix, column[i])  # type: ignore
+            for prefix, column in zip(rib_store.prefixes, rib_store.columns)
+            if column[i] is not None
+        ]
+
+    def pop(self, prefix, *args):  # type: ignore
+        ann = self.get(prefix)
+        if ann is None:
+            if args:
+                return args[0]
+            raise KeyError(prefix)
+        del self[prefix]
+        return ann
+
+    def popitem(self) -> tuple[str, "Ann"]:
+        """Pops the first item, like UserDict"""
+
+        for prefix in self.keys():
+            return prefix, self.pop(prefix)
+        raise KeyError("popitem(): container is empty")
+
+    def setdefault(self, prefix, default=None):  # type: ignore
+        ann = self.get(prefix)
+        if ann is None:
+            self[prefix] = default
+            ann = default
+        return ann
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for prefix, ann in dict(*args, **kwargs).items():
+            self[prefix] = ann
+
+    def clear(self) -> None:
+        """Removes every ann of this AS (RIBStore.clear removes all of them)"""
+
+        rib_store = self._rib_store
+        # Nothing to do for the policy resets that follow RIBStore.clear
+        if rib_store.prefixes:
+            i = self._as_index
+            for column in rib_store.columns[: len(rib_store.prefixes)]:
+                column[i] = None
+
+    def copy(self) -> LocalRIB:  # type: ignore
+        """Returns a LocalRIB (that isn't in the store) with the same anns"""
+
+        return LocalRIB(self.data)
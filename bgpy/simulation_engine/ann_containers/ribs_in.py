@@ -1,5 +1,7 @@
 import dataclasses
-from typing import Iterator, Optional, TYPE_CHECKING
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
 
 from yamlable import YamlAble, yaml_info
 
@@ -29,8 +31,45 @@ class RIBsIn(AnnContainer[int, dict[str, AnnInfo]]):
     """Incomming announcements for a BGP AS
 
     neighbor: {prefix: (announcement, relationship)}
+
+    Also indexed by prefix ({prefix: {neighbor: AnnInfo}}), so that the
+    AnnInfos for a prefix don't require a lookup for every neighbor.
+    Only modify this with add_unprocessed_ann and remove_entry, so
+    that the index stays up to date.
+
+    Policies can also choose the best AnnInfo for a prefix with
+    get_best_ann_info, which keeps a heap for every prefix it's called
+    with. Entries that were removed are only discarded once they reach
+    the top of the heap
+
+    Lastly, every origin ASN is mapped to the next hops that it was
+    received from ({origin: {next_hop_asn: number of anns}}), so that
+    feasible path SAV doesn't need to search the anns of every neighbor
     """
 
+    __slots__ = (
+        "prefix_index",
+        "origin_index",
+        "_heaps",
+        "_unkeyed",
+        "_heap_entry_ids",
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefix_index: dict[str, dict[int, AnnInfo]] = dict()
+        self.origin_index: dict[int, dict[int, int]] = dict()
+        for neighbor_asn, prefix_ann_infos in self.data.items():
+            for prefix, ann_info in prefix_ann_infos.items():
+                self.prefix_index.setdefault(prefix, dict())[neighbor_asn] = ann_info
+                self._index_origin(ann_info.unprocessed_ann)
+        # prefix: [(-key, entry id, neighbor_asn, AnnInfo)]
+        self._heaps: dict[str, list[tuple[int, int, int, AnnInfo]]] = dict()
+        # AnnInfos added to prefixes with heaps, that haven't been keyed yet
+        self._unkeyed: dict[str, list[tuple[int, AnnInfo]]] = dict()
+        # Breaks ties in the heaps, so that AnnInfos are never compared
+        self._heap_entry_ids: Iterator[int] = count()
+
     def get_unprocessed_ann_recv_rel(
         self, neighbor_asn: int, prefix: str
     ) -> Optional[AnnInfo]:
@@ -52,27 +91,118 @@ class RIBsIn(AnnContainer[int, dict[str, AnnInfo]]):
 
         # Shorten the var name
         ann = unprocessed_ann
-        if ann.as_path[0] not in self.data:
-            self.data[ann.as_path[0]] = {
-                ann.prefix: AnnInfo(
-                    unprocessed_ann=unprocessed_ann, recv_relationship=recv_relationship
-                )
-            }
+        neighbor_asn = ann.as_path[0]
+        prefix = ann.prefix
+        ann_info = AnnInfo(
+            unprocessed_ann=unprocessed_ann, recv_relationship=recv_relationship
+        )
+        neighbor_ann_infos = self.data.get(neighbor_asn)
+        if neighbor_ann_infos is None:
+            self.data[neighbor_asn] = {prefix: ann_info}
         else:
-            self.data[ann.as_path[0]][ann.prefix] = AnnInfo(
-                unprocessed_ann=unprocessed_ann, recv_relationship=recv_relationship
-            )
+            old_ann_info = neighbor_ann_infos.get(prefix)
+            if old_ann_info is not None:
+                self._unindex_origin(old_ann_info.unprocessed_ann)
+            neighbor_ann_infos[prefix] = ann_info
+        self._index_origin(ann)
+
+        prefix_ann_infos = self.prefix_index.get(prefix)
+        if prefix_ann_infos is None:
+            self.prefix_index[prefix] = {neighbor_asn: ann_info}
+        else:
+            prefix_ann_infos[neighbor_asn] = ann_info
+        # Keyed the next time that the best AnnInfo is needed
+        if prefix in self._heaps:
+            self._unkeyed[prefix].append((neighbor_asn, ann_info))
 
     def get_ann_infos(self, prefix: str) -> Iterator[AnnInfo]:
-        """Returns AnnInfos for a given prefix"""
+        """Returns AnnInfos for a given prefix
 
-        default_ann_info: AnnInfo = AnnInfo(
-            unprocessed_ann=None, recv_relationship=None
-        )
-        for prefix_ann_info in self.data.values():
-            yield prefix_ann_info.get(prefix, default_ann_info)
+        Only neighbors that sent an ann for the prefix have AnnInfos
+        """
+
+        prefix_ann_infos = self.prefix_index.get(prefix)
+        if prefix_ann_infos is not None:
+            yield from prefix_ann_infos.values()
+
+    def get_best_ann_info(
+        self, prefix: str, get_key: Callable[[AnnInfo], int]
+    ) -> Optional[AnnInfo]:
+        """Returns the AnnInfo for the prefix with the highest key
+
+        get_key must always return the same key for the same AnnInfo,
+        and never the same key for the AnnInfos of two neighbors (the
+        Gao Rexford key ends with the neighbor ASN, so it never does)
+        """
+
+        prefix_ann_infos = self.prefix_index.get(prefix)
+        if not prefix_ann_infos:
+            return None
+
+        heap = self._heaps.get(prefix)
+        # Rebuild the heap if most of it has been removed
+        if heap is None or len(heap) > 2 * len(prefix_ann_infos) + 8:
+            heap = [
+                (-get_key(ann_info), next(self._heap_entry_ids), asn, ann_info)
+                for asn, ann_info in prefix_ann_infos.items()
+            ]
+            heapify(heap)
+            self._heaps[prefix] = heap
+            self._unkeyed[prefix] = list()
+        else:
+            unkeyed = self._unkeyed[prefix]
+            for asn, ann_info in unkeyed:
+                entry_id = next(self._heap_entry_ids)
+                heappush(heap, (-get_key(ann_info), entry_id, asn, ann_info))
+            unkeyed.clear()
+
+        # Discard AnnInfos that were removed or replaced
+        while prefix_ann_infos.get(heap[0][2]) is not heap[0][3]:
+            heappop(heap)
+        return heap[0][3]
+
+    def has_origin_next_hop(self, origin_asn: int, next_hop_asn: int) -> bool:
+        """Returns True if any ann from origin_asn came from next_hop_asn"""
+
+        next_hop_counts = self.origin_index.get(origin_asn)
+        return next_hop_counts is not None and next_hop_asn in next_hop_counts
 
     def remove_entry(self, neighbor_asn: int, prefix: str):
         """Removes AnnInfo from RibsIn"""
 
-        del self.data[neighbor_asn][prefix]
+        ann_info = self.data[neighbor_asn].pop(prefix)
+        del self.prefix_index[prefix][neighbor_asn]
+        self._unindex_origin(ann_info.unprocessed_ann)
+
+    def _index_origin(self, ann: Optional["Ann"]) -> None:
+        """Counts the ann for its origin and next hop"""
+
+        if ann is not None:
+            next_hop_counts = self.origin_index.get(ann.origin)
+            if next_hop_counts is None:
+                self.origin_index[ann.origin] = {ann.next_hop_asn: 1}
+            else:
+                next_hop_counts[ann.next_hop_asn] = (
+                    next_hop_counts.get(ann.next_hop_asn, 0) + 1
+                )
+
+    def _unindex_origin(self, ann: Optional["Ann"]) -> None:
+        """Uncounts the ann for its origin and next hop"""
+
+        if ann is not None:
+            next_hop_counts = self.origin_index[ann.origin]
+            if next_hop_counts[ann.next_hop_asn] == 1:
+                del next_hop_counts[ann.next_hop_asn]
+                if not next_hop_counts:
+                    del self.origin_index[ann.origin]
+            else:
+                next_hop_counts[ann.next_hop_asn] -= 1
+
+    def clear(self) -> None:
+        """Removes everything in place"""
+
+        self.data.clear()
+        self.prefix_index.clear()
+        self.origin_index.clear()
+        self._heaps.clear()
+        self._unkeyed.clear()
@@ -9,8 +9,22 @@ class RIBsOut(AnnContainer[int, dict[str, Ann]]):
     """Incomming announcements for a BGP AS
 
     neighbor: {prefix: announcement}
+
+    Also indexed by prefix ({prefix: {neighbor: announcement}}), so that
+    a withdrawal only visits the neighbors that the prefix was sent to.
+    Only modify this with add_ann and remove_entry, so that the index
+    stays up to date
     """
 
+    __slots__ = ("prefix_index",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefix_index: dict[str, dict[int, Ann]] = dict()
+        for neighbor_asn, prefix_anns in self.data.items():
+            for prefix, ann in prefix_anns.items():
+                self.prefix_index.setdefault(prefix, dict())[neighbor_asn] = ann
+
     def get_ann(self, neighbor_asn: int, prefix: str) -> Optional[Ann]:
         """Returns Ann for a given neighbor asn and prefix"""
 
@@ -24,12 +38,34 @@ class RIBsOut(AnnContainer[int, dict[str, Ann]]):
         else:
             self.data[neighbor_asn] = {ann.prefix: ann}
 
+        prefix_anns = self.prefix_index.get(ann.prefix)
+        if prefix_anns is None:
+            self.prefix_index[ann.prefix] = {neighbor_asn: ann}
+        else:
+            prefix_anns[neighbor_asn] = ann
+
+    def get_sent_anns(self, prefix: str) -> list[tuple[int, Ann]]:
+        """Returns (neighbor_asn, ann) for every neighbor sent the prefix
+
+        Returns a new list, so entries can be removed while iterating
+        """
+
+        prefix_anns = self.prefix_index.get(prefix)
+        return list(prefix_anns.items()) if prefix_anns else []
+
     def remove_entry(self, neighbor_asn: int, prefix: str) -> None:
         """Removes ann from ribs out"""
 
         del self.data[neighbor_asn][prefix]
+        del self.prefix_index[prefix][neighbor_asn]
 
     def neighbors(self) -> Iterator[int]:
         """Return all neighbors from the ribs out"""
 
         return self.data.keys()  # type: ignore
+
+    def clear(self) -> None:
+        """Removes everything in place"""
+
+        self.data.clear()
+        self.prefix_index.clear()
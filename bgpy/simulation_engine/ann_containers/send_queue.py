@@ -29,18 +29,37 @@ class SendQueue(AnnContainer[int, dict[str, SendInfo]]):
     """Announcements to be sent for a BGP AS
 
     {neighbor: {prefix: SendInfo}}
+
+    Also indexed by prefix ({prefix: {neighbor: SendInfo}}), so that a
+    withdrawal only visits the neighbors with something queued for the
+    prefix. Only modify this with add_ann and pop, so that the index
+    stays up to date
     """
 
+    __slots__ = ("prefix_index",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prefix_index: dict[str, dict[int, SendInfo]] = dict()
+        for neighbor_asn, send_infos in self.data.items():
+            for prefix, send_info in send_infos.items():
+                self.prefix_index.setdefault(prefix, dict())[neighbor_asn] = send_info
+
     def add_ann(self, neighbor_asn: int, ann: Ann):
         """Adds Ann to be sent"""
 
         # Used to be done by the defaultdict
-        if neighbor_asn not in self.data:
-            self.data[neighbor_asn] = {ann.prefix: SendInfo()}
-        if ann.prefix not in self.data[neighbor_asn]:
-            self.data[neighbor_asn][ann.prefix] = SendInfo()
-
-        send_info = self.data[neighbor_asn][ann.prefix]
+        send_infos = self.data.get(neighbor_asn)
+        if send_infos is None:
+            send_infos = self.data[neighbor_asn] = dict()
+        send_info = send_infos.get(ann.prefix)
+        if send_info is None:
+            send_info = send_infos[ann.prefix] = SendInfo()
+            prefix_send_infos = self.prefix_index.get(ann.prefix)
+            if prefix_send_infos is None:
+                self.prefix_index[ann.prefix] = {neighbor_asn: send_info}
+            else:
+                prefix_send_infos[neighbor_asn] = send_info
 
         # If the announcement is a withdraw
         if ann.withdraw:
@@ -52,7 +71,8 @@ class SendQueue(AnnContainer[int, dict[str, SendInfo]]):
             if send_info.ann is not None and send_info.ann.prefix_path_attributes_eq(
                 ann
             ):
-                del self.data[neighbor_asn][ann.prefix]
+                del send_infos[ann.prefix]
+                del self.prefix_index[ann.prefix][neighbor_asn]
             # If withdrawl is not equal to Ann, add withdrawal
             else:
                 send_info.withdrawal_ann = ann
@@ -73,6 +93,13 @@ class SendQueue(AnnContainer[int, dict[str, SendInfo]]):
 
         return self.data.get(neighbor_obj.asn, dict()).get(prefix)
 
+    def get_send_infos(self, prefix: str) -> Iterator[SendInfo]:
+        """Returns the SendInfos queued for a prefix, for any neighbor"""
+
+        prefix_send_infos = self.prefix_index.get(prefix)
+        if prefix_send_infos is not None:
+            yield from prefix_send_infos.values()
+
     def info(self, neighbors: list["AS"]) -> Iterator[tuple["AS", str, Ann]]:
         """Returns neighbor obj, prefix, announcement"""
 
@@ -81,3 +108,19 @@ class SendQueue(AnnContainer[int, dict[str, SendInfo]]):
             for prefix, send_info in self.data.get(neighbor_obj.asn, dict()).items():
                 for ann in send_info.anns:
                     yield neighbor_obj, prefix, ann
+
+    def pop(self, neighbor_asn, *args):  # type: ignore
+        """Removes and returns the {prefix: SendInfo} for a neighbor"""
+
+        send_infos = self.data.pop(neighbor_asn, *args)
+        if send_infos:
+            prefix_index = self.prefix_index
+            for prefix in send_infos:
+                del prefix_index[prefix][neighbor_asn]
+        return send_infos
+
+    def clear(self) -> None:
+        """Removes everything in place"""
+
+        self.data.clear()
+        self.prefix_index.clear()
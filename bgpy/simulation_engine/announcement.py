@@ -1,9 +1,14 @@
-from dataclasses import dataclass, asdict, replace
+from dataclasses import dataclass, asdict, field, replace
 from typing import Any, Optional
 
 from yamlable import YamlAble, yaml_info
 
-from bgpy.enums import Relationships
+from bgpy.enums import Relationships, ROAValidity
+
+# Enum attribute lookups are slow, and ROV checks these for every ann
+_VALID = ROAValidity.VALID
+_UNKNOWN = ROAValidity.UNKNOWN
+_INVALID = ROAValidity.INVALID
 
 
 @yaml_info(yaml_tag="Announcement")
@@ -42,6 +47,10 @@ class Announcement(YamlAble):
     # ROV, ROV++ optional attributes
     roa_valid_length: Optional[bool] = None
     roa_origin: Optional[int] = None
+    # Computed once from the two attrs above when the scenario adds
+    # ROA info, so that ROV doesn't recompute it at every AS.
+    # None means it's computed on every access
+    roa_validity: Optional[ROAValidity] = field(default=None, compare=False)
     # BGPsec optional attributes
     # BGPsec next ASN that should receive the control plane announcement
     # NOTE: this is the opposite direction of next_hop, for the data plane
@@ -81,6 +90,10 @@ class Announcement(YamlAble):
         kwargs = {"seed_asn": None, "traceback_end": False}
         if overwrite_default_kwargs:
             kwargs.update(overwrite_default_kwargs)
+            if self.roa_validity is not None and roa_validity_changed(
+                self, overwrite_default_kwargs
+            ):
+                kwargs["roa_validity"] = None
 
         # Mypy says it gets this wrong
         # https://github.com/microsoft/pyright/issues/1047#issue-705124399
@@ -98,11 +111,10 @@ class Announcement(YamlAble):
         False means ann is either valid or unknown
         """
 
-        # Not covered by ROA, unknown
-        if self.roa_origin is None:
-            return False
-        else:
-            return self.origin != self.roa_origin or not self.roa_valid_length
+        roa_validity = self.roa_validity or get_roa_validity(
+            self.origin, self.roa_origin, self.roa_valid_length
+        )
+        return roa_validity is _INVALID
 
     @property
     def valid_by_roa(self) -> bool:
@@ -111,14 +123,19 @@ class Announcement(YamlAble):
         False means ann is either invalid or unknown
         """
 
-        # Need the bool here for mypy, ugh
-        return bool(self.origin == self.roa_origin and self.roa_valid_length)
+        roa_validity = self.roa_validity or get_roa_validity(
+            self.origin, self.roa_origin, self.roa_valid_length
+        )
+        return roa_validity is _VALID
 
     @property
     def unknown_by_roa(self) -> bool:
         """Returns True if ann is not covered by roa"""
 
-        return not self.invalid_by_roa and not self.valid_by_roa
+        roa_validity = self.roa_validity or get_roa_validity(
+            self.origin, self.roa_origin, self.roa_valid_length
+        )
+        return roa_validity is _UNKNOWN
 
     @property
     def covered_by_roa(self) -> bool:
@@ -146,9 +163,14 @@ class Announcement(YamlAble):
     ##############
 
     def __to_yaml_dict__(self) -> dict[str, Any]:
-        """This optional method is called when you call yaml.dump()"""
+        """This optional method is called when you call yaml.dump()
 
-        return asdict(self)
+        roa_validity is left out, since it's a cache of the ROA attrs
+        """
+
+        yaml_dict = asdict(self)
+        del yaml_dict["roa_validity"]
+        return yaml_dict
 
     @classmethod
     def __from_yaml_dict__(
@@ -157,3 +179,37 @@ class Announcement(YamlAble):
         """This optional method is called when you call yaml.load()"""
 
         return cls(**dct)
+
+
+def get_roa_validity(
+    origin: int, roa_origin: Optional[int], roa_valid_length: Optional[bool]
+) -> ROAValidity:
+    """Returns the ROA validity of an ann's origin
+
+    Unknown if not covered by a ROA. Invalid if the origin doesn't match
+    the ROA's origin, or the prefix is too specific
+    """
+
+    # Not covered by ROA, unknown
+    if roa_origin is None:
+        return _UNKNOWN
+    elif origin == roa_origin and roa_valid_length:
+        return _VALID
+    else:
+        return _INVALID
+
+
+def roa_validity_changed(ann: Any, overwrite_kwargs: dict[Any, Any]) -> bool:
+    """Returns True if a copy with these kwargs might change the ROA validity
+
+    Propagation only prepends to the AS path, which keeps the origin
+    """
+
+    if "roa_validity" in overwrite_kwargs:
+        return False
+    as_path = overwrite_kwargs.get("as_path")
+    return (
+        "roa_origin" in overwrite_kwargs
+        or "roa_valid_length" in overwrite_kwargs
+        or (as_path is not None and (not as_path or as_path[-1] != ann.origin))
+    )
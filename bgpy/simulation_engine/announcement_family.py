@@ -0,0 +1,358 @@
+from operator import itemgetter
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+from yamlable import YamlAble, yaml_info_decorate
+
+from bgpy.enums import Relationships
+
+from .announcement import _INVALID, _UNKNOWN, _VALID
+from .announcement import get_roa_validity, roa_validity_changed
+
+if TYPE_CHECKING:
+    from .policies import Policy
+
+
+# Default for required fields
+_REQUIRED: Any = object()
+
+
+class CoreAnnouncement(YamlAble, tuple):  # type: ignore
+    """Base class of the announcement family, use get_ann_cls for a class
+
+    Announcement carries every optional attribute of every policy, on
+    every copy. Classes in this family are tuples instead, with only the
+    core attributes below, plus the attributes of the mixins they are
+    created with (such as ROAAnnMixin for ROV). Since every attribute is
+    a position in the tuple, copy just copies the tuple and replaces the
+    attributes that changed, rather than calling dataclasses.replace.
+
+    Use ScenarioConfig(AnnCls=None) to pick the class from the policies
+    in the scenario automatically.
+    """
+
+    __slots__ = ()
+
+    # (name, default) for every field, in order. Set in get_ann_cls
+    _ann_fields: tuple[tuple[str, Any], ...] = (
+        ("prefix", _REQUIRED),
+        ("as_path", _REQUIRED),
+        # Equivalent to the next hop in a normal BGP announcement
+        ("next_hop_asn", None),
+        ("seed_asn", None),
+        ("recv_relationship", Relationships.ORIGIN),
+        # Set by the scenarios, see Announcement
+        ("timestamp", 0),
+        ("traceback_end", False),
+    )
+    _field_indexes: dict[str, int] = dict()
+    _defaults: tuple[Any, ...] = ()
+
+    def __new__(cls, **kwargs: Any) -> "CoreAnnouncement":
+        values = list(cls._defaults)
+        cls._set_values(values, kwargs)
+        for (name, _), value in zip(cls._ann_fields, values):
+            if value is _REQUIRED:
+                raise TypeError(f"{cls.__name__} missing required attr {name}")
+        return cls._from_values(values)
+
+    @classmethod
+    def _set_values(cls, values: list[Any], kwargs: dict[str, Any]) -> None:
+        """Sets the values of the kwargs by their field's index"""
+
+        field_indexes = cls._field_indexes
+        try:
+            for name, value in kwargs.items():
+                values[field_indexes[name]] = value
+        except KeyError as e:
+            raise TypeError(f"{cls.__name__} has no attr {e}") from None
+
+    @classmethod
+    def _from_values(cls, values: list[Any]) -> "CoreAnnouncement":
+        """Defaults seed_asn and next_hop_asn, then creates the tuple"""
+
+        as_path = values[1]
+        if values[3] is None and len(as_path) == 1:
+            values[3] = as_path[0]
+        if values[2] is None:
+            if len(as_path) == 1:
+                values[2] = as_path[0]
+            else:
+                raise ValueError("Must set next_hop_asn")
+        return tuple.__new__(cls, values)
+
+    def copy(
+        self, overwrite_default_kwargs: Optional[dict[Any, Any]] = None
+    ) -> "CoreAnnouncement":
+        """Creates a new ann with proper sim attrs"""
+
+        values = list(self)
+        # Replace seed asn and traceback end every time by default
+        values[3] = None
+        values[6] = False
+        if overwrite_default_kwargs:
+            self._set_values(values, overwrite_default_kwargs)
+        return self._from_values(values)
+
+    def prefix_path_attributes_eq(self, ann: Optional[Any]) -> bool:
+        """Checks prefix and as path equivalency"""
+
+        if ann is None:
+            return False
+        elif isinstance(ann, CoreAnnouncement):
+            return (ann.prefix, ann.as_path) == (self.prefix, self.as_path)
+        else:
+            raise NotImplementedError
+
+    @property
+    def origin(self) -> int:
+        """Returns the origin of the announcement"""
+
+        return self.as_path[-1]  # type: ignore
+
+    ######################
+    # Comparison funcs #
+    ######################
+
+    def __eq__(self, other: Any) -> bool:
+        """Anns of different classes are never equal, even as tuples"""
+
+        return other.__class__ is self.__class__ and tuple.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = tuple.__hash__
+
+    def __str__(self) -> str:
+        return f"{self.prefix} {self.as_path} {self.recv_relationship}"  # type: ignore
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{name}={value!r}" for name, value in self._asdict().items())
+        return f"{self.__class__.__name__}({attrs})"
+
+    ###########################
+    # Pickle and yaml funcs #
+    ###########################
+
+    def _asdict(self) -> dict[str, Any]:
+        return {name: value for (name, _), value in zip(self._ann_fields, self)}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_from_values, (self.__class__, tuple(self)))
+
+    def __to_yaml_dict__(self) -> dict[str, Any]:
+        """This optional method is called when you call yaml.dump()
+
+        roa_validity is left out, since it's a cache of the ROA attrs
+        """
+
+        yaml_dict = self._asdict()
+        yaml_dict.pop("roa_validity", None)
+        return yaml_dict
+
+    @classmethod
+    def __from_yaml_dict__(
+        cls, dct: dict[str, Any], yaml_tag: Any
+    ) -> "CoreAnnouncement":
+        """This optional method is called when you call yaml.load()"""
+
+        return cls(**dct)
+
+
+def _from_values(
+    AnnCls: type[CoreAnnouncement], values: tuple[Any, ...]
+) -> CoreAnnouncement:
+    """Unpickles an ann"""
+
+    return tuple.__new__(AnnCls, values)
+
+
+##########
+# Mixins #
+##########
+
+
+class ROAAnnMixin:
+    """ROA attributes, used by ROV and everything that subclasses it"""
+
+    __slots__ = ()
+    _ann_fields: tuple[tuple[str, Any], ...] = (
+        ("roa_valid_length", None),
+        ("roa_origin", None),
+        # See Announcement.roa_validity
+        ("roa_validity", None),
+    )
+
+    def copy(
+        self, overwrite_default_kwargs: Optional[dict[Any, Any]] = None
+    ) -> "CoreAnnouncement":
+        """Resets the ROA validity if the copy might change it"""
+
+        if (
+            overwrite_default_kwargs
+            and self.roa_validity is not None  # type: ignore
+            and roa_validity_changed(self, overwrite_default_kwargs)
+        ):
+            overwrite_default_kwargs = {
+                **overwrite_default_kwargs,
+                "roa_validity": None,
+            }
+        return super().copy(overwrite_default_kwargs)  # type: ignore
+
+    @property
+    def invalid_by_roa(self) -> bool:
+        """Returns True if Ann is invalid by ROA
+
+        False means ann is either valid or unknown
+        """
+
+        roa_validity = self.roa_validity or get_roa_validity(  # type: ignore
+            self.origin, self.roa_origin, self.roa_valid_length  # type: ignore
+        )
+        return roa_validity is _INVALID
+
+    @property
+    def valid_by_roa(self) -> bool:
+        """Returns True if Ann is valid by ROA
+
+        False means ann is either invalid or unknown
+        """
+
+        roa_validity = self.roa_validity or get_roa_validity(  # type: ignore
+            self.origin, self.roa_origin, self.roa_valid_length  # type: ignore
+        )
+        return roa_validity is _VALID
+
+    @property
+    def unknown_by_roa(self) -> bool:
+        """Returns True if ann is not covered by roa"""
+
+        roa_validity = self.roa_validity or get_roa_validity(  # type: ignore
+            self.origin, self.roa_origin, self.roa_valid_length  # type: ignore
+        )
+        return roa_validity is _UNKNOWN
+
+    @property
+    def covered_by_roa(self) -> bool:
+        """Returns if an announcement has a roa"""
+
+        return not self.unknown_by_roa
+
+    @property
+    def roa_routed(self) -> bool:
+        """Returns bool for if announcement is routed according to ROA"""
+
+        return self.roa_origin != 0  # type: ignore
+
+
+class BGPSecAnnMixin:
+    """BGPSec attributes"""
+
+    __slots__ = ()
+    _ann_fields: tuple[tuple[str, Any], ...] = (
+        # BGPsec next ASN that should receive the control plane announcement
+        ("bgpsec_next_asn", None),
+        ("bgpsec_as_path", ()),
+    )
+
+    def bgpsec_valid(self, asn: int) -> bool:
+        """Returns True if valid by BGPSec else False"""
+
+        return bool(
+            self.bgpsec_next_asn == asn  # type: ignore
+            and self.bgpsec_as_path == self.as_path  # type: ignore
+        )
+
+
+class OnlyToCustomersAnnMixin:
+    """RFC 9234 OTC attribute"""
+
+    __slots__ = ()
+    _ann_fields: tuple[tuple[str, Any], ...] = (("only_to_customers", None),)
+
+
+class WithdrawAnnMixin:
+    """Withdrawals, used by classes derived from BGPFull"""
+
+    __slots__ = ()
+    _ann_fields: tuple[tuple[str, Any], ...] = (("withdraw", False),)
+
+
+# Mixins are always combined in this order, so that the same set of mixins
+# always returns the same class
+ANN_MIXINS: tuple[type, ...] = (
+    ROAAnnMixin,
+    BGPSecAnnMixin,
+    OnlyToCustomersAnnMixin,
+    WithdrawAnnMixin,
+)
+
+# Sorted mixins to the class created for them
+_ann_classes: dict[tuple[type, ...], type[CoreAnnouncement]] = dict()
+
+
+def get_ann_cls(*mixins: type) -> type[CoreAnnouncement]:
+    """Returns the announcement class with the core attrs plus the mixins'
+
+    Classes are cached, and set as attributes of this module so that
+    they can be pickled
+    """
+
+    key = tuple(
+        sorted(
+            set(mixins),
+            key=lambda x: (
+                ANN_MIXINS.index(x) if x in ANN_MIXINS else len(ANN_MIXINS),
+                x.__name__,
+            ),
+        )
+    )
+    AnnCls = _ann_classes.get(key)
+    if AnnCls is None:
+        AnnCls = _create_ann_cls(key)
+        _ann_classes[key] = AnnCls
+        globals()[AnnCls.__name__] = AnnCls
+    return AnnCls
+
+
+def get_ann_cls_for_policies(
+    PolicyClasses: Iterable[type["Policy"]], *mixins: type
+) -> type[CoreAnnouncement]:
+    """Returns the announcement class with the attrs every policy needs
+
+    Policies list the mixins that they need in ann_mixins. Mixins of
+    every class in the MRO are included (so BGPSecFull gets both the
+    BGPSec and BGPFull mixins)
+    """
+
+    all_mixins: set[type] = set(mixins)
+    for PolicyCls in PolicyClasses:
+        for klass in PolicyCls.__mro__:
+            all_mixins.update(vars(klass).get("ann_mixins", ()))
+    return get_ann_cls(*all_mixins)
+
+
+def _create_ann_cls(mixins: tuple[type, ...]) -> type[CoreAnnouncement]:
+    """Creates the tuple class, with a property for every field"""
+
+    ann_fields = CoreAnnouncement._ann_fields + tuple(
+        x for mixin in mixins for x in mixin._ann_fields  # type: ignore
+    )
+    names = [name for name, _ in ann_fields]
+    assert len(set(names)) == len(names), f"Duplicate ann fields in {mixins}"
+
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": __name__,
+        "_ann_fields": ann_fields,
+        "_field_indexes": {name: i for i, name in enumerate(names)},
+        "_defaults": tuple(default for _, default in ann_fields),
+    }
+    for i, name in enumerate(names):
+        namespace[name] = property(itemgetter(i), doc=f"Alias for field {i}")
+
+    name = "".join(x.__name__.removesuffix("AnnMixin") for x in mixins)
+    AnnCls = type(f"{name}CoreAnnouncement", (*mixins, CoreAnnouncement), namespace)
+    # yamlable not up to date with mypy
+    yaml_info_decorate(AnnCls, yaml_tag=AnnCls.__name__)  # type: ignore
+    return AnnCls
@@ -0,0 +1,266 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .ann_containers import OriginIndexedLocalRIB
+from .ann_containers import RIBStore
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs import ASGraph
+    from .announcement import Announcement as Ann
+
+
+@dataclass(frozen=True, slots=True)
+class ForwardingTree:
+    """The route of every AS toward a destination, as next hop indexes
+
+    ASes are referred to by their index in as_graph.ases (like in the
+    PropagationSchedule). next_hops[i] is the index of the next hop of
+    the AS at index i, or -1 if the path ends there (it has no route,
+    or it originated the route).
+
+    Following the next hops forms a tree, rooted at the ASes where the
+    paths end. order holds the indexes of the ASes in topological order,
+    where every AS comes after its next hop, so the paths can be solved
+    for every AS in one pass. The ASes at depth d (hops to the end of
+    the path) are order[level_indptr[d]:level_indptr[d + 1]]. ASes that
+    forward into a loop never reach the end of a path, so they have a
+    depth of -1 and aren't in order.
+
+    Use SimulationEngine.get_forwarding_tree and
+    get_origin_forwarding_trees, which only build each tree once per run.
+    """
+
+    asns: NDArray[np.int64]
+    as_indexes: dict[int, int]
+    # The ann that each AS forwards with (None if it has no route)
+    routes: tuple[Optional["Ann"], ...]
+    next_hops: NDArray[np.int64]
+    depths: NDArray[np.int64]
+    order: NDArray[np.int64]
+    level_indptr: NDArray[np.int64]
+
+    @classmethod
+    def from_routes(
+        cls, as_graph: "ASGraph", routes: Sequence[Optional["Ann"]]
+    ) -> "ForwardingTree":
+        """Builds the tree from the route of every AS (in as_graph order)"""
+
+        asns = as_graph.propagation_schedule.asns
+        as_indexes = {asn: i for i, asn in enumerate(asns.tolist())}
+        assert len(routes) == len(asns), "Need a route for every AS"
+        next_hops = np.fromiter(
+            (
+                (
+                    -1
+                    if ann is None or ann.next_hop_asn == asn
+                    else as_indexes[ann.next_hop_asn]
+                )
+                for asn, ann in zip(asns.tolist(), routes)
+            ),
+            dtype=np.int64,
+            count=len(asns),
+        )
+
+        # Solve the depths one level at a time, from the ends of the paths
+        depths = np.full(len(asns), -1, dtype=np.int64)
+        levels: list[NDArray[np.int64]] = list()
+        # One extra slot, so that next hops of -1 are never in the level
+        in_level = np.zeros(len(asns) + 1, dtype=np.bool_)
+        level = np.flatnonzero(next_hops == -1)
+        while len(level):
+            depths[level] = len(levels)
+            levels.append(level)
+            in_level[:] = False
+            in_level[level] = True
+            level = np.flatnonzero(in_level[next_hops])
+        level_indptr = np.zeros(len(levels) + 1, dtype=np.int64)
+        level_indptr[1:] = np.cumsum([len(x) for x in levels])
+
+        return cls(
+            asns=asns,
+            as_indexes=as_indexes,
+            routes=tuple(routes),
+            next_hops=next_hops,
+            depths=depths,
+            order=(np.concatenate(levels) if levels else np.zeros(0, dtype=np.int64)),
+            level_indptr=level_indptr,
+        )
+
+    @classmethod
+    def from_prefixes(
+        cls,
+        as_graph: "ASGraph",
+        prefixes: Sequence[str],
+        rib_store: Optional[RIBStore] = None,
+    ) -> "ForwardingTree":
+        """Builds the tree of the most specific route of every AS
+
+        prefixes are ordered from most specific to least specific. With
+        a rib_store, this scans the column of each prefix in the store
+        rather than looking up every prefix in every local RIB
+        """
+
+        if rib_store is None:
+            routes: list[Optional["Ann"]] = list()
+            for as_obj in as_graph:
+                local_rib = as_obj.policy._local_rib
+                routes.append(
+                    next(
+                        (
+                            ann
+                            for ann in map(local_rib.get, prefixes)
+                            if ann is not None
+                        ),
+                        None,
+                    )
+                )
+            return cls.from_routes(as_graph, routes)
+
+        routes = [None] * rib_store.num_ases
+        # From least specific to most specific, so that more specific anns win
+        for prefix in reversed(prefixes):
+            column = rib_store.get_column(prefix)
+            if column is not None:
+                routes = [
+                    ann if ann is not None else less_specific_ann
+                    for ann, less_specific_ann in zip(column, routes)
+                ]
+        return cls.from_routes(as_graph, routes)
+
+    @classmethod
+    def from_origin(cls, as_graph: "ASGraph", origin_asn: int) -> "ForwardingTree":
+        """Builds the tree of every AS's route to an origin"""
+
+        return cls.from_origins(as_graph, (origin_asn,))[origin_asn]
+
+    @classmethod
+    def from_origins(
+        cls, as_graph: "ASGraph", origin_asns: Iterable[int]
+    ) -> dict[int, "ForwardingTree"]:
+        """Builds the tree of every AS's route to each origin
+
+        The route is the ann from the origin that comes last in the
+        local RIB, just like StrictuRPF (and OriginIndexedLocalRIB).
+        Every local RIB is only scanned once for all of the origins
+        """
+
+        origin_routes: dict[int, list[Optional["Ann"]]] = {
+            origin_asn: [None] * len(as_graph.ases) for origin_asn in origin_asns
+        }
+        for i, as_obj in enumerate(as_graph.ases):
+            local_rib = as_obj.policy._local_rib
+            if isinstance(local_rib, OriginIndexedLocalRIB):
+                for origin_asn, routes in origin_routes.items():
+                    routes[i] = local_rib.get_origin_ann(origin_asn)
+            else:
+                # Later anns from the same origin replace earlier ones
+                for ann in local_rib.data.values():
+                    routes = origin_routes.get(ann.origin)  # type: ignore
+                    if routes is not None:
+                        routes[i] = ann
+        return {
+            origin_asn: cls.from_routes(as_graph, routes)
+            for origin_asn, routes in origin_routes.items()
+        }
+
+    ###########
+    # Queries #
+    ###########
+
+    def get_mask(self, asns: Iterable[int]) -> NDArray[np.bool_]:
+        """Returns a mask over the AS indexes that's True for the asns"""
+
+        mask = np.zeros(len(self.asns), dtype=np.bool_)
+        mask[[self.as_indexes[asn] for asn in asns]] = True
+        return mask
+
+    def get_route(self, asn: int) -> Optional["Ann"]:
+        """Returns the ann that the AS forwards with"""
+
+        return self.routes[self.as_indexes[asn]]
+
+    def get_next_hop_asn(self, asn: int) -> Optional[int]:
+        """Returns the next hop of the AS, or None if the path ends there"""
+
+        next_hop = int(self.next_hops[self.as_indexes[asn]])
+        return None if next_hop == -1 else int(self.asns[next_hop])
+
+    def get_path(self, asn: int) -> tuple[int, ...]:
+        """Returns the ASNs on the path from the AS to where it ends
+
+        If the path runs into a loop, it stops before the first AS that
+        it would revisit
+        """
+
+        return tuple(self.asns[self._get_path_idxs(self.as_indexes[asn])].tolist())
+
+    def in_subtree(self, asn: int, root_asn: int) -> bool:
+        """Returns whether root_asn is on the path from the AS"""
+
+        idx = self.as_indexes[asn]
+        root_idx = self.as_indexes[root_asn]
+        depth = int(self.depths[idx])
+        root_depth = int(self.depths[root_idx])
+        if depth == -1 or root_depth == -1:
+            return root_idx in self._get_path_idxs(idx).tolist()
+        # Only the AS that's as far from the end as the root can be the root
+        for _ in range(depth - root_depth):
+            idx = int(self.next_hops[idx])
+        return idx == root_idx
+
+    def get_first_on_path(self, asn: int, mask: NDArray[np.bool_]) -> Optional[int]:
+        """Returns the first AS on the path from the AS that's in the mask
+
+        None if there isn't one
+        """
+
+        idxs = self._get_path_idxs(self.as_indexes[asn])
+        hits = np.flatnonzero(mask[idxs])
+        return int(self.asns[idxs[hits[0]]]) if len(hits) else None
+
+    def get_first_on_path_idxs(self, mask: NDArray[np.bool_]) -> NDArray[np.int64]:
+        """Returns the index of the first AS in the mask on every path
+
+        Element i is the index of the first AS in the mask on the path
+        from the AS at index i, or -1 if there isn't one. Solved one
+        level at a time in topological order, so every AS only looks at
+        its next hop
+        """
+
+        first_idxs = np.full(len(self.asns), -1, dtype=np.int64)
+        for start, end in zip(self.level_indptr[:-1], self.level_indptr[1:]):
+            level = self.order[start:end]
+            if start == 0:
+                first_idxs[level] = np.where(mask[level], level, -1)
+            else:
+                first_idxs[level] = np.where(
+                    mask[level], level, first_idxs[self.next_hops[level]]
+                )
+        # ASes that forward into a loop, one path at a time
+        for idx in np.flatnonzero(self.depths == -1).tolist():
+            path_idxs = self._get_path_idxs(idx)
+            hits = np.flatnonzero(mask[path_idxs])
+            if len(hits):
+                first_idxs[idx] = path_idxs[hits[0]]
+        return first_idxs
+
+    def _get_path_idxs(self, idx: int) -> NDArray[np.int64]:
+        """Returns the AS indexes on the path from the AS at idx"""
+
+        path_idxs = [idx]
+        depth = int(self.depths[idx])
+        if depth != -1:
+            for _ in range(depth):
+                idx = int(self.next_hops[idx])
+                path_idxs.append(idx)
+        else:
+            visited = {idx}
+            idx = int(self.next_hops[idx])
+            while idx not in visited:
+                visited.add(idx)
+                path_idxs.append(idx)
+                idx = int(self.next_hops[idx])
+        return np.array(path_idxs, dtype=np.int64)
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, ClassVar, Iterable, Iterator
+from weakref import WeakValueDictionary
+
+from yamlable import yaml_info
+
+from .lazy_path_announcement import LazyASPath
+from .lazy_path_announcement import LazyPathAnnouncement
+
+
+class InternedASPath(LazyASPath):
+    """LazyASPath that is hash-consed, so every distinct path exists once
+
+    Paths are interned by (prepended ASN, path id of the tail), starting
+    from a single empty path. So two InternedASPaths are equal if and only
+    if they are the same object, and comparing them (for example in
+    prefix_path_attributes_eq, which SendQueue.add_ann and the RIBs rely
+    on) is an identity check rather than a comparison of tuples. Since
+    the RIBsIn, RIBsOut and local RIB entries of every AS all point to
+    the same interned paths, BGPFull runs only store each path once.
+
+    Interned paths are held weakly, so paths are freed once no
+    announcement uses them.
+    """
+
+    __slots__ = ("path_id", "__weakref__")
+
+    # Unique per interned path, 0 for the empty path
+    path_id: int
+
+    # (path id of the tail << 32 | prepended ASN) to the interned path
+    _interned: ClassVar["WeakValueDictionary[int, InternedASPath]"] = (
+        WeakValueDictionary()
+    )
+    _path_ids: ClassVar[Iterator[int]] = count(1)
+    _empty: ClassVar["InternedASPath"]
+
+    def __new__(cls, as_path: Iterable[int] = ()) -> "InternedASPath":
+        """Returns the interned path, such as for seeded announcements"""
+
+        interned = cls._empty
+        for asn in reversed(tuple(as_path)):
+            interned = cls._prepend(asn, interned)
+        return interned
+
+    def __init__(self, as_path: Iterable[int] = ()) -> None:
+        """Everything is set in __new__ and _prepend"""
+
+        pass
+
+    @classmethod
+    def _prepend(cls, asn: int, tail: LazyASPath) -> "InternedASPath":
+        """Returns the interned path with the ASN prepended to the tail"""
+
+        if not isinstance(tail, InternedASPath):
+            tail = cls(tail)
+        key = tail.path_id << 32 | asn
+        as_path = cls._interned.get(key)
+        if as_path is None:
+            as_path = object.__new__(cls)
+            as_path._head = asn
+            as_path._tail = tail
+            as_path._len = tail._len + 1
+            as_path._origin = tail._origin if tail._len else asn
+            as_path._tuple = None
+            as_path.path_id = next(cls._path_ids)
+            cls._interned[key] = as_path
+        return as_path
+
+    ####################
+    # Comparison funcs #
+    ####################
+
+    def __eq__(self, other: Any) -> bool:
+        """Interned paths are only equal to themselves"""
+
+        if isinstance(other, InternedASPath):
+            return other is self
+        else:
+            return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        """Must hash the same as the equivalent tuple"""
+
+        return super().__hash__()
+
+
+def _create_empty_path() -> InternedASPath:
+    """Creates the path that every interned path ends with"""
+
+    as_path = object.__new__(InternedASPath)
+    as_path._head = None
+    as_path._tail = None
+    as_path._len = 0
+    as_path._origin = None
+    as_path._tuple = ()
+    as_path.path_id = 0
+    return as_path
+
+
+InternedASPath._empty = _create_empty_path()
+
+
+@yaml_info(yaml_tag="InternedPathAnnouncement")
+@dataclass(slots=True, frozen=True)
+class InternedPathAnnouncement(LazyPathAnnouncement):
+    """Announcement whose AS paths are InternedASPaths
+
+    Use this as the AnnCls of a ScenarioConfig in place of
+    LazyPathAnnouncement when running BGPFull (or other policies that
+    keep RIBsIn and RIBsOut), so that every copy of a path is shared
+    """
+
+    ASPathCls: ClassVar[type[LazyASPath]] = InternedASPath
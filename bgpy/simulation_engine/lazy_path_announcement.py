@@ -0,0 +1,197 @@
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Iterator, Optional, Union
+
+from yamlable import yaml_info
+
+from .announcement import Announcement
+
+
+class LazyASPath:
+    """AS path that only stores the prepended ASN and the upstream path
+
+    Prepending an ASN to a LazyASPath (ie (asn,) + ann.as_path, as is done
+    in BGP._copy_and_process) doesn't copy the path. Instead, the new
+    path points to the path of the upstream RIB entry it was created from,
+    so every AS that receives the prefix shares the tail of its AS path.
+    The length, first ASN, neighbor ASN, and origin are all O(1), and the
+    full tuple is only built (and then cached) when it is actually needed,
+    for example for slicing, hashing, or equality against another path.
+    """
+
+    __slots__ = ("_head", "_tail", "_len", "_origin", "_tuple")
+
+    def __init__(self, as_path: tuple[int, ...] = ()) -> None:
+        """Creates a path from a tuple, such as for seeded announcements"""
+
+        as_path = tuple(as_path)
+        self._head: Optional[int] = as_path[0] if as_path else None
+        self._tail: Optional[LazyASPath] = None
+        self._len: int = len(as_path)
+        self._origin: Optional[int] = as_path[-1] if as_path else None
+        self._tuple: Optional[tuple[int, ...]] = as_path
+
+    @classmethod
+    def _prepend(cls, asn: int, tail: "LazyASPath") -> "LazyASPath":
+        """Returns a new path with the ASN prepended to the tail"""
+
+        as_path = cls.__new__(cls)
+        as_path._head = asn
+        as_path._tail = tail
+        as_path._len = tail._len + 1
+        as_path._origin = tail._origin if tail._len else asn
+        as_path._tuple = None
+        return as_path
+
+    def to_tuple(self) -> tuple[int, ...]:
+        """Returns (and caches) the full AS path as a tuple"""
+
+        if self._tuple is None:
+            self._tuple = tuple(self)
+        return self._tuple
+
+    ##################
+    # Sequence funcs #
+    ##################
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        as_path: LazyASPath = self
+        while as_path._tuple is None:
+            yield as_path._head  # type: ignore
+            as_path = as_path._tail  # type: ignore
+        yield from as_path._tuple
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self.to_tuple())
+
+    def __contains__(self, asn: object) -> bool:
+        """Checks for the ASN without building the tuple (for loop checks)"""
+
+        as_path: LazyASPath = self
+        while as_path._tuple is None:
+            if as_path._head == asn:
+                return True
+            as_path = as_path._tail  # type: ignore
+        return asn in as_path._tuple
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Integer indexes walk the path, slices build the tuple"""
+
+        if isinstance(index, slice):
+            return self.to_tuple()[index]
+        elif index < 0:
+            if index == -1 and self._len:
+                return self._origin
+            index += self._len
+            if index < 0:
+                raise IndexError("AS path index out of range")
+        elif index >= self._len:
+            raise IndexError("AS path index out of range")
+
+        as_path: LazyASPath = self
+        while as_path._tuple is None:
+            if index == 0:
+                return as_path._head
+            index -= 1
+            as_path = as_path._tail  # type: ignore
+        return as_path._tuple[index]
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, (tuple, LazyASPath)):
+            return self.to_tuple() + tuple(other)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other: Any) -> Any:
+        """Prepends ASNs, such as (asn,) + ann.as_path"""
+
+        if isinstance(other, tuple):
+            as_path = self
+            for asn in reversed(other):
+                as_path = self._prepend(asn, as_path)
+            return as_path
+        else:
+            return NotImplemented
+
+    ####################
+    # Comparison funcs #
+    ####################
+
+    def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+        elif isinstance(other, LazyASPath):
+            return self._len == other._len and self.to_tuple() == other.to_tuple()
+        elif isinstance(other, tuple):
+            return self._len == len(other) and self.to_tuple() == other
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        """Must hash the same as the equivalent tuple"""
+
+        return hash(self.to_tuple())
+
+    def __repr__(self) -> str:
+        return repr(self.to_tuple())
+
+    ##################
+    # Pickling funcs #
+    ##################
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickles as a plain path, since the upstream RIB isn't pickled"""
+
+        return (self.__class__, (self.to_tuple(),))
+
+
+@yaml_info(yaml_tag="LazyPathAnnouncement")
+@dataclass(slots=True, frozen=True)
+class LazyPathAnnouncement(Announcement):
+    """Announcement whose AS paths are LazyASPaths
+
+    Every AS path attribute is stored as a LazyASPath, so each local RIB
+    entry only holds its own ASN plus a reference to the upstream path.
+    Use this as the AnnCls of a ScenarioConfig for large multi-prefix
+    scenarios where memory is the bottleneck.
+    """
+
+    # Class that AS paths are converted to
+    ASPathCls: ClassVar[type[LazyASPath]] = LazyASPath
+
+    def __post_init__(self):
+        """Converts AS paths to LazyASPaths"""
+
+        # Typed as tuples in the base class, so mypy needs Any here
+        as_path: Any = self.as_path
+        bgpsec_as_path: Any = self.bgpsec_as_path
+        ASPathCls = self.ASPathCls
+        if not isinstance(as_path, ASPathCls):
+            object.__setattr__(self, "as_path", ASPathCls(as_path))
+        if bgpsec_as_path and not isinstance(bgpsec_as_path, ASPathCls):
+            object.__setattr__(self, "bgpsec_as_path", ASPathCls(bgpsec_as_path))
+        # Mypy doesn't map superclasses properly with slots
+        super(LazyPathAnnouncement, self).__post_init__()  # type: ignore
+
+    ##############
+    # Yaml funcs #
+    ##############
+
+    def __to_yaml_dict__(self) -> dict[str, Any]:
+        """Dumps AS paths as tuples
+
+        asdict would deep copy the entire chain of upstream paths.
+        Like Announcement, roa_validity (a cache) is left out
+        """
+
+        dct = {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if field.name != "roa_validity"
+        }
+        for key, value in dct.items():
+            if isinstance(value, LazyASPath):
+                dct[key] = value.to_tuple()
+        return dct
@@ -8,21 +8,23 @@ from .propagate_funcs import propagate_to_peers
 from .propagate_funcs import _propagate
 from .propagate_funcs import _policy_propagate
 from .propagate_funcs import _process_outgoing_ann
+from .propagate_funcs import _get_shared_send_ann
 from .propagate_funcs import _prev_sent
 
 # Process incoming announcements
 from .process_incoming_funcs import seed_ann
 from .process_incoming_funcs import receive_ann
+from .process_incoming_funcs import _receive_best_ann
+from .process_incoming_funcs import _get_recv_relationship
 from .process_incoming_funcs import process_incoming_anns
 from .process_incoming_funcs import _valid_ann
 from .process_incoming_funcs import _copy_and_process
+from .process_incoming_funcs import _get_processed_kwargs
 from .process_incoming_funcs import _reset_q
 
 # Gao rexford functions
 from .gao_rexford import _get_best_ann_by_gao_rexford
-from .gao_rexford import _get_best_ann_by_local_pref
-from .gao_rexford import _get_best_ann_by_as_path
-from .gao_rexford import _get_best_ann_by_lowest_neighbor_asn_tiebreaker
+from .gao_rexford import _get_gao_rexford_key
 
 from bgpy.simulation_engine.policies.policy import Policy
 from bgpy.simulation_engine.ann_containers import LocalRIB
@@ -32,10 +34,13 @@ from bgpy.simulation_engine.policies.sav import BaseSAVPolicy
 
 if TYPE_CHECKING:
     from bgpy.as_graphs import AS
+    from bgpy.simulation_engine.announcement import Announcement as Ann
 
 
 class BGP(Policy):
     name: str = "BGP"
+    # (ann, kwargs, send_ann) from the last _get_shared_send_ann call
+    _shared_send_ann: Optional[tuple["Ann", dict[str, Any], "Ann"]] = None
 
     def __init__(
         self,
@@ -58,12 +63,37 @@ class BGP(Policy):
         self.as_: CallableProxyType["AS"] = as_  # type: ignore
         self.source_address_validation_policy = source_address_validation_policy
 
+    def reset(self) -> None:
+        """Clears the policy in place so that it can be reused"""
+
+        self._local_rib.clear()
+        self._recv_q.clear()
+        self._shared_send_ann = None
+        self.source_address_validation_policy = None
+
     def source_address_validation(self, as_obj, prev_hop, source) -> bool:
         if self.source_address_validation_policy is not None:
             return self.source_address_validation_policy.validate(self, as_obj, prev_hop, source)
         else:
             return True
 
+    @classmethod
+    def best_recv_q_supported(cls) -> bool:
+        """Returns whether this policy can use a BestRecvQueue
+
+        Only policies that receive and choose anns the same way as BGP
+        can drop anns on receipt. Policies that keep every ann, such as
+        BGPFull with its RIBsIn, can't
+        """
+
+        return (
+            cls.receive_ann is BGP.receive_ann
+            and cls.process_incoming_anns is BGP.process_incoming_anns
+            and cls._copy_and_process is BGP._copy_and_process
+            and cls._get_best_ann_by_gao_rexford is BGP._get_best_ann_by_gao_rexford
+            and cls._reset_q is BGP._reset_q
+        )
+
     # Propagation functionality
     propagate_to_providers = propagate_to_providers
     propagate_to_customers = propagate_to_customers
@@ -71,23 +101,23 @@ class BGP(Policy):
     _propagate = _propagate
     _policy_propagate = _policy_propagate
     _process_outgoing_ann = _process_outgoing_ann
+    _get_shared_send_ann = _get_shared_send_ann
     _prev_sent = _prev_sent
 
     # Process incoming announcements
     seed_ann = seed_ann
     receive_ann = receive_ann
+    _receive_best_ann = _receive_best_ann
+    _get_recv_relationship = _get_recv_relationship
     process_incoming_anns = process_incoming_anns
     _valid_ann = _valid_ann
     _copy_and_process = _copy_and_process
+    _get_processed_kwargs = _get_processed_kwargs
     _reset_q = _reset_q
 
     # Gao rexford functions
     _get_best_ann_by_gao_rexford = _get_best_ann_by_gao_rexford
-    _get_best_ann_by_local_pref = _get_best_ann_by_local_pref
-    _get_best_ann_by_as_path = _get_best_ann_by_as_path
-    _get_best_ann_by_lowest_neighbor_asn_tiebreaker = (
-        _get_best_ann_by_lowest_neighbor_asn_tiebreaker
-    )
+    _get_gao_rexford_key = _get_gao_rexford_key
 
     ##############
     # Yaml funcs #
@@ -1,9 +1,13 @@
 from typing import Any, Optional, TYPE_CHECKING
 
+from bgpy.enums import Relationships
+from bgpy.simulation_engine.ann_containers import BestRecvQueue
 from bgpy.simulation_engine.ann_containers import RecvQueue
+from bgpy.simulation_engine.wire_announcement import get_wire_ann_cls
+
+from .gao_rexford import _get_best_ann_by_gao_rexford
 
 if TYPE_CHECKING:
-    from bgpy.enums import Relationships
     from bgpy.simulation_framework import Scenario
     from bgpy.simulation_engine.announcement import Announcement as Ann
     from .bgp import BGP
@@ -28,7 +32,51 @@ def receive_ann(self: "BGP", ann: "Ann", accept_withdrawals: bool = False) -> No
 
     if getattr(ann, "withdraw", False) and not accept_withdrawals:
         raise NotImplementedError(f"Policy can't handle withdrawals {self.name}")
-    self._recv_q.add_ann(ann)
+    if isinstance(self._recv_q, BestRecvQueue):
+        self._receive_best_ann(ann)
+    else:
+        self._recv_q.add_ann(ann)
+    # Mark this AS so that the engine knows to process it
+    recv_worklist = self.recv_worklist
+    if recv_worklist is not None:
+        as_obj = self.as_
+        recv_worklist[as_obj.propagation_rank][as_obj.asn] = as_obj  # type: ignore
+
+
+def _receive_best_ann(self: "BGP", ann: "Ann") -> None:
+    """Drops the ann unless it beats the best ann received for its prefix
+
+    Validates and scores the ann exactly like process_incoming_anns,
+    so the ann that's kept is the one process_incoming_anns would choose
+    from the full list. Every ann received in a propagation phase is from
+    the same relationship, so the relationship is the one with the
+    neighbor that sent the ann (the ann's next hop)
+    """
+
+    recv_relationship = self._get_recv_relationship(ann)
+    if self._valid_ann(ann, recv_relationship):
+        WireAnnCls = get_wire_ann_cls(ann.__class__)
+        processed_ann = WireAnnCls(
+            ann, self._get_processed_kwargs(ann, recv_relationship)
+        )
+        self._recv_q.add_best_ann(  # type: ignore
+            ann, self._get_gao_rexford_key(processed_ann)  # type: ignore
+        )
+
+
+def _get_recv_relationship(self: "BGP", ann: "Ann") -> "Relationships":
+    """Returns the relationship with the neighbor that sent the ann"""
+
+    as_obj = self.as_
+    next_hop_asn = ann.next_hop_asn
+    if next_hop_asn in as_obj.customer_asns:
+        return Relationships.CUSTOMERS
+    elif next_hop_asn in as_obj.peer_asns:
+        return Relationships.PEERS
+    elif next_hop_asn in as_obj.provider_asns:
+        return Relationships.PROVIDERS
+    else:
+        raise ValueError(f"{as_obj.asn} received {ann} from a non neighbor")
 
 
 def process_incoming_anns(
@@ -41,6 +89,24 @@ def process_incoming_anns(
 ) -> None:
     """Process all announcements that were incoming from a specific rel"""
 
+    # Unless a subclass changes how anns are copied, compare wire anns
+    # (views with the processed attrs) and only copy the best one
+    use_wire_anns = self.__class__._copy_and_process is _copy_and_process
+    # Unless a subclass changes how the best ann is chosen, score each ann
+    # once and compare the scores (see _get_gao_rexford_key)
+    use_keys = (
+        self.__class__._get_best_ann_by_gao_rexford is _get_best_ann_by_gao_rexford
+    )
+    get_key = self._get_gao_rexford_key
+    # A BestRecvQueue (only given to policies that choose anns like BGP)
+    # holds one ann per prefix that _receive_best_ann already validated
+    # and scored, so its key is reused rather than scoring the ann again
+    best_keys: Optional[dict[str, int]] = (
+        self._recv_q.keys_by_prefix
+        if isinstance(self._recv_q, BestRecvQueue) and use_keys and use_wire_anns
+        else None
+    )
+
     # For each prefix, get all anns recieved
     for prefix, ann_list in self._recv_q.items():
         # Get announcement currently in local rib
@@ -50,20 +116,48 @@ def process_incoming_anns(
         # Seeded Ann will never be overriden, so continue
         if getattr(current_ann, "seed_asn", None) is not None:
             continue
-        # For each announcement that was incoming
-        for new_ann in ann_list:
-            # Make sure there are no loops
-            # In ROV subclass also check roa validity
-            if self._valid_ann(new_ann, from_rel):
-                new_ann_processed = self._copy_and_process(new_ann, from_rel)
-
-                current_ann = self._get_best_ann_by_gao_rexford(
-                    current_ann, new_ann_processed
+        current_key = (
+            -1 if current_ann is None or not use_keys else get_key(current_ann)
+        )
+        if best_keys is not None:
+            # Ties keep the current ann
+            if best_keys[prefix] > current_key:
+                new_ann = ann_list[0]
+                WireAnnCls = get_wire_ann_cls(new_ann.__class__)
+                current_ann = WireAnnCls(  # type: ignore
+                    new_ann, self._get_processed_kwargs(new_ann, from_rel)
                 )
+        else:
+            # For each announcement that was incoming
+            for new_ann in ann_list:
+                # Make sure there are no loops
+                # In ROV subclass also check roa validity
+                if self._valid_ann(new_ann, from_rel):
+                    if use_wire_anns:
+                        WireAnnCls = get_wire_ann_cls(new_ann.__class__)
+                        new_ann_processed = WireAnnCls(
+                            new_ann, self._get_processed_kwargs(new_ann, from_rel)
+                        )
+                    else:
+                        new_ann_processed = self._copy_and_process(new_ann, from_rel)
+
+                    if use_keys:
+                        # Ties keep the current ann
+                        new_key = get_key(new_ann_processed)  # type: ignore
+                        if new_key > current_key:
+                            current_ann = new_ann_processed  # type: ignore
+                            current_key = new_key
+                    else:
+                        current_ann = self._get_best_ann_by_gao_rexford(
+                            current_ann, new_ann_processed  # type: ignore
+                        )
 
         # This is a new best ann. Process it and add it to the local rib
         if og_ann != current_ann:
             assert current_ann, "mypy type check"
+            if use_wire_anns:
+                # Only the best ann is ever copied
+                current_ann = current_ann.copy()
             # Save to local rib
             self._local_rib.add_ann(current_ann)
 
@@ -92,10 +186,7 @@ def _copy_and_process(
     Prepends AS to AS Path and sets recv_relationship
     """
 
-    kwargs: dict[str, Any] = {
-        "as_path": (self.as_.asn,) + ann.as_path,
-        "recv_relationship": recv_relationship,
-    }
+    kwargs = self._get_processed_kwargs(ann, recv_relationship)
 
     if overwrite_default_kwargs:
         kwargs.update(overwrite_default_kwargs)
@@ -103,8 +194,27 @@ def _copy_and_process(
     return ann.copy(overwrite_default_kwargs=kwargs)
 
 
+def _get_processed_kwargs(
+    self: "BGP", ann: "Ann", recv_relationship: "Relationships"
+) -> dict[str, Any]:
+    """Returns the attrs that change when this AS processes the ann
+
+    Override this (rather than _copy_and_process) to change more attrs,
+    so that process_incoming_anns can still compare wire anns
+    """
+
+    return {
+        "as_path": (self.as_.asn,) + ann.as_path,
+        "recv_relationship": recv_relationship,
+    }
+
+
 def _reset_q(self: "BGP", reset_q: bool) -> None:
     """Resets the recieve q"""
 
     if reset_q:
-        self._recv_q = RecvQueue()
+        if isinstance(self._recv_q, BestRecvQueue):
+            # Only ever holds one ann per prefix, so there's no need to realloc
+            self._recv_q.clear()
+        else:
+            self._recv_q = RecvQueue()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 from bgpy.enums import Relationships
 
@@ -103,6 +103,27 @@ def _policy_propagate(
     return False
 
 
+def _get_shared_send_ann(self: "BGP", ann: "Ann", kwargs: dict[str, Any]) -> "Ann":
+    """Returns ann.copy(kwargs), shared across neighbors
+
+    Policies that change an ann in _policy_propagate often make the same
+    change for every neighbor. Since anns are immutable, the copy from
+    the last neighbor is reused when the ann and kwargs are the same
+    """
+
+    shared_send_ann = self._shared_send_ann
+    if (
+        shared_send_ann is not None
+        and shared_send_ann[0] is ann
+        and shared_send_ann[1] == kwargs
+    ):
+        return shared_send_ann[2]
+    else:
+        send_ann = ann.copy(kwargs)
+        self._shared_send_ann = (ann, kwargs, send_ann)
+        return send_ann
+
+
 def _prev_sent(self: "BGP", neighbor: "AS", ann: "Ann") -> bool:
     """Don't resend anything for BGPAS. For this class it doesn't matter"""
     return False
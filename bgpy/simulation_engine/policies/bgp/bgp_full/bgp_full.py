@@ -10,7 +10,9 @@ from .process_incoming_funcs import _new_ann_better
 from .process_incoming_funcs import _process_incoming_withdrawal
 from .process_incoming_funcs import _withdraw_ann_from_neighbors
 from .process_incoming_funcs import _select_best_ribs_in
+from .process_incoming_funcs import _get_ribs_in_key
 
+from bgpy.simulation_engine.announcement_family import WithdrawAnnMixin
 from bgpy.simulation_engine.policies.bgp import BGP
 
 from bgpy.simulation_engine.ann_containers import RIBsIn
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 
 class BGPFull(BGP):
     name = "BGP Full"
+    ann_mixins: tuple[type, ...] = (WithdrawAnnMixin,)
 
     def __init__(
         self,
@@ -39,6 +42,14 @@ class BGPFull(BGP):
         self._ribs_out: RIBsOut = _ribs_out if _ribs_out else RIBsOut()
         self._send_q: SendQueue = _send_q if _send_q else SendQueue()
 
+    def reset(self) -> None:
+        """Clears the policy in place so that it can be reused"""
+
+        super(BGPFull, self).reset()
+        self._ribs_in.clear()
+        self._ribs_out.clear()
+        self._send_q.clear()
+
     # Propagation functions
     _propagate = _propagate
     _process_outgoing_ann = _process_outgoing_ann
@@ -61,6 +72,7 @@ class BGPFull(BGP):
     _process_incoming_withdrawal = _process_incoming_withdrawal
     _withdraw_ann_from_neighbors = _withdraw_ann_from_neighbors
     _select_best_ribs_in = _select_best_ribs_in
+    _get_ribs_in_key = _get_ribs_in_key
 
     # Must be here since it referes to BGPFull
     # Could just use super but want to avoid the additional func calls
@@ -1,7 +1,14 @@
 from typing import Optional, TYPE_CHECKING
 
 
-from bgpy.simulation_engine.ann_containers import AnnInfo, SendInfo
+from bgpy.simulation_engine.ann_containers import AnnInfo
+from bgpy.simulation_engine.policies.bgp.bgp.gao_rexford import (
+    _get_best_ann_by_gao_rexford,
+)
+from bgpy.simulation_engine.policies.bgp.bgp.process_incoming_funcs import (
+    _copy_and_process,
+)
+from bgpy.simulation_engine.wire_announcement import get_wire_ann_cls
 
 
 if TYPE_CHECKING:
@@ -230,11 +237,12 @@ def _withdraw_ann_from_neighbors(self: "BGPFull", withdraw_ann: "Ann"):
     """
     assert withdraw_ann.withdraw is True
     # Check ribs_out to see where the withdrawn ann was sent
-    for send_neighbor in self._ribs_out.neighbors():
+    # (only the neighbors that were sent this prefix)
+    for send_neighbor, ribs_out_ann in self._ribs_out.get_sent_anns(
+        withdraw_ann.prefix
+    ):
         # If the two announcements are equal
-        if withdraw_ann.prefix_path_attributes_eq(
-            self._ribs_out.get_ann(send_neighbor, withdraw_ann.prefix)
-        ):
+        if withdraw_ann.prefix_path_attributes_eq(ribs_out_ann):
             # Delete ann from ribs out
             self._ribs_out.remove_entry(send_neighbor, withdraw_ann.prefix)
             self._send_q.add_ann(send_neighbor, withdraw_ann)
@@ -242,11 +250,8 @@ def _withdraw_ann_from_neighbors(self: "BGPFull", withdraw_ann: "Ann"):
     # We may not have sent the ann yet, it may just be in the send queue
     # and not ribs out
     # We want to cancel out any anns in the send_queue that match the wdraw
-    for neighbor_obj in self.as_.neighbors:
-        send_info: Optional[SendInfo] = self._send_q.get_send_info(
-            neighbor_obj, withdraw_ann.prefix
-        )
-        if send_info is None or send_info.ann is None:
+    for send_info in self._send_q.get_send_infos(withdraw_ann.prefix):
+        if send_info.ann is None:
             continue
         elif send_info.ann.prefix_path_attributes_eq(withdraw_ann):
             send_info.ann = None
@@ -255,8 +260,27 @@ def _withdraw_ann_from_neighbors(self: "BGPFull", withdraw_ann: "Ann"):
 def _select_best_ribs_in(self: "BGPFull", prefix: str) -> Optional["Ann"]:
     """Selects best ann from ribs in
 
+    Unless a subclass changes how anns are copied or compared, the ribs
+    in keeps a heap of the AnnInfos for the prefix by their Gao Rexford
+    keys, so that this doesn't compare the ann from every neighbor
+
     Remember, ribs in anns are NOT deep copied"""
 
+    cls = self.__class__
+    if (
+        cls._new_ann_better is _new_ann_better
+        and cls._copy_and_process is _copy_and_process
+        and cls._get_best_ann_by_gao_rexford is _get_best_ann_by_gao_rexford
+    ):
+        ann_info = self._ribs_in.get_best_ann_info(prefix, self._get_ribs_in_key)
+        if ann_info is None:
+            return None
+        # mypy having trouble dealing with this
+        return self._copy_and_process(
+            ann_info.unprocessed_ann,  # type: ignore
+            ann_info.recv_relationship,  # type: ignore
+        )
+
     # Get the best announcement
     best_unprocessed_ann: Optional["Ann"] = None
     best_recv_relationship: Optional["Relationships"] = None
@@ -282,3 +306,17 @@ def _select_best_ribs_in(self: "BGPFull", prefix: str) -> Optional["Ann"]:
         )
     else:
         return None
+
+
+def _get_ribs_in_key(self: "BGPFull", ann_info: AnnInfo) -> int:
+    """Returns the Gao Rexford key of a ribs in ann, once it's processed"""
+
+    ann = ann_info.unprocessed_ann
+    assert ann is not None, "mypy type check"
+    WireAnnCls = get_wire_ann_cls(ann.__class__)
+    return self._get_gao_rexford_key(
+        WireAnnCls(  # type: ignore
+            ann,
+            self._get_processed_kwargs(ann, ann_info.recv_relationship),  # type: ignore
+        )
+    )
@@ -46,11 +46,18 @@ def _send_anns(self, propagate_to: "Relationships"):
 
     neighbors: list[AS] = getattr(self.as_, propagate_to.name.lower())
 
-    for neighbor, prefix, ann in self._send_q.info(neighbors):
-        neighbor.policy.receive_ann(ann)
-        # Update Ribs out if it's not a withdraw
-        if not ann.withdraw:
-            self._ribs_out.add_ann(neighbor.asn, ann)
+    send_q = self._send_q
+    ribs_out = self._ribs_out
     for neighbor in neighbors:
         # Resets neighbor, removing all their SendInfo
-        self._send_q.pop(neighbor.asn, None)
+        send_infos = send_q.pop(neighbor.asn, None)
+        if not send_infos:
+            continue
+        receive_ann = neighbor.policy.receive_ann
+        for send_info in send_infos.values():
+            if send_info.withdrawal_ann is not None:
+                receive_ann(send_info.withdrawal_ann)
+            # Update Ribs out if it's not a withdraw
+            if send_info.ann is not None:
+                receive_ann(send_info.ann)
+                ribs_out.add_ann(neighbor.asn, send_info.ann)
@@ -1,6 +1,10 @@
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
+from bgpy.simulation_engine.announcement_family import BGPSecAnnMixin
 from bgpy.simulation_engine.policies.bgp import BGP
+from bgpy.simulation_engine.policies.bgp.bgp.gao_rexford import (
+    BEFORE_NEIGHBOR_ASN_SHIFT,
+)
 
 if TYPE_CHECKING:
     from bgpy.as_graphs import AS
@@ -19,6 +23,7 @@ class BGPSec(BGP):
     """
 
     name = "BGPSec"
+    ann_mixins: tuple[type, ...] = (BGPSecAnnMixin,)
 
     def seed_ann(self, ann: "Ann") -> None:  # type: ignore
         """Seeds announcement at this AS and initializes BGPSec path"""
@@ -43,17 +48,16 @@ class BGPSec(BGP):
         else:
             next_asn = None
             path = ()
-        send_ann = ann.copy({"bgpsec_next_asn": next_asn, "bgpsec_as_path": path})
+        send_ann = self._get_shared_send_ann(
+            ann, {"bgpsec_next_asn": next_asn, "bgpsec_as_path": path}
+        )
         self._process_outgoing_ann(neighbor, send_ann, *args, **kwargs)
         return True
 
     # Mypy doesn't understand the superclass
-    def _copy_and_process(  # type: ignore
-        self,
-        ann: "Ann",
-        recv_relationship: "Relationships",
-        overwrite_default_kwargs: Optional[dict[Any, Any]] = None,
-    ) -> "Ann":
+    def _get_processed_kwargs(  # type: ignore
+        self, ann: "Ann", recv_relationship: "Relationships"
+    ) -> dict[str, Any]:
         """Sets the bgpsec_as_path.
 
         prepends ASN if valid, otherwise clears
@@ -63,64 +67,16 @@ class BGPSec(BGP):
         else:
             bgpsec_as_path = ()
 
-        if overwrite_default_kwargs is None:
-            overwrite_default_kwargs = {}
-
-        overwrite_default_kwargs["bgpsec_as_path"] = overwrite_default_kwargs.get(
-            "bgpsec_as_path", bgpsec_as_path
-        )
-
-        return super()._copy_and_process(
-            ann, recv_relationship, overwrite_default_kwargs
-        )
-
-    def _get_best_ann_by_bgpsec(
-        self, current_ann: "Ann", new_ann: "Ann"
-    ) -> Optional["Ann"]:
-        current_valid = current_ann.bgpsec_valid(self.as_.asn)
-        new_valid = new_ann.bgpsec_valid(self.as_.asn)
-
-        if current_valid and not new_valid:
-            return current_ann
-        elif not current_valid and new_valid:
-            return new_ann
-        else:
-            return None
+        kwargs = super()._get_processed_kwargs(ann, recv_relationship)
+        kwargs["bgpsec_as_path"] = bgpsec_as_path
+        return kwargs
 
-    def _get_best_ann_by_gao_rexford(  # type: ignore
-        self,
-        current_ann: Optional["Ann"],
-        new_ann: "Ann",
-    ) -> "Ann":
-        """Determines if the new ann > current ann by Gao Rexford"""
+    def _get_gao_rexford_key(self, ann: "Ann") -> int:  # type: ignore
+        """Adds BGPSec validity to the key
 
-        assert new_ann is not None, "New announcement can't be None"
+        Security third: after local pref and AS path length, but before
+        the neighbor ASN tiebreaker
+        """
 
-        if current_ann is None:
-            return new_ann
-        else:
-            # Inspiration for this func refactor came from bgpsecsim
-            # for func in self._gao_rexford_funcs:
-            #     best_ann = func(current_ann, new_ann)
-            #     if best_ann is not None:
-            #         assert isinstance(best_ann, Ann), "mypy type check"
-            #         return best_ann
-
-            # Having this dynamic like above is literally 7x slower, resulting
-            # in bottlenecks. Gotta do it the ugly way unfortunately
-            ann = self._get_best_ann_by_local_pref(current_ann, new_ann)
-            if ann:
-                return ann
-            else:
-                ann = self._get_best_ann_by_as_path(current_ann, new_ann)
-                if ann:
-                    return ann
-                else:
-                    ann = self._get_best_ann_by_bgpsec(current_ann, new_ann)
-                    if ann:
-                        return ann
-                    else:
-                        return self._get_best_ann_by_lowest_neighbor_asn_tiebreaker(
-                            current_ann, new_ann
-                        )
-            raise Exception("No ann was chosen")
+        valid = ann.bgpsec_valid(self.as_.asn)
+        return super()._get_gao_rexford_key(ann) | (valid << BEFORE_NEIGHBOR_ASN_SHIFT)
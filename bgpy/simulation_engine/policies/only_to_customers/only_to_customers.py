@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from bgpy.enums import Relationships
+from bgpy.simulation_engine.announcement_family import OnlyToCustomersAnnMixin
 from bgpy.simulation_engine.policies.bgp import BGP
 
 if TYPE_CHECKING:
@@ -12,6 +13,7 @@ class OnlyToCustomers(BGP):
     """An Policy that deploys OnlyToCustomers"""
 
     name: str = "OnlyToCustomers"
+    ann_mixins: tuple[type, ...] = (OnlyToCustomersAnnMixin,)
 
     def _valid_ann(self, ann: "Ann", from_rel: Relationships) -> bool:  # type: ignore
         """Returns False if from peer/customer when only_to_customers is set"""
@@ -40,7 +42,7 @@ class OnlyToCustomers(BGP):
             propagate_to.value == Relationships.CUSTOMERS.value
             or propagate_to.value == Relationships.PEERS.value
         ):
-            ann = ann.copy({"only_to_customers": self.as_.asn})
+            ann = self._get_shared_send_ann(ann, {"only_to_customers": self.as_.asn})
             self._process_outgoing_ann(neighbor, ann, propagate_to, send_rels)
             return True
         else:
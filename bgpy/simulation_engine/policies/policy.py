@@ -1,9 +1,10 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from yamlable import YamlAble, yaml_info_decorate
 
 if TYPE_CHECKING:
+    from bgpy.as_graphs import AS
     from bgpy.enums import Relationships
     from bgpy.simulation_engine import Announcement as Ann
     from bgpy.simulation_framework import Scenario
@@ -13,6 +14,12 @@ class Policy(YamlAble, metaclass=ABCMeta):
     name: str = "AbstractPolicy"
     subclass_to_name_dict: dict[type["Policy"], str] = {}
     name_to_subclass_dict: dict[str, type["Policy"]] = {}
+    # Set by engines that use worklists. Per propagation rank, {ASN: AS}
+    # of the ASes that have received anns and still need to process them
+    recv_worklist: Optional[list[dict[int, "AS"]]] = None
+    # Announcement attrs this policy needs, beyond the core ones
+    # (see get_ann_cls_for_policies in announcement_family.py)
+    ann_mixins: tuple[type, ...] = ()
 
     def __init_subclass__(cls, *args, **kwargs):
         """This method essentially creates a list of all subclasses
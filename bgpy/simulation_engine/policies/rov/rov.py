@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 
+from bgpy.simulation_engine.announcement_family import ROAAnnMixin
 from bgpy.simulation_engine.policies.bgp import BGP
 
 if TYPE_CHECKING:
@@ -11,6 +12,7 @@ class ROV(BGP):
     """An Policy that deploys ROV"""
 
     name: str = "ROV"
+    ann_mixins: tuple[type, ...] = (ROAAnnMixin,)
 
     # mypy doesn't understand that this func is valid
     def _valid_ann(self, ann: "Ann", *args, **kwargs) -> bool:  # type: ignore
@@ -1,8 +1,189 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
+    from bgpy.simulation_engine import ForwardingTree
+    from bgpy.simulation_engine import Policy
 
 
 class BaseSAVPolicy(ABC):
     
     @abstractmethod
     def validate(self):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @classmethod
+    def validate_batch(
+        cls,
+        as_graph: "ASGraph",
+        reflector_asns: Iterable[int],
+        source_asns: Iterable[int],
+        prev_hop_asns: Iterable[int],
+    ) -> NDArray[np.bool_]:
+        """Validates many packets with this SAV policy at once
+
+        Element i of the returned bool array is whether the reflector at
+        reflector_asns[i] accepts a packet from source_asns[i] that it
+        received from prev_hop_asns[i].
+
+        By default this calls validate for every packet. Subclasses
+        override it to look every packet up in the per-AS indexes at once
+        """
+
+        as_dict = as_graph.as_dict
+        return np.fromiter(
+            (
+                cls.validate(  # type: ignore
+                    as_dict[reflector_asn].policy,
+                    as_dict[reflector_asn],
+                    as_dict[prev_hop_asn],
+                    source_asn,
+                )
+                for reflector_asn, source_asn, prev_hop_asn in zip(
+                    reflector_asns, source_asns, prev_hop_asns
+                )
+            ),
+            dtype=np.bool_,
+        )
+
+    @classmethod
+    def validate_with_forwarding_tree(
+        cls,
+        policy: "Policy",
+        as_obj: "AS",
+        prev_hop: "AS",
+        source: int,
+        source_tree: "ForwardingTree",
+    ) -> bool:
+        """Validates a packet, given the forwarding tree toward its source
+
+        source_tree is the tree of every AS's route to the source (see
+        SimulationEngine.get_origin_forwarding_tree), which is shared by
+        every packet from the source. By default this calls validate.
+        Subclasses that only check the route to the source override it
+        """
+
+        return bool(cls.validate(policy, as_obj, prev_hop, source))  # type: ignore
+
+    @staticmethod
+    def _get_batch_arrays(
+        *asn_iterables: Iterable[int],
+    ) -> tuple[NDArray[np.int64], ...]:
+        """Returns each iterable of ASNs as an array"""
+
+        arrays = tuple(
+            (
+                x.astype(np.int64, copy=False)
+                if isinstance(x, np.ndarray)
+                else np.fromiter(x, dtype=np.int64)
+            )
+            for x in asn_iterables
+        )
+        assert len({x.shape for x in arrays}) == 1, "Batch lengths don't match"
+        return arrays
+
+    @staticmethod
+    def _pack_keys(
+        *columns: tuple[NDArray[np.int64], NDArray[np.int64]],
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Packs rows of an index and packets into comparable int keys
+
+        Each column is (values in the index, values in the packets).
+        The values of a column are numbered by their position among the
+        index values (packet values that aren't in the index all get
+        the next number), and each row's numbers are packed into one
+        int, so a packet matches a row exactly when their keys are equal.
+        Only the index is sorted, since it's usually much smaller
+        """
+
+        index_keys = np.zeros(len(columns[0][0]), dtype=np.int64)
+        packet_keys = np.zeros(len(columns[0][1]), dtype=np.int64)
+        total_bits = 0
+        for index_values, packet_values in columns:
+            values, index_ids = np.unique(index_values, return_inverse=True)
+            packet_ids = np.searchsorted(values, packet_values)
+            # Packet values that aren't in the index
+            missing = packet_ids == len(values)
+            missing[~missing] = values[packet_ids[~missing]] != packet_values[~missing]
+            packet_ids[missing] = len(values)
+
+            bits = int(len(values)).bit_length()
+            total_bits += bits
+            index_keys = (index_keys << bits) | index_ids
+            packet_keys = (packet_keys << bits) | packet_ids
+        assert total_bits < 64, "Too many ASNs to pack"
+        return index_keys, packet_keys
+
+    @staticmethod
+    def _get_matches(
+        index_keys: NDArray[np.int64], packet_keys: NDArray[np.int64]
+    ) -> tuple[NDArray[np.bool_], NDArray[np.int64]]:
+        """Returns which packets match a row, and the row that they match"""
+
+        if not len(index_keys):
+            return (
+                np.zeros(len(packet_keys), dtype=np.bool_),
+                np.zeros(len(packet_keys), dtype=np.int64),
+            )
+        order = np.argsort(index_keys)
+        positions = np.searchsorted(index_keys[order], packet_keys)
+        rows = order[np.minimum(positions, len(order) - 1)]
+        return index_keys[rows] == packet_keys, rows
+
+    @classmethod
+    def _get_provider_mask(
+        cls,
+        as_graph: "ASGraph",
+        reflector_asns: NDArray[np.int64],
+        prev_hop_asns: NDArray[np.int64],
+    ) -> NDArray[np.bool_]:
+        """Returns which packets came from a provider of the reflector"""
+
+        rows = [
+            (reflector_asn, provider_asn)
+            for reflector_asn in np.unique(reflector_asns).tolist()
+            for provider_asn in as_graph.as_dict[reflector_asn].provider_asns
+        ]
+        index = np.array(rows, dtype=np.int64).reshape(-1, 2)
+        index_keys, packet_keys = cls._pack_keys(
+            (index[:, 0], reflector_asns), (index[:, 1], prev_hop_asns)
+        )
+        return cls._get_matches(index_keys, packet_keys)[0]
+
+    @classmethod
+    def _validate_batch_with_ribs_in_origins(
+        cls,
+        as_graph: "ASGraph",
+        reflector_asns: Iterable[int],
+        source_asns: Iterable[int],
+        prev_hop_asns: Iterable[int],
+    ) -> NDArray[np.bool_]:
+        """Accepts packets from providers, or from a next hop of the source
+
+        A packet is accepted from a customer or peer if the reflector has
+        any ann from the source in its RIBsIn from that neighbor, which is
+        the batch version of feasible path (and EFP) validate
+        """
+
+        reflectors, sources, prev_hops = cls._get_batch_arrays(
+            reflector_asns, source_asns, prev_hop_asns
+        )
+        # (reflector, origin, next hop) of every ann in the RIBsIns
+        rows = [
+            (reflector_asn, origin_asn, next_hop_asn)
+            for reflector_asn in np.unique(reflectors).tolist()
+            for origin_asn, next_hop_counts in (
+                as_graph.as_dict[reflector_asn].policy._ribs_in.origin_index.items()
+            )
+            for next_hop_asn in next_hop_counts
+        ]
+        index = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        index_keys, packet_keys = cls._pack_keys(
+            (index[:, 0], reflectors), (index[:, 1], sources), (index[:, 2], prev_hops)
+        )
+        matches, _ = cls._get_matches(index_keys, packet_keys)
+        return cls._get_provider_mask(as_graph, reflectors, prev_hops) | matches
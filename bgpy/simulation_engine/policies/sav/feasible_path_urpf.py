@@ -1,5 +1,13 @@
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
 from .base_sav_policy import BaseSAVPolicy
 
+if TYPE_CHECKING:
+    from bgpy.as_graphs import ASGraph
+
 class FeasiblePathuRPF(BaseSAVPolicy):
     name: str = "Feasible-Path uRPF"
 
@@ -8,9 +16,19 @@ class FeasiblePathuRPF(BaseSAVPolicy):
         if (prev_hop.asn in as_obj.provider_asns):
             return True
         else:
-            for neighbor_asn, prefix_dict in as_obj.policy._ribs_in.data.items():
-                for prefix, ann_info in prefix_dict.items():
-                    ann = ann_info.unprocessed_ann
-                    if ann.as_path[-1] == source and ann.next_hop_asn == prev_hop.asn:
-                        return True
-            return False
\ No newline at end of file
+            # Any ann from the source that was received from prev_hop
+            return as_obj.policy._ribs_in.has_origin_next_hop(source, prev_hop.asn)
+
+    @classmethod
+    def validate_batch(
+        cls,
+        as_graph: "ASGraph",
+        reflector_asns: Iterable[int],
+        source_asns: Iterable[int],
+        prev_hop_asns: Iterable[int],
+    ) -> NDArray[np.bool_]:
+        """Looks up every packet in the RIBsIn origin indexes at once"""
+
+        return cls._validate_batch_with_ribs_in_origins(
+            as_graph, reflector_asns, source_asns, prev_hop_asns
+        )
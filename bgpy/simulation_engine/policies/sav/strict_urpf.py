@@ -1,5 +1,17 @@
+from typing import Iterable, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bgpy.simulation_engine.ann_containers import OriginIndexedLocalRIB
+
 from .base_sav_policy import BaseSAVPolicy
 
+if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
+    from bgpy.simulation_engine import ForwardingTree
+    from bgpy.simulation_engine import Policy
+
 class StrictuRPF(BaseSAVPolicy):
     name: str = "Strict-uRPF"
 
@@ -9,9 +21,16 @@ class StrictuRPF(BaseSAVPolicy):
             return True
         else:
             # Get announcement to source address
-            for ann in as_obj.policy._local_rib.data.values():
-                if ann.as_path[-1] == source:
-                    source_ann = ann
+            # (the last one in the local RIB, if there are multiple)
+            local_rib = as_obj.policy._local_rib
+            if isinstance(local_rib, OriginIndexedLocalRIB):
+                source_ann = local_rib.get_origin_ann(source)
+            else:
+                source_ann = None
+                for ann in reversed(local_rib.data.values()):
+                    if ann.as_path[-1] == source:
+                        source_ann = ann
+                        break
 
             if source_ann is None:
                 raise TypeError
@@ -21,4 +40,78 @@ class StrictuRPF(BaseSAVPolicy):
                 return True
             else:
                 # raise ValueError(f"{source_ann.next_hop_asn}, {prev_hop.asn}")
-                return False
\ No newline at end of file
+                return False
+
+    @classmethod
+    def validate_with_forwarding_tree(
+        cls,
+        policy: "Policy",
+        as_obj: "AS",
+        prev_hop: "AS",
+        source: int,
+        source_tree: "ForwardingTree",
+    ) -> bool:
+        """Compares prev_hop to the AS's next hop in the tree to the source
+
+        Raises a TypeError if there's no route to the source, just like
+        validate
+        """
+
+        if cls.validate is not StrictuRPF.validate:
+            return super().validate_with_forwarding_tree(
+                policy, as_obj, prev_hop, source, source_tree
+            )
+        elif prev_hop.asn in as_obj.provider_asns:
+            return True
+        elif source_tree.get_route(as_obj.asn) is None:
+            raise TypeError
+        else:
+            return source_tree.get_next_hop_asn(as_obj.asn) == prev_hop.asn
+
+    @classmethod
+    def validate_batch(
+        cls,
+        as_graph: "ASGraph",
+        reflector_asns: Iterable[int],
+        source_asns: Iterable[int],
+        prev_hop_asns: Iterable[int],
+    ) -> NDArray[np.bool_]:
+        """Compares every prev_hop to the next hop of the route to the source
+
+        Uses the origin index of OriginIndexedLocalRIBs. Raises a
+        TypeError if a packet that didn't come from a provider has no
+        route to its source, just like validate
+        """
+
+        reflectors, sources, prev_hops = cls._get_batch_arrays(
+            reflector_asns, source_asns, prev_hop_asns
+        )
+        # (reflector, origin, next hop) of the route to every origin
+        rows: list[tuple[int, int, int]] = list()
+        for reflector_asn in np.unique(reflectors).tolist():
+            local_rib = as_graph.as_dict[reflector_asn].policy._local_rib
+            if isinstance(local_rib, OriginIndexedLocalRIB):
+                origin_anns = {
+                    x: local_rib.get_origin_ann(x) for x in local_rib.origin_index
+                }
+            else:
+                # The last ann from each origin, just like validate
+                origin_anns = {ann.as_path[-1]: ann for ann in local_rib.data.values()}
+            rows.extend(
+                (reflector_asn, origin_asn, ann.next_hop_asn)  # type: ignore
+                for origin_asn, ann in origin_anns.items()
+            )
+        index = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        index_keys, packet_keys = cls._pack_keys(
+            (index[:, 0], reflectors), (index[:, 1], sources)
+        )
+        has_route, routes = cls._get_matches(index_keys, packet_keys)
+        next_hops = index[routes, 2] if len(index) else routes
+
+        provider_mask = cls._get_provider_mask(as_graph, reflectors, prev_hops)
+        if not np.all(provider_mask | has_route):
+            raise TypeError
+        valid: NDArray[np.bool_] = provider_mask | (
+            has_route & (next_hops == prev_hops)
+        )
+        return valid
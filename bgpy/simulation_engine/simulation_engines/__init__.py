@@ -1,4 +1,11 @@
 from .base_simulation_engine import BaseSimulationEngine
 from .simulation_engine import SimulationEngine
+from .array_simulation_engine import ArraySimulationEngine
+from .parallel_array_simulation_engine import ParallelArraySimulationEngine
 
-__all__ = ["BaseSimulationEngine", "SimulationEngine"]
+__all__ = [
+    "BaseSimulationEngine",
+    "SimulationEngine",
+    "ArraySimulationEngine",
+    "ParallelArraySimulationEngine",
+]
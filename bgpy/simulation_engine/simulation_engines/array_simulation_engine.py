@@ -0,0 +1,681 @@
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bgpy.enums import Relationships
+from bgpy.simulation_engine.policies import BGP, PeerROV, Policy, ROV
+
+from .simulation_engine import SimulationEngine
+
+# https://stackoverflow.com/a/57005931/8903959
+if TYPE_CHECKING:
+    from bgpy.as_graphs import ASGraph
+    from bgpy.as_graphs.base.as_graph.propagation_schedule import Edges
+    from bgpy.simulation_engine import Announcement as Ann
+    from bgpy.simulation_framework import Scenario
+
+
+# Routes are compared using a single packed int64 key, where lower is better:
+# (7 - recv_relationship) | AS path length | neighbor ASN (the tiebreaker)
+# This is exactly the Gao Rexford ordering in BGP._get_best_ann_by_gao_rexford
+NO_ROUTE: int = int(np.iinfo(np.int64).max)
+_REL_SHIFT: int = 56
+_LEN_SHIFT: int = 32
+_LEN_MASK: int = (1 << 24) - 1
+
+# Relationships that can be exported to providers and peers
+_UP_SEND_RELS = np.array(
+    [Relationships.ORIGIN.value, Relationships.CUSTOMERS.value], dtype=np.int64
+)
+# Relationships that can be exported to customers
+_DOWN_SEND_RELS = np.array(
+    [
+        Relationships.ORIGIN.value,
+        Relationships.CUSTOMERS.value,
+        Relationships.PEERS.value,
+        Relationships.PROVIDERS.value,
+    ],
+    dtype=np.int64,
+)
+
+# Values for the per AS validation array
+_NO_ROV: int = 0
+_ROV: int = 1
+_PEER_ROV: int = 2
+
+# Methods that must be identical to BGP's for the array propagation to be exact
+_BGP_METHOD_NAMES: tuple[str, ...] = (
+    "propagate_to_providers",
+    "propagate_to_customers",
+    "propagate_to_peers",
+    "_propagate",
+    "_policy_propagate",
+    "_process_outgoing_ann",
+    "_prev_sent",
+    "receive_ann",
+    "process_incoming_anns",
+    "_copy_and_process",
+    "_get_processed_kwargs",
+    "_get_best_ann_by_gao_rexford",
+    "_get_gao_rexford_key",
+)
+
+
+def _get_key(rel_value: int, path_len: int, neighbor_asn: int) -> int:
+    """Packs a route into a key that can be compared (lower is better)"""
+
+    return ((7 - rel_value) << _REL_SHIFT) | (path_len << _LEN_SHIFT) | neighbor_asn
+
+
+class ArraySimulationEngine(SimulationEngine):
+    """Simulation engine that propagates each prefix over NumPy arrays
+
+    Instead of copying announcements into every AS's RecvQueue and
+    processing them one by one, the topology is compiled once into per
+    rank edge arrays, and each AS's best route per prefix is kept as
+    parallel arrays (packed Gao Rexford key, parent AS, root seed).
+    Prefixes are interned, so all of them move through each rank in
+    the same handful of vectorized operations. After
+    propagation, the local RIBs are filled in so that everything
+    downstream (analyzers, metric trackers, YAML) is unchanged.
+
+    Only policies that behave exactly like BGP, ROV, or PeerROV
+    are supported, and propagation must start from freshly seeded
+    announcements (which is the case for every round of every
+    scenario in BGPy). Anything else raises NotImplementedError,
+    use the SimulationEngine for those.
+
+    With incremental=True, the arrays from the last run of each round
+    are kept. When the next run seeds the same announcements (such as
+    every ScenarioConfig within a trial, since they share the attackers
+    and victims), only the ASes downstream of a policy change are
+    recomputed, and the rest of the local RIBs reuse the old anns.
+    """
+
+    def __init__(
+        self,
+        as_graph: "ASGraph",
+        # Useful for C++ Engine
+        cached_as_graph_tsv_path: Optional[Path] = None,
+        ready_to_run_round: int = -1,
+        reachability_pruning: bool = False,
+        worklists: bool = False,
+        use_rib_store: bool = False,
+        reduce_on_receive: bool = False,
+        index_local_rib_origins: bool = False,
+        incremental: bool = False,
+    ) -> None:
+        """Saves whether or not to reuse propagation results between runs
+
+        reachability_pruning and worklists have no effect, since ASes
+        without anns are already just untouched array entries. Neither does
+        reduce_on_receive, since anns are never received one at a time
+        """
+
+        super().__init__(
+            as_graph,
+            cached_as_graph_tsv_path=cached_as_graph_tsv_path,
+            ready_to_run_round=ready_to_run_round,
+            reachability_pruning=reachability_pruning,
+            worklists=worklists,
+            use_rib_store=use_rib_store,
+            reduce_on_receive=reduce_on_receive,
+            index_local_rib_origins=index_local_rib_origins,
+        )
+        self.incremental: bool = incremental
+        # Last run of each propagation round, for incremental runs
+        self._prev_runs: dict[int, "_Run"] = dict()
+
+    @classmethod
+    def policy_supported(cls, PolicyCls: type[Policy]) -> bool:
+        """Returns True if the policy can be propagated with arrays"""
+
+        return cls._get_rov_mode(PolicyCls) is not None
+
+    @staticmethod
+    @cache
+    def _get_rov_mode(PolicyCls: type[Policy]) -> Optional[int]:
+        """Returns how the policy validates anns, or None if it's unsupported
+
+        Checking the functions rather than the classes allows for
+        subclasses that only add attributes, such as the PseudoBGP
+        policies used as the adopting classes of some scenarios
+        """
+
+        if not issubclass(PolicyCls, BGP):
+            return None
+        for method_name in _BGP_METHOD_NAMES:
+            if getattr(PolicyCls, method_name) is not getattr(BGP, method_name):
+                return None
+
+        valid_ann_func = PolicyCls._valid_ann
+        if valid_ann_func is BGP._valid_ann:
+            return _NO_ROV
+        elif valid_ann_func is ROV._valid_ann:
+            return _ROV
+        elif valid_ann_func is PeerROV._valid_ann:
+            return _PEER_ROV
+        else:
+            return None
+
+    #####################
+    # Propagation funcs #
+    #####################
+
+    def _propagate(self, propagation_round: int, scenario: "Scenario"):
+        """Propagates every prefix at once through the arrays
+
+        Prefixes are interned to integers, and each prefix gets its own
+        block of every array. Each AS then has one slot per prefix, so all
+        prefixes move through a rank together. Array indexes are
+        prefix_id * number of ASes + AS index (called the slot below).
+
+        In incremental mode, if the seeded anns are the same as the last
+        time this round was run, only the ASes that could be affected by
+        the policies that changed since then are recomputed
+        """
+
+        rov_modes, roots_dict = self._get_rov_modes_and_roots()
+        if not roots_dict:
+            return
+
+        n = len(self.as_graph.ases)
+        num_prefixes = len(roots_dict)
+        # Interns the prefixes, so that the roots are keyed by slot
+        roots: list[tuple[int, "Ann"]] = [
+            (prefix_id * n + i, ann)
+            for prefix_id, prefix_roots in enumerate(roots_dict.values())
+            for i, ann in prefix_roots
+        ]
+        batch = self._get_batch(roots, rov_modes, num_prefixes)
+
+        prev_run = self._prev_runs.get(propagation_round) if self.incremental else None
+        if prev_run is not None and prev_run.roots == roots:
+            policy_changed = np.tile(rov_modes != prev_run.rov_modes, num_prefixes)
+            routes, up_routes, peer_routes = self._repropagate_routes(
+                batch, prev_run, policy_changed
+            )
+        else:
+            prev_run = None
+            routes, up_routes, peer_routes = self._propagate_routes(batch)
+
+        anns = self._add_anns_to_local_ribs(batch, routes, prev_run)
+        if self.incremental:
+            self._prev_runs[propagation_round] = _Run(
+                roots, rov_modes, up_routes, peer_routes, routes, anns
+            )
+
+    def _get_rov_modes_and_roots(
+        self,
+    ) -> tuple[NDArray[np.int8], dict[str, list[tuple[int, "Ann"]]]]:
+        """Returns each AS's validation mode and the seeded anns per prefix"""
+
+        rov_modes = np.zeros(len(self.as_graph.ases), dtype=np.int8)
+        roots_dict: dict[str, list[tuple[int, "Ann"]]] = dict()
+        for i, as_obj in enumerate(self.as_graph.ases):
+            rov_mode = self._get_rov_mode(as_obj.policy.__class__)
+            if rov_mode is None:
+                raise NotImplementedError(
+                    f"{as_obj.policy.__class__.__name__} isn't supported by "
+                    f"{self.__class__.__name__}, use the SimulationEngine instead"
+                )
+            rov_modes[i] = rov_mode
+            for prefix, ann in as_obj.policy._local_rib.items():
+                if ann.seed_asn is None:
+                    raise NotImplementedError(
+                        f"{self.__class__.__name__} can only propagate from "
+                        "freshly seeded announcements, use the SimulationEngine"
+                    )
+                roots_dict.setdefault(prefix, list()).append((i, ann))
+        return rov_modes, roots_dict
+
+    def _get_batch(
+        self,
+        roots: list[tuple[int, "Ann"]],
+        rov_modes: NDArray[np.int8],
+        num_prefixes: int,
+    ) -> "_Batch":
+        """Returns the seeded routes and the slot arrays for all prefixes"""
+
+        n = len(self.as_graph.ases)
+        size = n * num_prefixes
+        routes = _Routes(
+            keys=np.full(size, NO_ROUTE, dtype=np.int64),
+            heads=np.zeros(size, dtype=np.int64),
+            parents=np.full(size, -1, dtype=np.int64),
+            root_ids=np.full(size, -1, dtype=np.int64),
+        )
+        seeded = np.zeros(size, dtype=bool)
+
+        # Seeded AS paths that other ASes could loop on
+        root_paths: list[tuple[int, NDArray[np.int64]]] = list()
+        for root_id, (slot, ann) in enumerate(roots):
+            as_path = ann.as_path
+            # Seeded anns are never replaced, so the tiebreaker is never used
+            routes.keys[slot] = _get_key(ann.recv_relationship.value, len(as_path), 0)
+            routes.heads[slot] = as_path[0]
+            routes.root_ids[slot] = root_id
+            seeded[slot] = True
+            if as_path != (self.as_graph.ases[slot % n].asn,):
+                root_paths.append((root_id, np.array(as_path, dtype=np.int64)))
+
+        # Every prefix's block of slots uses the same edges, offset by block
+        offsets = np.arange(num_prefixes, dtype=np.int64) * n
+
+        def tile(edges: "Edges") -> "Edges":
+            senders, receivers = edges
+            return (
+                (senders[None, :] + offsets[:, None]).ravel(),
+                (receivers[None, :] + offsets[:, None]).ravel(),
+            )
+
+        schedule = self.as_graph.propagation_schedule
+        return _Batch(
+            roots=roots,
+            seeded_routes=routes,
+            seeded=seeded,
+            root_paths=root_paths,
+            roots_invalid=np.array(
+                [ann.invalid_by_roa for _, ann in roots], dtype=bool
+            ),
+            rov_modes=np.tile(rov_modes, num_prefixes),
+            asns=np.tile(schedule.asns, num_prefixes),
+            up_edges=tuple(tile(x) for x in schedule.up_edges),
+            peer_edges=tile(schedule.peer_edges),
+            down_edges=tuple(tile(x) for x in schedule.down_edges),
+            best_candidates=np.full(size, NO_ROUTE, dtype=np.int64),
+        )
+
+    def _propagate_routes(
+        self, batch: "_Batch"
+    ) -> tuple["_Routes", Optional["_Routes"], Optional["_Routes"]]:
+        """Propagates up, to peers, and then down
+
+        Returns the routes, and copies of the routes after the up
+        and peer phases, which are only needed in incremental mode
+        """
+
+        routes = self._get_working_routes(batch.seeded_routes, batch)
+        for senders, receivers in batch.up_edges:
+            self._process_edges(
+                routes, batch, senders, receivers, Relationships.CUSTOMERS
+            )
+        up_routes = routes.copy() if self.incremental else None
+        self._process_edges(routes, batch, *batch.peer_edges, Relationships.PEERS)
+        peer_routes = routes.copy() if self.incremental else None
+        for senders, receivers in batch.down_edges:
+            self._process_edges(
+                routes, batch, senders, receivers, Relationships.PROVIDERS
+            )
+        return routes, up_routes, peer_routes
+
+    def _repropagate_routes(
+        self,
+        batch: "_Batch",
+        prev_run: "_Run",
+        policy_changed: NDArray[np.bool_],
+    ) -> tuple["_Routes", Optional["_Routes"], Optional["_Routes"]]:
+        """Propagates, only recomputing slots that could have changed
+
+        Each phase, an AS is only recomputed if its policy changed, if it
+        started the phase with a different route, or if any neighbor that
+        sends to it in that phase now has a different route. Everyone else
+        gets the same candidates as last time, and so keeps the same route.
+        A route only counts as different if its key or root differs,
+        since those are the only things a neighbor's decision depends on.
+        """
+
+        assert prev_run.up_routes and prev_run.peer_routes, "Not incremental"
+        # Start from the last run, and only overwrite what's recomputed
+        routes = self._get_working_routes(prev_run.up_routes, batch)
+        changed = np.zeros(len(routes.keys), dtype=bool)
+
+        for senders, receivers in batch.up_edges:
+            self._reprocess_edges(
+                routes,
+                batch,
+                senders,
+                receivers,
+                Relationships.CUSTOMERS,
+                prev_run.up_routes,
+                changed,
+                policy_changed,
+                reset_routes=batch.seeded_routes,
+            )
+        up_routes = routes.copy()
+        self._reprocess_edges(
+            routes,
+            batch,
+            *batch.peer_edges,
+            Relationships.PEERS,
+            prev_run.peer_routes,
+            changed,
+            policy_changed,
+        )
+        peer_routes = routes.copy()
+        for senders, receivers in batch.down_edges:
+            self._reprocess_edges(
+                routes,
+                batch,
+                senders,
+                receivers,
+                Relationships.PROVIDERS,
+                prev_run.routes,
+                changed,
+                policy_changed,
+            )
+        return routes, up_routes, peer_routes
+
+    def _get_working_routes(self, routes: "_Routes", batch: "_Batch") -> "_Routes":
+        """Returns a copy of the routes for propagation to update in place"""
+
+        return routes.copy()
+
+    def _reprocess_edges(
+        self,
+        routes: "_Routes",
+        batch: "_Batch",
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        recv_rel: Relationships,
+        prev_routes: "_Routes",
+        changed: NDArray[np.bool_],
+        policy_changed: NDArray[np.bool_],
+        reset_routes: Optional["_Routes"] = None,
+    ) -> None:
+        """Reprocesses the edges into receivers that could have changed
+
+        prev_routes are the routes from the last run after these edges.
+        Receivers that can't have changed get those routes back, while
+        the rest are recomputed (from reset_routes, if passed in).
+        changed is updated for every receiver that was recomputed.
+        """
+
+        if len(senders) == 0:
+            return
+
+        dirty = np.zeros(len(routes.keys), dtype=bool)
+        dirty[
+            receivers[changed[senders] | changed[receivers] | policy_changed[receivers]]
+        ] = True
+        dirty_edges = dirty[receivers]
+        dirty_receivers = np.flatnonzero(dirty)
+
+        if reset_routes is not None:
+            routes.restore(dirty_receivers, reset_routes)
+        winners = self._get_winners(
+            routes, batch, senders[dirty_edges], receivers[dirty_edges], recv_rel
+        )
+        routes.restore(receivers[~dirty_edges], prev_routes)
+        self._apply_winners(routes, batch, *winners)
+
+        changed[dirty_receivers] = routes.differs(prev_routes, dirty_receivers)
+
+    def _process_edges(
+        self,
+        routes: "_Routes",
+        batch: "_Batch",
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        recv_rel: Relationships,
+    ) -> None:
+        """Sends routes along the edges, and keeps the best per receiver"""
+
+        self._apply_winners(
+            routes,
+            batch,
+            *self._get_winners(routes, batch, senders, receivers, recv_rel),
+        )
+
+    def _get_winners(
+        self,
+        routes: "_Routes",
+        batch: "_Batch",
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        recv_rel: Relationships,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Returns (senders, receivers, keys) for receivers with better routes"""
+
+        return _get_winners(routes, batch, senders, receivers, recv_rel)
+
+    def _apply_winners(
+        self,
+        routes: "_Routes",
+        batch: "_Batch",
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        keys: NDArray[np.int64],
+    ) -> None:
+        """Stores the winning routes from _get_winners"""
+
+        routes.keys[receivers] = keys
+        routes.heads[receivers] = batch.asns[receivers]
+        routes.parents[receivers] = senders
+        routes.root_ids[receivers] = routes.root_ids[senders]
+
+    def _add_anns_to_local_ribs(
+        self,
+        batch: "_Batch",
+        routes: "_Routes",
+        prev_run: Optional["_Run"] = None,
+    ) -> dict[int, "Ann"]:
+        """Creates the announcements for every slot that received a prefix
+
+        Slots are visited in order of AS path length so that the
+        parent's AS path always exists before it's needed
+
+        If the previous run is passed in, its anns are reused for every slot
+        whose route and every route upstream of it are unchanged
+        """
+
+        anns: dict[int, "Ann"] = dict()
+        reached = np.flatnonzero((routes.root_ids >= 0) & ~batch.seeded)
+        if len(reached) == 0:
+            return anns
+
+        keys = routes.keys
+        path_lens = (keys[reached] >> _LEN_SHIFT) & _LEN_MASK
+        reached = reached[np.argsort(path_lens, kind="stable")]
+        rel_values = (7 - (keys[reached] >> _REL_SHIFT)).tolist()
+        parent_slots = routes.parents[reached].tolist()
+        root_idxs = routes.root_ids[reached].tolist()
+
+        if prev_run is None:
+            changed = [True] * len(keys)
+            prev_anns = anns
+        else:
+            changed = (
+                routes.differs(prev_run.routes, slice(None))
+                | (routes.parents != prev_run.routes.parents)
+            ).tolist()
+            prev_anns = prev_run.anns
+
+        n = len(self.as_graph.ases)
+        ases = self.as_graph.ases
+        roots = batch.roots
+        as_paths: dict[int, tuple[int, ...]] = {
+            slot: ann.as_path for slot, ann in roots
+        }
+        for slot, parent_slot, root_id, rel_value in zip(
+            reached.tolist(), parent_slots, root_idxs, rel_values
+        ):
+            as_obj = ases[slot % n]
+            if changed[slot] or changed[parent_slot]:
+                changed[slot] = True
+                ann = roots[root_id][1].copy(
+                    {
+                        "as_path": (as_obj.asn,) + as_paths[parent_slot],
+                        "recv_relationship": Relationships(rel_value),
+                        "next_hop_asn": ases[parent_slot % n].asn,
+                    }
+                )
+            else:
+                ann = prev_anns[slot]
+            as_paths[slot] = ann.as_path
+            anns[slot] = ann
+            as_obj.policy._local_rib.add_ann(ann)
+        return anns
+
+    ##############
+    # Yaml funcs #
+    ##############
+
+    def __to_yaml_dict__(self) -> dict[str, Any]:
+        """Dumps the init args, including whether this is incremental"""
+
+        dct = super().__to_yaml_dict__()
+        dct["incremental"] = self.incremental
+        return dct
+
+
+def _get_winners(
+    routes: "_Routes",
+    batch: "_Batch",
+    senders: NDArray[np.int64],
+    receivers: NDArray[np.int64],
+    recv_rel: Relationships,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Returns (senders, receivers, keys) for receivers with better routes
+
+    All candidates are computed before any receiver is updated, which
+    matches the engine sending everything before processing anything
+
+    Loop prevention is only checked against the seeded AS path.
+    An AS can only appear further along a candidate's path if it had
+    already exported its own route, and by Gao Rexford that route is
+    always strictly preferred to anything that loops back to it, so
+    those candidates can never be selected anyways.
+    """
+
+    empty = np.zeros(0, dtype=np.int64)
+    if len(senders) == 0:
+        return empty, empty, empty
+
+    keys = routes.keys
+    root_ids = routes.root_ids
+
+    sender_keys = keys[senders]
+    sender_rels = 7 - (sender_keys >> _REL_SHIFT)
+    send_rels = (
+        _DOWN_SEND_RELS
+        if recv_rel.value == Relationships.PROVIDERS.value
+        else _UP_SEND_RELS
+    )
+    mask = np.isin(sender_rels, send_rels) & ~batch.seeded[receivers]
+
+    for root_id, root_path in batch.root_paths:
+        mask &= ~(
+            (root_ids[senders] == root_id) & np.isin(batch.asns[receivers], root_path)
+        )
+
+    if batch.roots_invalid.any():
+        invalid = batch.roots_invalid[root_ids[senders]] & (root_ids[senders] >= 0)
+        receiver_rov_modes = batch.rov_modes[receivers]
+        mask &= ~(invalid & (receiver_rov_modes == _ROV))
+        mask &= ~(
+            invalid
+            & (receiver_rov_modes == _PEER_ROV)
+            & (sender_rels == Relationships.PEERS.value)
+        )
+
+    senders = senders[mask]
+    receivers = receivers[mask]
+    if len(senders) == 0:
+        return empty, empty, empty
+
+    sender_keys = sender_keys[mask]
+    path_lens = ((sender_keys >> _LEN_SHIFT) & _LEN_MASK) + 1
+    candidates = (
+        ((7 - recv_rel.value) << _REL_SHIFT)
+        | (path_lens << _LEN_SHIFT)
+        | routes.heads[senders]
+    )
+
+    # Reduce to the best candidate per receiver
+    best = batch.best_candidates
+    np.minimum.at(best, receivers, candidates)
+    winners = (candidates == best[receivers]) & (candidates < keys[receivers])
+    best[receivers] = NO_ROUTE
+
+    senders = senders[winners]
+    receivers, first = np.unique(receivers[winners], return_index=True)
+    return senders[first], receivers, candidates[winners][first]
+
+
+@dataclass(slots=True)
+class _Routes:
+    """Every slot's best route, as parallel arrays"""
+
+    keys: NDArray[np.int64]
+    # ASN at the start of the AS path, which is the receiver's tiebreaker
+    heads: NDArray[np.int64]
+    # Slot of the AS that the route was received from
+    parents: NDArray[np.int64]
+    # Index into the roots for the seeded ann that each route came from
+    root_ids: NDArray[np.int64]
+
+    def copy(self) -> "_Routes":
+        return _Routes(
+            self.keys.copy(),
+            self.heads.copy(),
+            self.parents.copy(),
+            self.root_ids.copy(),
+        )
+
+    def restore(self, idxs: Any, other: "_Routes") -> None:
+        """Copies the routes at the indexes from other"""
+
+        self.keys[idxs] = other.keys[idxs]
+        self.heads[idxs] = other.heads[idxs]
+        self.parents[idxs] = other.parents[idxs]
+        self.root_ids[idxs] = other.root_ids[idxs]
+
+    def differs(self, other: "_Routes", idxs: Any) -> NDArray[np.bool_]:
+        """Returns which of the slots would send something different"""
+
+        differs: NDArray[np.bool_] = (self.keys[idxs] != other.keys[idxs]) | (
+            self.root_ids[idxs] != other.root_ids[idxs]
+        )
+        return differs
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Slot arrays for propagating every prefix at once
+
+    None of these change during propagation
+    """
+
+    # (slot, seeded ann)
+    roots: list[tuple[int, "Ann"]]
+    seeded_routes: _Routes
+    seeded: NDArray[np.bool_]
+    # Seeded AS paths that other ASes could loop on
+    root_paths: list[tuple[int, NDArray[np.int64]]]
+    roots_invalid: NDArray[np.bool_]
+    rov_modes: NDArray[np.int8]
+    asns: NDArray[np.int64]
+    up_edges: tuple["Edges", ...]
+    peer_edges: "Edges"
+    down_edges: tuple["Edges", ...]
+    # Scratch array used to reduce candidates per receiver
+    # Always left filled with NO_ROUTE between uses
+    best_candidates: NDArray[np.int64]
+
+
+@dataclass(slots=True)
+class _Run:
+    """Everything from a propagation round that an incremental run reuses"""
+
+    roots: list[tuple[int, "Ann"]]
+    rov_modes: NDArray[np.int8]
+    up_routes: Optional[_Routes]
+    peer_routes: Optional[_Routes]
+    routes: _Routes
+    # Non seeded anns that were added to local RIBs, by slot
+    anns: dict[int, "Ann"]
@@ -0,0 +1,337 @@
+from multiprocessing import cpu_count, current_process, Pool
+from multiprocessing.pool import Pool as PoolType
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Optional, TYPE_CHECKING
+import weakref
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bgpy.enums import Relationships
+
+from .array_simulation_engine import _Batch
+from .array_simulation_engine import _get_winners
+from .array_simulation_engine import _Routes
+from .array_simulation_engine import ArraySimulationEngine
+from .array_simulation_engine import NO_ROUTE
+
+if TYPE_CHECKING:
+    from bgpy.as_graphs import ASGraph
+
+
+# (offset, dtype, shape) of each array within a shared memory block
+_ArraySpecs = dict[str, tuple[int, str, tuple[int, ...]]]
+# Per slot arrays that the workers need to compute winners
+_ROUTE_ARRAY_NAMES: tuple[str, ...] = ("keys", "heads", "root_ids")
+_BATCH_ARRAY_NAMES: tuple[str, ...] = ("seeded", "rov_modes", "asns")
+
+
+class ParallelArraySimulationEngine(ArraySimulationEngine):
+    """ArraySimulationEngine that splits each rank across processes
+
+    The routes and the per slot arrays are copied into shared memory
+    for each run. Then, for every rank (and the peers), the edges are
+    split into chunks by receiver, and a pool of worker processes
+    reduces the candidates of each chunk to the best route per receiver.
+    Each rank is a barrier: the winners are written back to the routes
+    before the next rank is sent out, just like with a single process.
+    Since every receiver's edges stay in one chunk and in order,
+    the results are exactly the same as the ArraySimulationEngine.
+
+    This only helps for a single trial on very large topologies (or many
+    prefixes), where one rank has millions of edges. Ranks with fewer
+    than min_parallel_edges edges are processed in this process, since
+    sending the edges to the workers would take longer than processing.
+    When the engine runs within a daemonic process (such as the trials
+    of a Simulation with more than one parse_cpus), everything is
+    processed in this process, since daemons can't have children.
+    """
+
+    def __init__(
+        self,
+        as_graph: "ASGraph",
+        # Useful for C++ Engine
+        cached_as_graph_tsv_path: Optional[Path] = None,
+        ready_to_run_round: int = -1,
+        reachability_pruning: bool = False,
+        worklists: bool = False,
+        use_rib_store: bool = False,
+        reduce_on_receive: bool = False,
+        index_local_rib_origins: bool = False,
+        incremental: bool = False,
+        processes: int = cpu_count(),
+        min_parallel_edges: int = 100_000,
+    ) -> None:
+        """Saves the number of worker processes
+
+        The pool is only started the first time that it's needed
+        """
+
+        super().__init__(
+            as_graph,
+            cached_as_graph_tsv_path=cached_as_graph_tsv_path,
+            ready_to_run_round=ready_to_run_round,
+            reachability_pruning=reachability_pruning,
+            worklists=worklists,
+            use_rib_store=use_rib_store,
+            reduce_on_receive=reduce_on_receive,
+            index_local_rib_origins=index_local_rib_origins,
+            incremental=incremental,
+        )
+        self.processes: int = processes
+        self.min_parallel_edges: int = min_parallel_edges
+        self._pool: Optional[PoolType] = None
+        # Shared copies of the working routes and batch for this run
+        self._shared: Optional[_SharedArrays] = None
+        self._shared_routes: Optional[_Routes] = None
+
+    #####################
+    # Propagation funcs #
+    #####################
+
+    def _propagate_routes(
+        self, batch: _Batch
+    ) -> tuple[_Routes, Optional[_Routes], Optional[_Routes]]:
+        """Propagates with shared memory, then frees it"""
+
+        try:
+            routes, up_routes, peer_routes = super()._propagate_routes(batch)
+            return routes.copy(), up_routes, peer_routes
+        finally:
+            self._free_shared()
+
+    def _repropagate_routes(
+        self,
+        batch: _Batch,
+        prev_run: Any,
+        policy_changed: NDArray[np.bool_],
+    ) -> tuple[_Routes, Optional[_Routes], Optional[_Routes]]:
+        """Repropagates with shared memory, then frees it"""
+
+        try:
+            routes, up_routes, peer_routes = super()._repropagate_routes(
+                batch, prev_run, policy_changed
+            )
+            return routes.copy(), up_routes, peer_routes
+        finally:
+            self._free_shared()
+
+    def _get_working_routes(self, routes: _Routes, batch: _Batch) -> _Routes:
+        """Copies the routes and batch arrays into shared memory"""
+
+        self._free_shared()
+        shared = _SharedArrays(
+            {
+                **{x: getattr(routes, x) for x in _ROUTE_ARRAY_NAMES},
+                "parents": routes.parents,
+                **{x: getattr(batch, x) for x in _BATCH_ARRAY_NAMES},
+            }
+        )
+        self._shared = shared
+        self._shared_routes = _Routes(
+            keys=shared.arrays["keys"],
+            heads=shared.arrays["heads"],
+            parents=shared.arrays["parents"],
+            root_ids=shared.arrays["root_ids"],
+        )
+        return self._shared_routes
+
+    def _get_winners(
+        self,
+        routes: _Routes,
+        batch: _Batch,
+        senders: NDArray[np.int64],
+        receivers: NDArray[np.int64],
+        recv_rel: Relationships,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        """Splits the edges by receiver, and gets the winners in the pool"""
+
+        pool = self._get_pool()
+        if (
+            pool is None
+            or self._shared is None
+            or routes is not self._shared_routes
+            or len(senders) < max(self.min_parallel_edges, 1)
+        ):
+            return super()._get_winners(routes, batch, senders, receivers, recv_rel)
+
+        shared = self._shared
+        tasks = [
+            (
+                shared.name,
+                shared.specs,
+                batch.root_paths,
+                batch.roots_invalid,
+                senders[start:stop],
+                receivers[start:stop],
+                recv_rel.value,
+            )
+            for start, stop in self._get_chunks(receivers)
+        ]
+        results = pool.map(_get_winners_in_worker, tasks)
+        # Receivers are unique across chunks, so the order doesn't matter
+        return (
+            np.concatenate([x[0] for x in results]),
+            np.concatenate([x[1] for x in results]),
+            np.concatenate([x[2] for x in results]),
+        )
+
+    def _get_chunks(self, receivers: NDArray[np.int64]) -> list[tuple[int, int]]:
+        """Returns (start, stop) of about equal chunks of edges
+
+        Edges are grouped by receiver (as in the PropagationSchedule), and
+        chunks only end where the receiver changes, so that every
+        receiver's candidates are reduced by the same worker in order
+        """
+
+        num_edges = len(receivers)
+        receiver_starts = np.flatnonzero(receivers[1:] != receivers[:-1]) + 1
+        targets = np.linspace(0, num_edges, self.processes + 1)[1:-1]
+        idxs = np.searchsorted(receiver_starts, targets)
+        bounds = [0]
+        for idx in idxs.tolist():
+            if idx < len(receiver_starts) and receiver_starts[idx] > bounds[-1]:
+                bounds.append(int(receiver_starts[idx]))
+        bounds.append(num_edges)
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    ##################
+    # Pool and shmem #
+    ##################
+
+    def _get_pool(self) -> Optional[PoolType]:
+        """Returns the worker pool, or None if this process must do the work"""
+
+        if self.processes <= 1 or current_process().daemon:
+            return None
+        elif self._pool is None:
+            self._pool = Pool(self.processes)
+            # Terminate the workers once this engine is garbage collected
+            weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _free_shared(self) -> None:
+        """Frees the shared memory from the last run"""
+
+        if self._shared is not None:
+            self._shared_routes = None
+            self._shared.free()
+            self._shared = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """The pool and the shared memory can't be pickled"""
+
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_shared"] = None
+        state["_shared_routes"] = None
+        return state
+
+    ##############
+    # Yaml funcs #
+    ##############
+
+    def __to_yaml_dict__(self) -> dict[str, Any]:
+        """Dumps the init args, including the number of processes"""
+
+        dct = super().__to_yaml_dict__()
+        dct["processes"] = self.processes
+        dct["min_parallel_edges"] = self.min_parallel_edges
+        return dct
+
+
+class _SharedArrays:
+    """Copies of arrays in a single shared memory block"""
+
+    def __init__(self, arrays: dict[str, NDArray[Any]]) -> None:
+        self.specs: _ArraySpecs = dict()
+        offset = 0
+        for name, array in arrays.items():
+            self.specs[name] = (offset, array.dtype.str, array.shape)
+            # Keeps every array aligned to 8 bytes
+            offset += -(-array.nbytes // 8) * 8
+        self._shm: SharedMemory = SharedMemory(create=True, size=max(offset, 8))
+        self.name: str = self._shm.name
+        self.arrays: dict[str, NDArray[Any]] = _get_arrays(self._shm, self.specs)
+        for name, array in arrays.items():
+            self.arrays[name][...] = array
+
+    def free(self) -> None:
+        """Closes and unlinks the block, the arrays can't be used after"""
+
+        self.arrays.clear()
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _get_arrays(shm: SharedMemory, specs: _ArraySpecs) -> dict[str, NDArray[Any]]:
+    """Returns views of the arrays within the shared memory block"""
+
+    return {
+        name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+        for name, (offset, dtype, shape) in specs.items()
+    }
+
+
+#################
+# Worker funcs #
+#################
+
+# Shared memory block that this worker is attached to, and its arrays
+_worker_shm: Optional[SharedMemory] = None
+_worker_arrays: dict[str, NDArray[Any]] = dict()
+# Scratch array for _get_winners, reused between ranks
+_worker_best_candidates: NDArray[np.int64] = np.zeros(0, dtype=np.int64)
+
+
+def _get_winners_in_worker(
+    task: tuple[
+        str,
+        _ArraySpecs,
+        list[tuple[int, NDArray[np.int64]]],
+        NDArray[np.bool_],
+        NDArray[np.int64],
+        NDArray[np.int64],
+        int,
+    ],
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+    """Gets the winners for a chunk of edges from the shared arrays"""
+
+    global _worker_shm, _worker_arrays, _worker_best_candidates
+
+    name, specs, root_paths, roots_invalid, senders, receivers, rel_value = task
+    if _worker_shm is None or _worker_shm.name != name:
+        if _worker_shm is not None:
+            _worker_arrays = dict()
+            _worker_shm.close()
+        _worker_shm = SharedMemory(name=name)
+        # Pool workers share the parent's resource tracker, which
+        # unregisters the block when the parent unlinks it
+        _worker_arrays = _get_arrays(_worker_shm, specs)
+
+    arrays = _worker_arrays
+    size = len(arrays["keys"])
+    if len(_worker_best_candidates) != size:
+        _worker_best_candidates = np.full(size, NO_ROUTE, dtype=np.int64)
+
+    routes = _Routes(
+        keys=arrays["keys"],
+        heads=arrays["heads"],
+        parents=arrays["parents"],
+        root_ids=arrays["root_ids"],
+    )
+    batch = _Batch(
+        roots=list(),
+        seeded_routes=routes,
+        seeded=arrays["seeded"],
+        root_paths=root_paths,
+        roots_invalid=roots_invalid,
+        rov_modes=arrays["rov_modes"],
+        asns=arrays["asns"],
+        up_edges=(),
+        peer_edges=(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)),
+        down_edges=(),
+        best_candidates=_worker_best_candidates,
+    )
+    return _get_winners(routes, batch, senders, receivers, Relationships(rel_value))
@@ -1,15 +1,24 @@
-from typing import Any, Optional, TYPE_CHECKING
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Iterable, Optional, TYPE_CHECKING, Union
 
 from frozendict import frozendict
+import numpy as np
 
 from bgpy.enums import Relationships
+from bgpy.simulation_engine import BestRecvQueue
+from bgpy.simulation_engine import BGP
+from bgpy.simulation_engine import ForwardingTree
+from bgpy.simulation_engine import OriginIndexedLocalRIB
 from bgpy.simulation_engine import Policy
+from bgpy.simulation_engine import RIBStore
 from bgpy.simulation_engine.policies import BaseSAVPolicy
 
 from .base_simulation_engine import BaseSimulationEngine
 
 # https://stackoverflow.com/a/57005931/8903959
 if TYPE_CHECKING:
+    from bgpy.as_graphs import AS, ASGraph
     from bgpy.simulation_engine import Announcement as Ann
     from bgpy.simulation_framework import Scenario
 
@@ -17,6 +26,69 @@ if TYPE_CHECKING:
 class SimulationEngine(BaseSimulationEngine):
     """Python simulation engine representation"""
 
+    def __init__(
+        self,
+        as_graph: "ASGraph",
+        # Useful for C++ Engine
+        cached_as_graph_tsv_path: Optional[Path] = None,
+        ready_to_run_round: int = -1,
+        reachability_pruning: bool = False,
+        worklists: bool = False,
+        use_rib_store: bool = False,
+        reduce_on_receive: bool = False,
+        index_local_rib_origins: bool = False,
+    ) -> None:
+        """Saves whether or not to skip ASes that can't receive the anns
+
+        reachability_pruning assumes that every policy exports
+        valley free (which is true for every policy in BGPy)
+
+        worklists only processes ASes that received anns, and only
+        propagates from ASes that were seeded or processed something.
+        This requires policies that mark their recv_worklist when
+        receiving anns (as BGP.receive_ann does), and it makes
+        reachability_pruning redundant
+
+        use_rib_store keeps the local RIBs of every AS in a single
+        RIBStore (each policy's _local_rib is a LocalRIBView of it), so
+        that they're cleared all at once between runs
+
+        reduce_on_receive gives every policy that supports it (see
+        BGP.best_recv_q_supported) a BestRecvQueue, so that anns are
+        validated and compared as they're received and only the best ann
+        for each prefix is kept, rather than a list of every ann
+
+        index_local_rib_origins gives every policy with a source address
+        validation policy an OriginIndexedLocalRIB, so that the SAV
+        policy can look up the route to a source (see StrictuRPF). This
+        has no effect with use_rib_store, since those local RIBs are
+        LocalRIBViews
+        """
+
+        super().__init__(
+            as_graph,
+            cached_as_graph_tsv_path=cached_as_graph_tsv_path,
+            ready_to_run_round=ready_to_run_round,
+        )
+        self.reachability_pruning: bool = reachability_pruning
+        self.worklists: bool = worklists
+        self.reduce_on_receive: bool = reduce_on_receive
+        self.index_local_rib_origins: bool = index_local_rib_origins
+        # Per propagation rank, {ASN: AS} of the ASes that received anns
+        self._recv_worklist: list[dict[int, "AS"]] = [
+            dict() for _ in self.as_graph.propagation_ranks
+        ]
+        # ASNs seeded by the last setup, reset after the next run
+        self._seed_asns: Optional[frozenset[int]] = None
+        self.rib_store: Optional[RIBStore] = None
+        if use_rib_store:
+            self.rib_store = RIBStore(len(self.as_graph.ases))
+            self.add_local_ribs_to_rib_store()
+        # Prefixes (most specific first) or origin ASN: tree for this run
+        self._forwarding_trees: dict[
+            Union[tuple[str, ...], int], ForwardingTree
+        ] = dict()
+
     ###############
     # Setup funcs #
     ###############
@@ -36,6 +108,10 @@ class SimulationEngine(BaseSimulationEngine):
     ) -> frozenset[type[Policy]]:
         """Sets AS classes and seeds announcements"""
 
+        self.clear_forwarding_trees()
+        if self.rib_store is not None:
+            # Much faster than clearing every local RIB
+            self.rib_store.clear()
         policies_used: frozenset[type[Policy]] = self._set_as_classes(
             BasePolicyCls,
             non_default_asn_cls_dict,
@@ -45,7 +121,19 @@ class SimulationEngine(BaseSimulationEngine):
             reflector_asns,
             BaseSAVPolicyCls
         )
+        if self.rib_store is not None:
+            self.add_local_ribs_to_rib_store()
+        if self.reduce_on_receive:
+            self._add_best_recv_qs()
+        if self.index_local_rib_origins and self.rib_store is None:
+            self._add_origin_indexed_local_ribs()
         self._seed_announcements(announcements, prev_scenario)
+        self._seed_asns = frozenset(
+            ann.seed_asn for ann in announcements if ann.seed_asn is not None
+        )
+        if self.worklists:
+            for as_obj in self.as_graph:
+                as_obj.policy.recv_worklist = self._recv_worklist
         self.ready_to_run_round = 0
         return policies_used
 
@@ -61,6 +149,10 @@ class SimulationEngine(BaseSimulationEngine):
     ) -> frozenset[type[Policy]]:
         """Resets Engine ASes and changes their AS class
 
+        Policies whose class doesn't change are cleared in place and
+        reused, if the class has a reset func that clears everything
+        that its __init__ sets (see _reset_supported)
+
         We do this here because we already seed from the scenario
         to allow for easy overriding. If scenario controls seeding,
         it doesn't make sense for engine to control resetting either
@@ -68,15 +160,22 @@ class SimulationEngine(BaseSimulationEngine):
         """
 
         policy_classes_used = set()
+        reset_supported: dict[type[Policy], bool] = dict()
         # Done here to save as much time  as possible
         for as_obj in self.as_graph:
-            # Delete the old policy and remove references so that RAM can be reclaimed
-            del as_obj.policy.as_
             # set the AS class to be the proper type of AS
             Cls = non_default_asn_cls_dict.get(as_obj.asn, BasePolicyCls)
             if AttackerBasePolicyCls and as_obj.asn in attacker_asns:
                 Cls = AttackerBasePolicyCls
-            as_obj.policy = Cls(as_=as_obj)
+            if Cls not in reset_supported:
+                reset_supported[Cls] = self._reset_supported(Cls)
+            if as_obj.policy.__class__ is Cls and reset_supported[Cls]:
+                # Much faster than allocating a new policy and containers
+                as_obj.policy.reset()  # type: ignore
+            else:
+                # Delete the old policy and remove references for RAM
+                del as_obj.policy.as_
+                as_obj.policy = Cls(as_=as_obj)
             policy_classes_used.add(Cls)
 
             if BaseSAVPolicyCls and as_obj.asn in reflector_asns:
@@ -97,6 +196,61 @@ class SimulationEngine(BaseSimulationEngine):
 
         return frozenset(policy_classes_used)
 
+    @staticmethod
+    def _reset_supported(Cls: type[Policy]) -> bool:
+        """Returns whether policies of the class can be reset and reused
+
+        The class must have a reset func, defined in the class that
+        defines its __init__ or in a subclass of it. Otherwise the reset
+        could miss state that a subclass's __init__ added
+        """
+
+        mro = Cls.__mro__
+        reset_owner = next((x for x in mro if "reset" in vars(x)), None)
+        init_owner = next(x for x in mro if "__init__" in vars(x))
+        return reset_owner is not None and issubclass(reset_owner, init_owner)
+
+    def _add_best_recv_qs(self) -> None:
+        """Gives every policy that supports it a BestRecvQueue"""
+
+        supported: dict[type[Policy], bool] = dict()
+        for as_obj in self.as_graph:
+            policy = as_obj.policy
+            Cls = policy.__class__
+            if Cls not in supported:
+                supported[Cls] = issubclass(Cls, BGP) and Cls.best_recv_q_supported()
+            if supported[Cls] and not isinstance(policy._recv_q, BestRecvQueue):
+                policy._recv_q = BestRecvQueue()
+
+    def _add_origin_indexed_local_ribs(self) -> None:
+        """Gives every policy with a SAV policy an OriginIndexedLocalRIB"""
+
+        for as_obj in self.as_graph:
+            policy = as_obj.policy
+            if (
+                isinstance(policy, BGP)
+                and policy.source_address_validation_policy is not None
+                and not isinstance(policy._local_rib, OriginIndexedLocalRIB)
+            ):
+                policy._local_rib = OriginIndexedLocalRIB(policy._local_rib)
+
+    def add_local_ribs_to_rib_store(self) -> None:
+        """Moves the local RIBs that aren't in the RIB store into it
+
+        Called whenever policies may have been replaced, and must
+        be called after replacing policies outside of setup
+        """
+
+        assert self.rib_store is not None, "Engine doesn't use a RIB store"
+        for as_obj, local_rib_view in zip(
+            self.as_graph.ases, self.rib_store.local_ribs
+        ):
+            local_rib = as_obj.policy._local_rib
+            if local_rib is not local_rib_view:
+                local_rib_view.clear()
+                local_rib_view.update(local_rib)
+                as_obj.policy._local_rib = local_rib_view
+
     def _seed_announcements(
         self,
         announcements: tuple["Ann", ...] = (),
@@ -127,6 +281,7 @@ class SimulationEngine(BaseSimulationEngine):
             raise Exception(f"Engine not set up to run for {propagation_round} round")
         assert scenario, "This can't be empty"
 
+        self.clear_forwarding_trees()
         # import time
         # start = time.perf_counter()
         # Propogate anns
@@ -142,18 +297,230 @@ class SimulationEngine(BaseSimulationEngine):
         0. providers
         2. peers
         3. customers
+
+        With reachability_pruning, each phase only iterates over
+        the ASes that can possibly have anns during that phase
+
+        With worklists, each phase only iterates over the ASes
+        that received or hold anns
+        """
+
+        if self.worklists and self._seed_asns is not None:
+            seed_asns = self._seed_asns
+            self._seed_asns = None
+            self._propagate_with_worklists(propagation_round, scenario, seed_asns)
+            return
+        elif self.reachability_pruning and self._seed_asns is not None:
+            up_ranks, peer_ases, down_ranks = self._get_reachable_ases(
+                self._seed_asns
+            )
+        else:
+            up_ranks = down_ranks = self.as_graph.propagation_ranks
+            peer_ases = self.as_graph.ases
+        # Only freshly seeded graphs can be pruned
+        self._seed_asns = None
+
+        self._propagate_to_providers(propagation_round, scenario, up_ranks)
+        self._propagate_to_peers(propagation_round, scenario, peer_ases)
+        self._propagate_to_customers(propagation_round, scenario, down_ranks)
+
+    def _propagate_with_worklists(
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        seed_asns: frozenset[int],
+    ) -> None:
+        """Propagates, only visiting ASes that received or hold anns
+
+        Policies mark themselves in the recv worklist when they receive
+        an ann, so only those get processed. ASes that hold anns are the
+        seeded ones plus every AS that has processed anns, so only those
+        propagate. Both are kept per propagation rank. ASes send in the
+        same order as in the propagation funcs above, since that's the
+        order of the recv queues, which breaks exact ties.
+
+        Only valid directly after setup, since only the seeded ASes
+        are assumed to hold anns at the start
+        """
+
+        num_ranks = len(self.as_graph.propagation_ranks)
+        holders: list[dict[int, "AS"]] = [dict() for _ in range(num_ranks)]
+        for asn in seed_asns:
+            as_obj = self.as_graph.as_dict[asn]
+            holders[as_obj.propagation_rank][asn] = as_obj  # type: ignore
+
+        # Propagate to providers
+        for i in range(num_ranks):
+            # Nothing to process at the start
+            if i > 0:
+                self._process_worklist(
+                    i, holders, Relationships.CUSTOMERS, propagation_round, scenario
+                )
+            # Ranks are sorted by ASN
+            for asn in sorted(holders[i]):
+                holders[i][asn].policy.propagate_to_providers()
+
+        # Propagate to peers, in the same order as the AS graph
+        as_indexes = self._as_indexes
+        peer_senders = [x for rank_holders in holders for x in rank_holders.values()]
+        for as_obj in sorted(peer_senders, key=lambda x: as_indexes[x.asn]):
+            as_obj.policy.propagate_to_peers()
+        for i in range(num_ranks):
+            self._process_worklist(
+                i, holders, Relationships.PEERS, propagation_round, scenario
+            )
+
+        # Propagate to customers
+        for i in reversed(range(num_ranks)):
+            # There are no incomming Anns at the top
+            if i < num_ranks - 1:
+                self._process_worklist(
+                    i, holders, Relationships.PROVIDERS, propagation_round, scenario
+                )
+            for asn in sorted(holders[i]):
+                holders[i][asn].policy.propagate_to_customers()
+
+    def _process_worklist(
+        self,
+        rank: int,
+        holders: list[dict[int, "AS"]],
+        from_rel: Relationships,
+        propagation_round: int,
+        scenario: "Scenario",
+    ) -> None:
+        """Processes the ASes that received anns in a rank, then clears them"""
+
+        worklist = self._recv_worklist[rank]
+        rank_holders = holders[rank]
+        for asn, as_obj in worklist.items():
+            as_obj.policy.process_incoming_anns(
+                from_rel=from_rel,
+                propagation_round=propagation_round,
+                scenario=scenario,
+            )
+            rank_holders[asn] = as_obj
+        worklist.clear()
+
+    ####################
+    # Forwarding trees #
+    ####################
+
+    def get_forwarding_tree(self, prefixes: tuple[str, ...]) -> ForwardingTree:
+        """Returns the tree of the most specific route of every AS
+
+        prefixes are ordered from most specific to least specific (like
+        scenario.ordered_prefix_subprefix_dict). Each tree is only built
+        once per run
+        """
+
+        tree = self._forwarding_trees.get(prefixes)
+        if tree is None:
+            tree = ForwardingTree.from_prefixes(
+                self.as_graph, prefixes, self.rib_store
+            )
+            self._forwarding_trees[prefixes] = tree
+        return tree
+
+    def get_origin_forwarding_tree(self, origin_asn: int) -> ForwardingTree:
+        """Returns the tree of every AS's route to an origin
+
+        Each tree is only built once per run
+        """
+
+        tree = self._forwarding_trees.get(origin_asn)
+        if tree is None:
+            tree = self.get_origin_forwarding_trees((origin_asn,))[origin_asn]
+        return tree
+
+    def get_origin_forwarding_trees(
+        self, origin_asns: Iterable[int]
+    ) -> dict[int, ForwardingTree]:
+        """Returns the tree of every AS's route to each origin
+
+        The trees that haven't been built this run are built together,
+        so that the local RIBs are only scanned once
+        """
+
+        origin_asns = tuple(origin_asns)
+        missing_asns = [x for x in origin_asns if x not in self._forwarding_trees]
+        if missing_asns:
+            trees = ForwardingTree.from_origins(self.as_graph, missing_asns)
+            for origin_asn, tree in trees.items():
+                self._forwarding_trees[origin_asn] = tree
+        return {x: self._forwarding_trees[x] for x in origin_asns}
+
+    def clear_forwarding_trees(self) -> None:
+        """Clears the forwarding trees
+
+        Called by setup and run, and must be called after changing
+        the local RIBs outside of them
+        """
+
+        self._forwarding_trees.clear()
+
+    @cached_property
+    def _as_indexes(self) -> dict[int, int]:
+        """Maps ASNs to their index in the as_graph"""
+
+        return {x.asn: i for i, x in enumerate(self.as_graph.ases)}
+
+    def _get_reachable_ases(self, seed_asns: frozenset[int]) -> tuple[
+        tuple[tuple["AS", ...], ...],
+        tuple["AS", ...],
+        tuple[tuple["AS", ...], ...],
+    ]:
+        """Returns the ASes that can receive anns from the seeds, per phase
+
+        Under valley free export, only the provider cone of the seeds can
+        have anns during propagation to providers. Those ASes and their
+        peers are the only ones involved in propagation to peers. And only
+        the customer cones of all of those can have anns afterwards.
+
+        Returns (up propagation ranks, peer ASes, down propagation ranks)
+        Ranks are kept (and may be empty) so that rank indexes don't change
         """
 
-        self._propagate_to_providers(propagation_round, scenario)
-        self._propagate_to_peers(propagation_round, scenario)
-        self._propagate_to_customers(propagation_round, scenario)
+        schedule = self.as_graph.propagation_schedule
+        ases = self.as_graph.ases
+
+        # Each phase's edges go from lower to higher ranks (or the reverse),
+        # so one pass over the ranks reaches the entire cone of the seeds
+        up = np.zeros(len(ases), dtype=bool)
+        up[[self._as_indexes[x] for x in seed_asns]] = True
+        for senders, receivers in schedule.up_edges:
+            up[receivers[up[senders]]] = True
+
+        peer = up.copy()
+        senders, receivers = schedule.peer_edges
+        peer[receivers[up[senders]]] = True
 
-    def _propagate_to_providers(self, propagation_round: int, scenario: "Scenario"):
+        down = peer.copy()
+        for senders, receivers in schedule.down_edges:
+            down[receivers[down[senders]]] = True
+
+        def get_ases(idxs, reached) -> tuple["AS", ...]:
+            return tuple(ases[i] for i in idxs[reached[idxs]].tolist())
+
+        return (
+            tuple(get_ases(rank, up) for rank in schedule.up_ranks),
+            get_ases(schedule.peer_phase, peer),
+            tuple(get_ases(rank, down) for rank in schedule.up_ranks),
+        )
+
+    def _propagate_to_providers(
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        propagation_ranks: Optional[tuple[tuple["AS", ...], ...]] = None,
+    ):
         """Propogate to providers"""
 
+        if propagation_ranks is None:
+            propagation_ranks = self.as_graph.propagation_ranks
+
         # Propogation ranks go from stubs to input_clique in ascending order
         # By customer provider pairs (peers are ignored for the ranks)
-        for i, rank in enumerate(self.as_graph.propagation_ranks):
+        for i, rank in enumerate(propagation_ranks):
             # Nothing to process at the start
             if i > 0:
                 # Process first because maybe it recv from lower ranks
@@ -168,31 +535,45 @@ class SimulationEngine(BaseSimulationEngine):
                 as_obj.policy.propagate_to_providers()
 
     def _propagate_to_peers(
-        self, propagation_round: int, scenario: Optional["Scenario"]
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        ases: Optional[tuple["AS", ...]] = None,
     ):
         """Propagate to peers"""
 
+        if ases is None:
+            ases = self.as_graph.ases
+
         # The reason you must separate this for loop here
         # is because propagation ranks do not take into account peering
         # It'd be impossible to take into account peering
         # since different customers peer to different ranks
         # So first do customer to provider propagation, then peer propagation
-        for as_obj in self.as_graph:
+        for as_obj in ases:
             as_obj.policy.propagate_to_peers()
-        for as_obj in self.as_graph:
+        for as_obj in ases:
             as_obj.policy.process_incoming_anns(
                 from_rel=Relationships.PEERS,
                 propagation_round=propagation_round,
                 scenario=scenario,
             )
 
-    def _propagate_to_customers(self, propagation_round: int, scenario: "Scenario"):
+    def _propagate_to_customers(
+        self,
+        propagation_round: int,
+        scenario: "Scenario",
+        propagation_ranks: Optional[tuple[tuple["AS", ...], ...]] = None,
+    ):
         """Propagate to customers"""
 
+        if propagation_ranks is None:
+            propagation_ranks = self.as_graph.propagation_ranks
+
         # Propogation ranks go from stubs to input_clique in ascending order
         # By customer provider pairs (peers are ignored for the ranks)
         # So here we start at the highest rank(input_clique) and propagate down
-        for i, rank in enumerate(reversed(self.as_graph.propagation_ranks)):
+        for i, rank in enumerate(reversed(propagation_ranks)):
             # There are no incomming Anns at the top
             if i > 0:
                 for as_obj in rank:
@@ -209,9 +590,22 @@ class SimulationEngine(BaseSimulationEngine):
     ##############
 
     def __to_yaml_dict__(self) -> dict[str, Any]:
-        """This optional method is called when you call yaml.dump()"""
+        """This optional method is called when you call yaml.dump()
+
+        Only the init args are dumped, so that subclasses can
+        cache whatever they need on the engine
+        """
 
-        return dict(vars(self))
+        return {
+            "as_graph": self.as_graph,
+            "cached_as_graph_tsv_path": self.cached_as_graph_tsv_path,
+            "ready_to_run_round": self.ready_to_run_round,
+            "reachability_pruning": self.reachability_pruning,
+            "worklists": self.worklists,
+            "use_rib_store": self.rib_store is not None,
+            "reduce_on_receive": self.reduce_on_receive,
+            "index_local_rib_origins": self.index_local_rib_origins,
+        }
 
     @classmethod
     def __from_yaml_dict__(
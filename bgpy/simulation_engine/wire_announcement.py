@@ -0,0 +1,95 @@
+from types import FunctionType
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .announcement import Announcement as Ann
+
+
+class WireAnnouncement:
+    """Read only view of an ann with a few attributes changed
+
+    When an AS processes its RecvQueue, every valid ann is copied with
+    the AS prepended and the recv_relationship set, just to be compared
+    by Gao Rexford. Usually only one of those copies is kept, so instead
+    each received ann is wrapped with the attributes it would have been
+    copied with, and only the ann that is selected gets copied.
+
+    Attributes not in the deltas are read from the wrapped ann. The
+    methods and properties of the wrapped ann's class are borrowed, so
+    that they see the deltas (see get_wire_ann_cls).
+    """
+
+    __slots__ = ("_ann", "_deltas")
+
+    def __init__(self, ann: "Ann", deltas: dict[str, Any]) -> None:
+        """Deltas are the overwrite_default_kwargs that Ann.copy would use"""
+
+        # Ann.copy always resets these unless they are overwritten
+        full_deltas = {"seed_asn": None, "traceback_end": False}
+        full_deltas.update(deltas)
+        self._ann: "Ann" = ann
+        self._deltas: dict[str, Any] = full_deltas
+
+    def __getattr__(self, name: str) -> Any:
+        """Only called for attributes not on the class, such as ann fields"""
+
+        deltas = self._deltas
+        if name in deltas:
+            return deltas[name]
+        else:
+            return getattr(self._ann, name)
+
+    def copy(self, overwrite_default_kwargs: Any = None) -> "Ann":
+        """Returns the real ann, with the deltas applied"""
+
+        if overwrite_default_kwargs:
+            deltas = dict(self._deltas)
+            deltas.update(overwrite_default_kwargs)
+            return self._ann.copy(deltas)
+        else:
+            return self._ann.copy(self._deltas)
+
+    def __str__(self) -> str:
+        return f"{self.prefix} {self.as_path} {self.recv_relationship}"
+
+
+# Ann class to the WireAnnouncement subclass that wraps it
+_WIRE_ANN_CLASSES: dict[type, type[WireAnnouncement]] = dict()
+
+
+def get_wire_ann_cls(AnnCls: type["Ann"]) -> type[WireAnnouncement]:
+    """Returns a WireAnnouncement subclass for the announcement class
+
+    Borrows every regular method and property of the ann class,
+    other than dunder methods and the ones WireAnnouncement defines
+    """
+
+    WireAnnCls = _WIRE_ANN_CLASSES.get(AnnCls)
+    if WireAnnCls is None:
+        WireAnnCls = _create_wire_ann_cls(AnnCls)
+        _WIRE_ANN_CLASSES[AnnCls] = WireAnnCls
+    return WireAnnCls
+
+
+def _create_wire_ann_cls(AnnCls: type["Ann"]) -> type[WireAnnouncement]:
+    """Creates the WireAnnouncement subclass for get_wire_ann_cls"""
+
+    attrs: dict[str, Any] = dict()
+    for klass in reversed(AnnCls.__mro__):
+        for name, value in vars(klass).items():
+            # Skips properties that aren't functions, such as the
+            # itemgetters of the tuple-backed announcement family
+            if (
+                (
+                    isinstance(value, FunctionType)
+                    or (
+                        isinstance(value, property)
+                        and isinstance(value.fget, FunctionType)
+                    )
+                )
+                and not name.startswith("__")
+                and name not in vars(WireAnnouncement)
+            ):
+                attrs[name] = value
+    attrs["__slots__"] = ()
+    return type(f"Wire{AnnCls.__name__}", (WireAnnouncement,), attrs)
@@ -1,6 +1,7 @@
 from .as_graph_analyzers import BaseASGraphAnalyzer, ASGraphAnalyzer
 from .graph_factory import GraphFactory
 from .metric_tracker import MetricTracker
+from .packet_forwarder import PacketForwarder, PacketResult
 
 from .scenarios import preprocess_anns_funcs
 from .scenarios import ROAInfo
@@ -24,6 +25,8 @@ __all__ = [
     "BaseASGraphAnalyzer",
     "GraphFactory",
     "MetricTracker",
+    "PacketForwarder",
+    "PacketResult",
     "preprocess_anns_funcs",
     "ROAInfo",
     "ScenarioConfig",
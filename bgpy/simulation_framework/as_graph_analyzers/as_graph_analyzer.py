@@ -1,8 +1,11 @@
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
+
 from bgpy.as_graphs import AS
 from bgpy.enums import Plane, Outcomes, Relationships
 from bgpy.simulation_engine import BaseSimulationEngine
+from bgpy.simulation_engine import ForwardingTree
 
 
 from .base_as_graph_analyzer import BaseASGraphAnalyzer
@@ -25,11 +28,9 @@ class ASGraphAnalyzer(BaseASGraphAnalyzer):
     ) -> None:
         self.engine: BaseSimulationEngine = engine
         self.scenario: "Scenario" = scenario
-        self._most_specific_ann_dict: dict[AS, Optional["Ann"]] = {
-            # Get the most specific ann in the rib
-            as_obj: self._get_most_specific_ann(as_obj)
-            for as_obj in engine.as_graph
-        }
+        self._most_specific_ann_dict: dict[AS, Optional["Ann"]] = (
+            self._get_most_specific_ann_dict()
+        )
         self._data_plane_outcomes: dict[int, int] = dict()
         self._control_plane_outcomes: dict[int, int] = dict()
         self.outcomes: dict[int, dict[int, int]] = {
@@ -39,6 +40,45 @@ class ASGraphAnalyzer(BaseASGraphAnalyzer):
         self.data_plane_tracking: bool = data_plane_tracking
         self.control_plane_tracking: bool = control_plane_tracking
 
+    def _get_most_specific_ann_dict(self) -> dict[AS, Optional["Ann"]]:
+        """Returns the most specific ann in the rib of every AS
+
+        When the engine builds forwarding trees (and _get_most_specific_ann
+        isn't overriden), these are the routes of the engine's forwarding
+        tree for the scenario's prefixes, which the data plane traceback
+        then uses as well
+        """
+
+        tree = self._get_forwarding_tree()
+        if tree is None:
+            return {
+                # Get the most specific ann in the rib
+                as_obj: self._get_most_specific_ann(as_obj)
+                for as_obj in self.engine.as_graph
+            }
+        else:
+            return dict(zip(self.engine.as_graph.ases, tree.routes))
+
+    def _get_forwarding_tree(self) -> Optional[ForwardingTree]:
+        """Returns the engine's forwarding tree of the most specific anns
+
+        None if the engine doesn't build forwarding trees, or if the
+        most specific anns are chosen differently by a subclass
+        """
+
+        get_forwarding_tree = getattr(self.engine, "get_forwarding_tree", None)
+        if (
+            get_forwarding_tree is None
+            or self.__class__._get_most_specific_ann
+            is not ASGraphAnalyzer._get_most_specific_ann
+        ):
+            return None
+        else:
+            tree: ForwardingTree = get_forwarding_tree(
+                tuple(self.scenario.ordered_prefix_subprefix_dict)
+            )
+            return tree
+
     def _get_most_specific_ann(self, as_obj: AS) -> Optional["Ann"]:
         """Returns the most specific announcement that exists in a rib
 
@@ -56,6 +96,8 @@ class ASGraphAnalyzer(BaseASGraphAnalyzer):
     def analyze(self) -> dict[int, dict[int, int]]:
         """Takes in engine and outputs traceback for ctrl + data plane data"""
 
+        if self.data_plane_tracking:
+            self._add_data_plane_outcomes_from_forwarding_tree()
         for as_obj in self.engine.as_graph:
             if self.data_plane_tracking:
                 # Gets AS outcome and stores it in the outcomes dict
@@ -69,6 +111,41 @@ class ASGraphAnalyzer(BaseASGraphAnalyzer):
     # Data plane funcs #
     ####################
 
+    def _add_data_plane_outcomes_from_forwarding_tree(self) -> None:
+        """Stores the data plane outcome of every AS with a forwarding tree
+
+        The outcome of an AS is decided by the first AS on its path that
+        is an attacker, a victim, or where the traceback ends, so this
+        finds that AS for every path in one pass over the tree rather
+        than recursing from every AS. Only used when the data plane
+        funcs aren't overriden
+        """
+
+        cls = self.__class__
+        if (
+            cls._get_most_specific_ann_dict
+            is not ASGraphAnalyzer._get_most_specific_ann_dict
+            or cls._get_as_outcome_data_plane
+            is not ASGraphAnalyzer._get_as_outcome_data_plane
+            or cls._determine_as_outcome_data_plane
+            is not ASGraphAnalyzer._determine_as_outcome_data_plane
+        ):
+            return
+        tree = self._get_forwarding_tree()
+        if tree is None:
+            return
+
+        as_outcomes = [
+            self._determine_as_outcome_data_plane(as_obj, ann)
+            for as_obj, ann in zip(self.engine.as_graph.ases, tree.routes)
+        ]
+        mask = np.array(as_outcomes) != Outcomes.UNDETERMINED.value
+        first_idxs = tree.get_first_on_path_idxs(mask)
+        for asn, first_idx in zip(tree.asns.tolist(), first_idxs.tolist()):
+            # Forwarding loops are never resolved, like with the recursion
+            assert first_idx != -1, "Shouldn't be possible"
+            self._data_plane_outcomes[asn] = as_outcomes[first_idx]
+
     def _get_as_outcome_data_plane(self, as_obj: AS) -> int:
         """Recursively returns the as outcome"""
 
@@ -0,0 +1,4 @@
+from .packet_result import PacketResult
+from .packet_forwarder import PacketForwarder
+
+__all__ = ["PacketResult", "PacketForwarder"]
@@ -0,0 +1,156 @@
+from itertools import product
+from typing import Iterable, Optional
+
+from bgpy.as_graphs import AS
+from bgpy.enums import PacketOutcomes
+from bgpy.simulation_engine import BGP
+from bgpy.simulation_engine import SimulationEngine
+
+from .packet_result import PacketResult
+
+
+class PacketForwarder:
+    """Forwards spoofed packets through the local RIBs of an engine
+
+    The data plane stage after engine.run. A packet is sent by an
+    attacker, with the address of a spoofed source, to a reflector.
+    Each AS forwards it to its next hop in the engine's forwarding tree
+    toward the reflector (the ann from the reflector, the same way that
+    StrictuRPF finds the route to a source). Every AS after the attacker
+    applies its source address validation to the packet, from the AS
+    that it came from, given the forwarding tree toward the source.
+
+    Once a packet is accepted at an AS, where it ends up only depends
+    on that AS, the source, and the reflector, so these results are
+    shared by every packet that reaches the same AS. Results are only
+    valid for the RIBs at the time they're computed, so use a new
+    PacketForwarder after every engine run
+    """
+
+    def __init__(self, engine: SimulationEngine) -> None:
+        self.engine: SimulationEngine = engine
+        # (asn, spoofed source, reflector): result once accepted at the AS
+        self._suffix_results: dict[tuple[int, int, int], PacketResult] = dict()
+        # reflector: next hop index of every AS index (-1 if the path ends)
+        self._next_hops: dict[int, list[int]] = dict()
+        # Policy class: whether it applies SAV with forwarding trees
+        self._tree_sav_supported: dict[type, bool] = dict()
+
+    def forward(
+        self,
+        attacker_asns: Iterable[int],
+        spoofed_source_asns: Iterable[int],
+        reflector_asns: Iterable[int],
+    ) -> dict[tuple[int, int, int], PacketResult]:
+        """Forwards a packet from each attacker to each reflector, spoofing each source
+
+        Returns the result of every packet, keyed by
+        (attacker ASN, spoofed source ASN, reflector ASN)
+        """
+
+        spoofed_source_asns = tuple(spoofed_source_asns)
+        reflector_asns = tuple(reflector_asns)
+        # Build the trees toward every source and reflector at once
+        self.engine.get_origin_forwarding_trees(
+            set(spoofed_source_asns) | set(reflector_asns)
+        )
+        return {
+            packet: self.forward_packet(*packet)
+            for packet in product(attacker_asns, spoofed_source_asns, reflector_asns)
+        }
+
+    def forward_packet(
+        self, attacker_asn: int, spoofed_source_asn: int, reflector_asn: int
+    ) -> PacketResult:
+        """Forwards a single packet hop by hop and returns where it ended up"""
+
+        ases = self.engine.as_graph.ases
+        suffix_results = self._suffix_results
+        next_hops = self._next_hops.get(reflector_asn)
+        if next_hops is None:
+            next_hops = self._get_next_hops(reflector_asn)
+        # Keys of the ASes that accepted the packet, in order
+        accepted_keys: list[tuple[int, int, int]] = list()
+        # Position of each key in accepted_keys
+        accepted_positions: dict[tuple[int, int, int], int] = dict()
+        idx = self.engine._as_indexes[attacker_asn]
+        as_obj: AS = ases[idx]
+        # The attacker doesn't validate its own packet
+        prev_hop: Optional[AS] = None
+        while True:
+            if prev_hop is not None and not self._source_address_validation(
+                as_obj, prev_hop, spoofed_source_asn
+            ):
+                result = PacketResult(PacketOutcomes.DROPPED_BY_SAV, as_obj.asn)
+                break
+
+            key = (as_obj.asn, spoofed_source_asn, reflector_asn)
+            suffix_result = suffix_results.get(key)
+            if suffix_result is not None:
+                result = suffix_result
+                break
+            elif key in accepted_positions:
+                # The lowest ASN in the loop, wherever the packet entered it
+                loop_keys = accepted_keys[accepted_positions[key] :]
+                result = PacketResult(PacketOutcomes.LOOP, min(x[0] for x in loop_keys))
+                break
+            accepted_positions[key] = len(accepted_keys)
+            accepted_keys.append(key)
+
+            if as_obj.asn == reflector_asn:
+                result = PacketResult(PacketOutcomes.DELIVERED, as_obj.asn)
+                break
+            idx = next_hops[idx]
+            if idx == -1:
+                result = PacketResult(PacketOutcomes.DISCONNECTED, as_obj.asn)
+                break
+            prev_hop, as_obj = as_obj, ases[idx]
+
+        for key in accepted_keys:
+            suffix_results[key] = result
+        return result
+
+    def _get_next_hops(self, reflector_asn: int) -> list[int]:
+        """Stores the next hops of the forwarding tree toward the reflector"""
+
+        tree = self.engine.get_origin_forwarding_tree(reflector_asn)
+        next_hops: list[int] = tree.next_hops.tolist()
+        self._next_hops[reflector_asn] = next_hops
+        return next_hops
+
+    def _source_address_validation(
+        self, as_obj: AS, prev_hop: AS, spoofed_source_asn: int
+    ) -> bool:
+        """Applies the AS's SAV policy with the forwarding tree to the source
+
+        Falls back to the policy's source_address_validation if a
+        subclass overrides it
+        """
+
+        policy = as_obj.policy
+        PolicyCls = policy.__class__
+        supported = self._tree_sav_supported.get(PolicyCls)
+        if supported is None:
+            supported = (
+                issubclass(PolicyCls, BGP)
+                and PolicyCls.source_address_validation is BGP.source_address_validation
+            )
+            self._tree_sav_supported[PolicyCls] = supported
+        if not supported:
+            return bool(
+                policy.source_address_validation(  # type: ignore
+                    as_obj, prev_hop, spoofed_source_asn
+                )
+            )
+        SAVCls = policy.source_address_validation_policy  # type: ignore
+        if SAVCls is None:
+            return True
+        return bool(
+            SAVCls.validate_with_forwarding_tree(
+                policy,
+                as_obj,
+                prev_hop,
+                spoofed_source_asn,
+                self.engine.get_origin_forwarding_tree(spoofed_source_asn),
+            )
+        )
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from bgpy.enums import PacketOutcomes
+
+
+@dataclass(frozen=True, slots=True)
+class PacketResult:
+    """Where a packet ended up, and the ASN of the AS that it ended at
+
+    (the reflector, the AS that dropped it, the last AS with a route,
+    or the lowest ASN in the loop of next hops)
+    """
+
+    outcome: PacketOutcomes
+    asn: int
@@ -87,9 +87,9 @@ class AccidentalRouteLeak(ValidPrefix):
         Since this simulator treats each propagation round as if it all happens
         at once, this is possible.
 
-        Additionally, you could also do the optimization in the first propagation
-        round to only propagate from ASes that can reach the attacker. But we'll
-        forgo this for now for simplicity.
+        Additionally, engines with reachability_pruning only propagate through
+        the ASes that can possibly receive the seeded anns. Since the graph is
+        reseeded here, that applies to both propagation rounds.
         """
 
         if propagation_round == 0:
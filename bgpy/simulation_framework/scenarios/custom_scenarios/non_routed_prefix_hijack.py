@@ -24,7 +24,7 @@ class NonRoutedPrefixHijack(Scenario):
         anns = list()
         for attacker_asn in self.attacker_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
@@ -28,7 +28,7 @@ class NonRoutedSuperprefixHijack(Scenario):
         anns = list()
         for attacker_asn in self.attacker_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.SUPERPREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
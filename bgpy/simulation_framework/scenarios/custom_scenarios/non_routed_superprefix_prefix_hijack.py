@@ -29,14 +29,14 @@ class NonRoutedSuperprefixPrefixHijack(Scenario):
         anns = list()
         for attacker_asn in self.attacker_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.SUPERPREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
                 )
             )
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
@@ -27,7 +27,7 @@ class PrefixHijack(Scenario):
         anns = list()
         for victim_asn in self.victim_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     as_path=(victim_asn,),
                     timestamp=Timestamps.VICTIM.value,
@@ -36,7 +36,7 @@ class PrefixHijack(Scenario):
 
         for attacker_asn in self.attacker_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
@@ -29,7 +29,7 @@ class SubprefixHijack(Scenario):
         anns = list()
         for victim_asn in self.victim_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     as_path=(victim_asn,),
                     timestamp=Timestamps.VICTIM.value,
@@ -38,7 +38,7 @@ class SubprefixHijack(Scenario):
 
         for attacker_asn in self.attacker_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.SUBPREFIX.value,
                     as_path=(attacker_asn,),
                     timestamp=Timestamps.ATTACKER.value,
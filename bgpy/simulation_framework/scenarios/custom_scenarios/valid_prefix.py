@@ -25,7 +25,7 @@ class ValidPrefix(Scenario):
         anns = list()
         for victim_asn in self.victim_asns:
             anns.append(
-                self.scenario_config.AnnCls(
+                self.AnnCls(
                     prefix=Prefixes.PREFIX.value,
                     next_hop_asn=victim_asn,
                     as_path=(victim_asn,),
@@ -12,6 +12,7 @@ from frozendict import frozendict
 from roa_checker import ROAChecker, ROAValidity
 
 from bgpy.simulation_engine import Announcement as Ann
+from bgpy.simulation_engine import get_roa_validity
 from bgpy.simulation_engine import BaseSimulationEngine
 from bgpy.simulation_engine import Policy
 from bgpy.enums import (
@@ -394,6 +395,17 @@ class Scenario(ABC):
 
         return self._default_adopters | self._default_non_adopters
 
+    @property
+    def AnnCls(self) -> type[Ann]:
+        """The announcement class of the scenario_config
+
+        Only None before the scenario_config's post_init picks a class
+        """
+
+        AnnCls = self.scenario_config.AnnCls
+        assert AnnCls is not None, "Set in ScenarioConfig.__post_init__"
+        return AnnCls
+
     #############################
     # Engine Manipulation Funcs #
     #############################
@@ -466,6 +478,10 @@ class Scenario(ABC):
                         {
                             "roa_valid_length": roa_valid_length,
                             "roa_origin": roa_origin,
+                            # So that ROV doesn't recompute this at every AS
+                            "roa_validity": get_roa_validity(
+                                ann.origin, roa_origin, roa_valid_length
+                            ),
                             # Must add these two since copy overwrites them by default
                             "seed_asn": ann.seed_asn,
                             "traceback_end": getattr(ann, "traceback_end", False),
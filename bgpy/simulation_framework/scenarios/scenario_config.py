@@ -7,6 +7,8 @@ from frozendict import frozendict
 from bgpy.enums import ASGroups
 
 from bgpy.simulation_engine import Announcement as Ann
+from bgpy.simulation_engine import get_ann_cls_for_policies
+from bgpy.simulation_engine import ROAAnnMixin
 from bgpy.simulation_engine import Policy
 from bgpy.simulation_engine import BGP
 
@@ -37,8 +39,10 @@ class ScenarioConfig:
     propagation_rounds: int = None  # type: ignore
     preprocess_anns_func: PREPROCESS_ANNS_FUNC_TYPE = noop
     # This is the base type of announcement for this class
-    # You can specify a different base ann
-    AnnCls: type[Ann] = Ann
+    # You can specify a different base ann. If None, a class from the
+    # announcement family with only the attrs that the policies need
+    # (plus ROA info) is set in post_init
+    AnnCls: Optional[type[Ann]] = Ann
     BasePolicyCls: type[Policy] = BGP
     # Fixed in post init, but can't show mypy for some reason
     AdoptPolicyCls: type[Policy] = MISSINGPolicy  # type: ignore
@@ -134,6 +138,27 @@ class ScenarioConfig:
         if not self.scenario_label:
             object.__setattr__(self, "scenario_label", self.AdoptPolicyCls.name)
 
+        if self.AnnCls is None:
+            AnnCls: type[Ann] = self._get_ann_family_cls()
+            object.__setattr__(self, "AnnCls", AnnCls)
+
+    def _get_ann_family_cls(self) -> type[Ann]:
+        """Returns the announcement class for the policies in this config
+
+        ROA info is always included since scenarios add it to the anns
+        """
+
+        PolicyClasses: list[type[Policy]] = [
+            self.BasePolicyCls,
+            self.AdoptPolicyCls,
+            *self.hardcoded_asn_cls_dict.values(),
+            *(self.override_non_default_asn_cls_dict or dict()).values(),
+        ]
+        if self.AttackerBasePolicyCls:
+            PolicyClasses.append(self.AttackerBasePolicyCls)
+        # The family isn't a subclass of Announcement, but has the same API
+        return get_ann_cls_for_policies(PolicyClasses, ROAAnnMixin)  # type: ignore
+
     ##############
     # Yaml Funcs #
     ##############
@@ -3,7 +3,7 @@ from itertools import product
 from multiprocessing import cpu_count
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 import random
 import os
 
@@ -66,6 +66,8 @@ class Simulation:
             }
         ),
         SimulationEngineCls: type[BaseSimulationEngine] = SimulationEngine,
+        # Such as frozendict({"incremental": True}) for the ArraySimulationEngine
+        simulation_engine_kwargs: frozendict[str, Any] = frozendict(),
         ASGraphAnalyzerCls: type[BaseASGraphAnalyzer] = ASGraphAnalyzer,
         MetricTrackerCls: type[MetricTracker] = MetricTracker,
         # Data plane tracking for traceback and MetricTrackerCls
@@ -101,6 +103,7 @@ class Simulation:
         self.ASGraphConstructorCls(**as_graph_constructor_kwargs).run()
 
         self.SimulationEngineCls: type[BaseSimulationEngine] = SimulationEngineCls
+        self.simulation_engine_kwargs: frozendict[str, Any] = simulation_engine_kwargs
 
         self.ASGraphAnalyzerCls: type[BaseASGraphAnalyzer] = ASGraphAnalyzerCls
         self.MetricTrackerCls: type[MetricTracker] = MetricTrackerCls
@@ -268,6 +271,7 @@ class Simulation:
         engine = self.SimulationEngineCls(
             as_graph,
             cached_as_graph_tsv_path=self.as_graph_constructor_kwargs.get("tsv_path"),
+            **self.simulation_engine_kwargs,
         )
 
         metric_tracker = self.MetricTrackerCls(metric_keys=self.metric_keys)
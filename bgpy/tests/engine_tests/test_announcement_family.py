@@ -0,0 +1,94 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from roa_checker import ROAValidity
+
+from bgpy.enums import Relationships
+from bgpy.simulation_engine import Announcement
+from bgpy.simulation_engine import BGPSecFull
+from bgpy.simulation_engine import CoreAnnouncement
+from bgpy.simulation_engine import get_ann_cls
+from bgpy.simulation_engine import get_ann_cls_for_policies
+from bgpy.simulation_engine import ROAAnnMixin
+from bgpy.simulation_engine import ROV
+
+from . import engine_test_configs as engine_test_configs_module
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestAnnouncementFamily:
+    """Tests that the announcement family doesn't change propagation"""
+
+    def test_copy(self):
+        """Tests that copies match Announcement copies"""
+
+        AnnCls = get_ann_cls(ROAAnnMixin)
+        kwargs = {"prefix": "1.2.0.0/16", "as_path": (1,), "roa_origin": 1}
+        ann = AnnCls(**kwargs)
+        og_ann = Announcement(**kwargs)  # type: ignore
+        for overwrite_kwargs in (
+            None,
+            {"as_path": (2, 1), "recv_relationship": Relationships.CUSTOMERS},
+            {"seed_asn": 1, "traceback_end": True},
+        ):
+            ann_copy = ann.copy(overwrite_kwargs)
+            og_ann_copy = og_ann.copy(overwrite_kwargs)
+            for name, value in ann_copy.__to_yaml_dict__().items():
+                assert getattr(og_ann_copy, name) == value
+            assert ann_copy.valid_by_roa == og_ann_copy.valid_by_roa
+        # The ROA validity cache isn't dumped
+        for cached_ann in (ann, og_ann):
+            cached_ann = cached_ann.copy({"roa_validity": ROAValidity.VALID})
+            assert "roa_validity" not in cached_ann.__to_yaml_dict__()
+        assert ann.copy() == ann
+        assert ann.copy({"timestamp": 1}) != ann
+        with pytest.raises(TypeError):
+            ann.copy({"bgpsec_as_path": (1,)})
+
+    def test_get_ann_cls_for_policies(self):
+        """Tests that the mixins of every policy in the MRO are used"""
+
+        AnnCls = get_ann_cls_for_policies((BGPSecFull, ROV))
+        assert issubclass(AnnCls, CoreAnnouncement)
+        for attr in ("bgpsec_as_path", "withdraw", "roa_origin"):
+            assert attr in AnnCls._field_indexes
+        assert "only_to_customers" not in AnnCls._field_indexes
+        assert AnnCls is get_ann_cls_for_policies((ROV, BGPSecFull))
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_announcement_family(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs the engine test configs with the family's anns and compares"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        hook = run_conf.scenario_config.ScenarioCls.post_propagation_hook
+        if hook.__module__.startswith(engine_test_configs_module.__name__):
+            # Some test configs modify anns in place, which tuples don't allow
+            pytest.skip("post_propagation_hook modifies anns")
+        family_run_conf = replace(
+            run_conf,
+            scenario_config=replace(run_conf.scenario_config, AnnCls=None),
+        )
+        engine, outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=run_conf
+        ).run_engine()
+        family_engine, family_outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=family_run_conf
+        ).run_engine()
+
+        assert family_outcomes == outcomes
+        for as_obj in engine.as_graph:
+            local_rib = as_obj.policy._local_rib
+            family_local_rib = family_engine.as_graph.as_dict[
+                as_obj.asn
+            ].policy._local_rib
+            assert local_rib.keys() == family_local_rib.keys()
+            for prefix, family_ann in family_local_rib.items():
+                assert isinstance(family_ann, CoreAnnouncement)
+                ann = local_rib.get(prefix)
+                for name, value in family_ann.__to_yaml_dict__().items():
+                    assert getattr(ann, name) == value
@@ -0,0 +1,112 @@
+from dataclasses import replace
+from pathlib import Path
+
+from frozendict import frozendict
+import pytest
+
+from bgpy.simulation_engine import ArraySimulationEngine
+from bgpy.simulation_engine import ParallelArraySimulationEngine
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+def _array_engine_supported(conf: EngineTestConfig) -> bool:
+    """Returns True if all policies in the config work with arrays"""
+
+    scenario_config = conf.scenario_config
+    policy_classes = [
+        scenario_config.BasePolicyCls,
+        scenario_config.AdoptPolicyCls,
+        *scenario_config.hardcoded_asn_cls_dict.values(),
+        *(scenario_config.override_non_default_asn_cls_dict or dict()).values(),
+    ]
+    if scenario_config.AttackerBasePolicyCls:
+        policy_classes.append(scenario_config.AttackerBasePolicyCls)
+    return all(ArraySimulationEngine.policy_supported(x) for x in policy_classes)
+
+
+@pytest.mark.engine
+class TestArraySimulationEngine:
+    """Tests that the ArraySimulationEngine matches the SimulationEngine"""
+
+    @pytest.mark.parametrize(
+        "conf", [x for x in engine_test_configs if _array_engine_supported(x)]
+    )
+    def test_array_simulation_engine(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs the engine test configs with both engines and compares"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        engine, outcomes = InMemoryEngineRunner.run(run_conf, tmp_path)
+        array_engine, array_outcomes = InMemoryEngineRunner.run(
+            replace(run_conf, SimulationEngineCls=ArraySimulationEngine), tmp_path
+        )
+        assert isinstance(array_engine, ArraySimulationEngine)
+        assert array_engine == engine
+        assert array_outcomes == outcomes
+
+    @pytest.mark.parametrize(
+        "conf", [x for x in engine_test_configs if _array_engine_supported(x)]
+    )
+    def test_parallel_array_simulation_engine(
+        self, conf: EngineTestConfig, tmp_path: Path
+    ):
+        """Runs the engine test configs split across processes and compares
+
+        Every rank is sent to the workers, no matter how small it is
+        """
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        engine, outcomes = InMemoryEngineRunner.run(run_conf, tmp_path)
+        parallel_engine, parallel_outcomes = InMemoryEngineRunner.run(
+            replace(
+                run_conf,
+                SimulationEngineCls=ParallelArraySimulationEngine,
+                simulation_engine_kwargs=frozendict(
+                    {"processes": 2, "min_parallel_edges": 0}
+                ),
+            ),
+            tmp_path,
+        )
+        assert isinstance(parallel_engine, ParallelArraySimulationEngine)
+        assert parallel_engine == engine
+        assert parallel_outcomes == outcomes
+
+    @pytest.mark.parametrize(
+        "conf", [x for x in engine_test_configs if _array_engine_supported(x)]
+    )
+    def test_incremental(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs with every AS using the base policy, then the config's policies
+
+        The second run is incremental, and must match a run from scratch
+        """
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        engine, _ = InMemoryEngineRunner.run(run_conf, tmp_path)
+
+        scenario_config = run_conf.scenario_config
+        as_graph = run_conf.ASGraphCls(
+            as_graph_info=run_conf.as_graph_info,
+            BasePolicyCls=scenario_config.BasePolicyCls,
+        )
+        array_engine = ArraySimulationEngine(as_graph, incremental=True)
+        assert scenario_config.ScenarioCls, "for mypy"
+        scenario = scenario_config.ScenarioCls(
+            scenario_config=scenario_config,
+            engine=array_engine,
+            preprocess_anns_func=scenario_config.preprocess_anns_func,
+        )
+        array_engine.setup(scenario.announcements, scenario_config.BasePolicyCls)
+        array_engine.run(propagation_round=0, scenario=scenario)
+
+        scenario.setup_engine(array_engine)
+        for round_ in range(scenario_config.propagation_rounds):
+            array_engine.run(propagation_round=round_, scenario=scenario)
+            scenario.post_propagation_hook(
+                engine=array_engine,
+                propagation_round=round_,
+                trial=0,
+                percent_adopt=0,
+            )
+        assert array_engine == engine
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from bgpy.enums import Relationships, ROAValidity
+from bgpy.simulation_engine import Announcement
+from bgpy.simulation_engine import get_ann_cls
+from bgpy.simulation_engine import InternedPathAnnouncement
+from bgpy.simulation_engine import RIBsIn
+from bgpy.simulation_engine import ROAAnnMixin
+from bgpy.simulation_engine import SendQueue
+from bgpy.simulation_engine import WithdrawAnnMixin
+from bgpy.utils import BinaryCodec
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestBinaryCodec:
+    """Tests that the BinaryCodec round trips anns, RIBs, and engines"""
+
+    def test_anns(self):
+        """Tests every kind of ann, and values that aren't in anns"""
+
+        kwargs = {
+            "prefix": "1.2.0.0/16",
+            "as_path": (4_200_000_000, 2, 1),
+            "next_hop_asn": 4_200_000_000,
+            "recv_relationship": Relationships.CUSTOMERS,
+            "roa_origin": 1,
+            "roa_valid_length": True,
+            "roa_validity": ROAValidity.VALID,
+        }
+        anns = [
+            Announcement(**kwargs),  # type: ignore
+            InternedPathAnnouncement(**kwargs),  # type: ignore
+            get_ann_cls(ROAAnnMixin, WithdrawAnnMixin)(**kwargs),
+        ]
+        obj = {
+            "anns": anns,
+            "other": (-1, 0.5, "", None, frozenset({(1, -2)}), [{3: {4}}]),
+        }
+        decoded = BinaryCodec().loads(BinaryCodec().dumps(obj))
+        assert decoded == obj
+        for ann, decoded_ann in zip(anns, decoded["anns"]):
+            assert decoded_ann.__class__ is ann.__class__
+            assert decoded_ann.roa_validity == ann.roa_validity
+
+    def test_ann_containers(self, tmp_path: Path):
+        """Tests the containers that hold other dataclasses"""
+
+        ann = Announcement(prefix="1.2.0.0/16", as_path=(2, 1), next_hop_asn=2)
+        ribs_in = RIBsIn()
+        ribs_in.add_unprocessed_ann(ann, Relationships.PEERS)
+        send_q = SendQueue()
+        send_q.add_ann(3, ann)
+        path = tmp_path / "containers.bin"
+        BinaryCodec().dump([ribs_in, send_q], path)
+        decoded_ribs_in, decoded_send_q = BinaryCodec().load(path)
+        assert decoded_ribs_in.data == ribs_in.data
+        assert decoded_send_q.data == send_q.data
+
+    def test_not_encodable(self):
+        with pytest.raises(TypeError):
+            BinaryCodec().dumps(object())
+
+    def test_not_loadable(self):
+        """Tests that classes outside of bgpy aren't imported"""
+
+        data = BinaryCodec().dumps(OrderedDict)
+        with pytest.raises(ValueError):
+            BinaryCodec().loads(data)
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_engine_snapshot(self, conf: EngineTestConfig, tmp_path: Path):
+        """Restores the RIBs of every engine test into a fresh engine"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        engine, _, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=run_conf
+        ).run_engine()
+        path = tmp_path / "engine.bin"
+        BinaryCodec().dump_engine(engine, path)
+
+        fresh_engine, _, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=run_conf
+        ).run_engine()
+        for as_obj in fresh_engine.as_graph:
+            as_obj.policy = as_obj.policy.__class__(as_=as_obj)
+        BinaryCodec().load_engine(fresh_engine, path)
+
+        assert fresh_engine == engine
+        for as_obj in fresh_engine.as_graph:
+            assert as_obj.policy.as_.asn == as_obj.asn
+            assert as_obj.policy.__to_yaml_dict__() == (
+                engine.as_graph.as_dict[as_obj.asn].policy.__to_yaml_dict__()
+            )
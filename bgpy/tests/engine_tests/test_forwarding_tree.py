@@ -0,0 +1,156 @@
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from bgpy.as_graphs import ASGraphInfo
+from bgpy.as_graphs import CAIDAASGraph
+from bgpy.as_graphs.base.links import CustomerProviderLink as CPLink
+from bgpy.enums import Relationships
+from bgpy.simulation_engine import Announcement
+from bgpy.simulation_engine import ForwardingTree
+from bgpy.simulation_engine import SimulationEngine
+from bgpy.simulation_engine import StrictuRPF
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestForwardingTree:
+    """Tests that forwarding tree queries match following every next hop"""
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_forwarding_tree(self, conf: EngineTestConfig, tmp_path: Path):
+        """Checks every query on the prefix and origin trees of a run"""
+
+        engine, _, _, scenario = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=InMemoryEngineRunner.get_run_config(conf)
+        ).run_engine()
+        prefixes = tuple(scenario.ordered_prefix_subprefix_dict)
+        tree = engine.get_forwarding_tree(prefixes)
+        # Only built once per run
+        assert engine.get_forwarding_tree(prefixes) is tree
+        for as_obj in engine.as_graph:
+            local_rib = as_obj.policy._local_rib
+            expected = next(
+                (local_rib.get(x) for x in prefixes if x in local_rib), None
+            )
+            assert tree.get_route(as_obj.asn) is expected
+        self._assert_queries_match(engine, tree)
+
+        origins = {
+            ann.origin
+            for as_obj in engine.as_graph
+            for ann in as_obj.policy._local_rib.values()
+        }
+        for origin in origins:
+            origin_tree = engine.get_origin_forwarding_tree(origin)
+            for as_obj in engine.as_graph:
+                routes = [
+                    x for x in as_obj.policy._local_rib.values() if x.origin == origin
+                ]
+                expected = routes[-1] if routes else None
+                assert origin_tree.get_route(as_obj.asn) is expected
+            self._assert_queries_match(engine, origin_tree)
+            self._assert_strict_urpf_matches(engine, origin, origin_tree)
+
+        engine.clear_forwarding_trees()
+        assert engine.get_forwarding_tree(prefixes) is not tree
+
+    def test_loop(self):
+        """Tests paths that run into a loop"""
+
+        engine = SimulationEngine(
+            CAIDAASGraph(
+                ASGraphInfo(
+                    customer_provider_links=frozenset(
+                        CPLink(customer_asn=asn, provider_asn=asn + 1)
+                        for asn in range(1, 5)
+                    )
+                )
+            )
+        )
+        # 1 -> 2 -> 3 -> 4 -> 3, 5 has no route
+        next_hop_asns: dict[int, int] = {1: 2, 2: 3, 3: 4, 4: 3}
+        routes: list[Optional[Announcement]] = list()
+        for as_obj in engine.as_graph:
+            next_hop_asn = next_hop_asns.get(as_obj.asn)
+            if next_hop_asn is None:
+                routes.append(None)
+            else:
+                routes.append(
+                    Announcement(
+                        prefix="1.2.0.0/16",
+                        as_path=(as_obj.asn, 777),
+                        next_hop_asn=next_hop_asn,
+                        recv_relationship=Relationships.CUSTOMERS,
+                    )
+                )
+        tree = ForwardingTree.from_routes(engine.as_graph, routes)
+        assert tree.get_path(1) == (1, 2, 3, 4)
+        assert tree.get_path(4) == (4, 3)
+        assert tree.get_path(5) == (5,)
+        assert tree.in_subtree(1, 4)
+        assert not tree.in_subtree(3, 1)
+        assert tree.get_first_on_path(1, tree.get_mask([4])) == 4
+        assert tree.get_first_on_path(1, tree.get_mask([5])) is None
+        self._assert_queries_match(engine, tree)
+
+    def _assert_queries_match(
+        self, engine: SimulationEngine, tree: ForwardingTree
+    ) -> None:
+        """Compares every query to following the next hops one at a time"""
+
+        asns = [as_obj.asn for as_obj in engine.as_graph]
+        paths = {asn: self._trace(tree, asn) for asn in asns}
+        # Every other AS, by index
+        mask = np.arange(len(asns)) % 2 == 1
+        first_idxs = tree.get_first_on_path_idxs(mask)
+        for i, asn in enumerate(asns):
+            path = paths[asn]
+            assert tree.get_path(asn) == path
+            assert tree.get_next_hop_asn(asn) == (path[1] if len(path) > 1 else None)
+            for root_asn in asns:
+                assert tree.in_subtree(asn, root_asn) == (root_asn in path)
+            firsts = [x for x in path if mask[tree.as_indexes[x]]]
+            first = firsts[0] if firsts else None
+            assert tree.get_first_on_path(asn, mask) == first
+            assert first_idxs[i] == (-1 if first is None else tree.as_indexes[first])
+        # Every AS comes after its next hop
+        positions = {idx: i for i, idx in enumerate(tree.order.tolist())}
+        for idx, position in positions.items():
+            next_hop = int(tree.next_hops[idx])
+            assert next_hop == -1 or positions[next_hop] < position
+
+    def _assert_strict_urpf_matches(
+        self, engine: SimulationEngine, source: int, source_tree: ForwardingTree
+    ) -> None:
+        """Validates every packet from the source with and without the tree"""
+
+        for as_obj in engine.as_graph:
+            for neighbor in as_obj.neighbors:
+                args = (as_obj.policy, as_obj, neighbor, source)
+                try:
+                    valid = StrictuRPF.validate(*args)  # type: ignore
+                # No route to the source
+                except TypeError:
+                    with pytest.raises(TypeError):
+                        StrictuRPF.validate_with_forwarding_tree(*args, source_tree)
+                    continue
+                assert (
+                    StrictuRPF.validate_with_forwarding_tree(*args, source_tree)
+                    == valid
+                )
+
+    def _trace(self, tree: ForwardingTree, asn: int) -> tuple[int, ...]:
+        """Follows the next hop of every route until the path ends or loops"""
+
+        path = [asn]
+        while True:
+            ann = tree.get_route(path[-1])
+            if ann is None or ann.next_hop_asn in path:
+                return tuple(path)
+            path.append(ann.next_hop_asn)
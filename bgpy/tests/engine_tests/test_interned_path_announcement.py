@@ -0,0 +1,72 @@
+from dataclasses import replace
+from pathlib import Path
+import pickle
+
+import pytest
+
+from bgpy.simulation_engine import InternedASPath
+from bgpy.simulation_engine import InternedPathAnnouncement
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestInternedPathAnnouncement:
+    """Tests that interned AS paths don't change propagation"""
+
+    def test_interned_as_path(self):
+        """Tests that InternedASPaths act like the equivalent tuples"""
+
+        as_path = (3, 2) + InternedASPath((1,))
+        assert isinstance(as_path, InternedASPath)
+        assert as_path == (3, 2, 1)
+        assert hash(as_path) == hash((3, 2, 1))
+        assert len(as_path) == 3
+        assert [as_path[i] for i in range(-3, 3)] == [3, 2, 1, 3, 2, 1]
+        assert as_path[::-1] == (1, 2, 3)
+        assert 2 in as_path and 4 not in as_path
+        assert tuple(as_path) == (3, 2, 1)
+
+    def test_interning(self):
+        """Tests that equal paths are the same object, sharing their tails"""
+
+        as_path = (3, 2) + InternedASPath((1,))
+        assert as_path is InternedASPath((3, 2, 1))
+        assert as_path._tail is (2,) + InternedASPath((1,))
+        assert as_path.path_id != InternedASPath((3, 1)).path_id
+        assert as_path != InternedASPath((3, 1))
+        assert InternedASPath(()) is InternedASPath(()) and not InternedASPath(())
+        assert pickle.loads(pickle.dumps(as_path)) is as_path
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_interned_path_announcement(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs the engine test configs with interned announcements and compares"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        interned_run_conf = replace(
+            run_conf,
+            scenario_config=replace(
+                run_conf.scenario_config, AnnCls=InternedPathAnnouncement
+            ),
+        )
+        engine, outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=run_conf
+        ).run_engine()
+        interned_engine, interned_outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=interned_run_conf
+        ).run_engine()
+
+        assert interned_outcomes == outcomes
+        for as_obj in engine.as_graph:
+            interned_local_rib = interned_engine.as_graph.as_dict[
+                as_obj.asn
+            ].policy._local_rib
+            assert {
+                prefix: ann.__to_yaml_dict__()
+                for prefix, ann in interned_local_rib.items()
+            } == {
+                prefix: ann.__to_yaml_dict__()
+                for prefix, ann in as_obj.policy._local_rib.items()
+            }
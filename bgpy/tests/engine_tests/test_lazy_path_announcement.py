@@ -0,0 +1,57 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from bgpy.simulation_engine import LazyASPath
+from bgpy.simulation_engine import LazyPathAnnouncement
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestLazyPathAnnouncement:
+    """Tests that lazy AS paths don't change propagation"""
+
+    def test_lazy_as_path(self):
+        """Tests that LazyASPaths act like the equivalent tuples"""
+
+        as_path = (3, 2) + LazyASPath((1,))
+        assert isinstance(as_path, LazyASPath)
+        assert as_path == (3, 2, 1)
+        assert hash(as_path) == hash((3, 2, 1))
+        assert len(as_path) == 3
+        assert [as_path[i] for i in range(-3, 3)] == [3, 2, 1, 3, 2, 1]
+        assert as_path[::-1] == (1, 2, 3)
+        assert 2 in as_path and 4 not in as_path
+        assert tuple(as_path) == (3, 2, 1)
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_lazy_path_announcement(self, conf: EngineTestConfig, tmp_path: Path):
+        """Runs the engine test configs with lazy announcements and compares"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        lazy_run_conf = replace(
+            run_conf,
+            scenario_config=replace(
+                run_conf.scenario_config, AnnCls=LazyPathAnnouncement
+            ),
+        )
+        engine, outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=run_conf
+        ).run_engine()
+        lazy_engine, lazy_outcomes, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=lazy_run_conf
+        ).run_engine()
+
+        assert lazy_outcomes == outcomes
+        for as_obj in engine.as_graph:
+            lazy_local_rib = lazy_engine.as_graph.as_dict[as_obj.asn].policy._local_rib
+            assert {
+                prefix: ann.__to_yaml_dict__() for prefix, ann in lazy_local_rib.items()
+            } == {
+                prefix: ann.__to_yaml_dict__()
+                for prefix, ann in as_obj.policy._local_rib.items()
+            }
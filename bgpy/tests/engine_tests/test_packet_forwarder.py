@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+from bgpy.as_graphs import AS
+from bgpy.enums import PacketOutcomes
+from bgpy.simulation_engine import BaseSAVPolicy
+from bgpy.simulation_engine import SimulationEngine
+from bgpy.simulation_engine import FeasiblePathuRPF
+from bgpy.simulation_engine import OriginIndexedLocalRIB
+from bgpy.simulation_framework import PacketForwarder
+from bgpy.simulation_framework import PacketResult
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+class EvenPrevHopSAV(BaseSAVPolicy):
+    """Only accepts packets from even ASNs, whatever the RIBs hold"""
+
+    name: str = "Even prev hop"
+
+    def validate(self, as_obj, prev_hop, source):  # type: ignore
+        return prev_hop.asn % 2 == 0
+
+
+@pytest.mark.engine
+class TestPacketForwarder:
+    """Tests that forwarding with shared results matches tracing every hop"""
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_forward(self, conf: EngineTestConfig, tmp_path: Path):
+        """Forwards a packet between every pair of ASes, from every origin"""
+
+        engine, _, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=InMemoryEngineRunner.get_run_config(conf)
+        ).run_engine()
+        as_graph = engine.as_graph
+        asns = [as_obj.asn for as_obj in as_graph]
+        sources = {
+            ann.origin
+            for as_obj in as_graph
+            for ann in as_obj.policy._local_rib.values()
+        }
+
+        SAVCls: type[BaseSAVPolicy] = EvenPrevHopSAV
+        if all(hasattr(as_obj.policy, "_ribs_in") for as_obj in as_graph):
+            SAVCls = FeasiblePathuRPF
+        for as_obj in as_graph.ases[::2]:
+            as_obj.policy.source_address_validation_policy = SAVCls
+
+        results = PacketForwarder(engine).forward(asns, sources, asns)
+        assert len(results) == len(asns) ** 2 * len(sources)
+        for packet, result in results.items():
+            assert result == self._trace(engine, *packet), packet
+
+        # Same results with origin indexes
+        for as_obj in as_graph:
+            as_obj.policy._local_rib = OriginIndexedLocalRIB(as_obj.policy._local_rib)
+        engine.clear_forwarding_trees()
+        assert PacketForwarder(engine).forward(asns, sources, asns) == results
+
+    def _trace(
+        self,
+        engine: SimulationEngine,
+        attacker_asn: int,
+        source_asn: int,
+        reflector_asn: int,
+    ) -> PacketResult:
+        """Follows the packet one hop at a time without sharing anything"""
+
+        as_dict = engine.as_graph.as_dict
+        as_obj: AS = as_dict[attacker_asn]
+        visited: list[int] = list()
+        while True:
+            if visited:
+                prev_hop = as_dict[visited[-1]]
+                if not as_obj.policy.source_address_validation(  # type: ignore
+                    as_obj, prev_hop, source_asn
+                ):
+                    return PacketResult(PacketOutcomes.DROPPED_BY_SAV, as_obj.asn)
+            if as_obj.asn in visited:
+                loop_asns = visited[visited.index(as_obj.asn) :]
+                return PacketResult(PacketOutcomes.LOOP, min(loop_asns))
+            visited.append(as_obj.asn)
+            if as_obj.asn == reflector_asn:
+                return PacketResult(PacketOutcomes.DELIVERED, as_obj.asn)
+            routes = [
+                x
+                for x in as_obj.policy._local_rib.values()
+                if x.origin == reflector_asn
+            ]
+            if not routes or routes[-1].next_hop_asn == as_obj.asn:
+                return PacketResult(PacketOutcomes.DISCONNECTED, as_obj.asn)
+            as_obj = as_dict[routes[-1].next_hop_asn]
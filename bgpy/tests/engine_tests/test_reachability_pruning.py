@@ -0,0 +1,61 @@
+import pytest
+
+from bgpy.as_graphs import ASGraphInfo
+from bgpy.as_graphs import CAIDAASGraph
+from bgpy.as_graphs.base.links import CustomerProviderLink as CPLink
+from bgpy.as_graphs.base.links import PeerLink
+from bgpy.simulation_engine import SimulationEngine
+
+
+@pytest.mark.engine
+class TestReachabilityPruning:
+    """Tests the ASes that reachability pruning keeps"""
+
+    def test_get_reachable_ases(self):
+        """Tests the ASes kept in each phase for a seed at AS 1
+
+        1 -> 2 -> 4 are the provider cone of 1. 2 peers with 5. The
+        customer cones of those are 3, 8 (through 4) and 9 (through 5).
+        6 (provider of 5, which only has a peer route), 7 (peer of 6),
+        10 (customer of 6) and 11 (provider of 3, which only has a
+        provider route) never get the anns
+        """
+
+        engine = SimulationEngine(
+            CAIDAASGraph(
+                ASGraphInfo(
+                    customer_provider_links=frozenset(
+                        CPLink(customer_asn=customer_asn, provider_asn=provider_asn)
+                        for customer_asn, provider_asn in (
+                            (1, 2),
+                            (2, 4),
+                            (3, 4),
+                            (8, 3),
+                            (3, 11),
+                            (9, 5),
+                            (5, 6),
+                            (10, 6),
+                        )
+                    ),
+                    peer_links=frozenset((PeerLink(2, 5), PeerLink(6, 7))),
+                )
+            ),
+            reachability_pruning=True,
+        )
+        up_ranks, peer_ases, down_ranks = engine._get_reachable_ases(frozenset({1}))
+
+        # Ranks are kept, so that rank indexes don't change
+        num_ranks = len(engine.as_graph.propagation_ranks)
+        assert len(up_ranks) == len(down_ranks) == num_ranks
+        for ranks in (up_ranks, down_ranks):
+            for as_objs, rank in zip(ranks, engine.as_graph.propagation_ranks):
+                assert set(as_objs) <= set(rank)
+
+        def get_asns(as_objs) -> set[int]:
+            return {as_obj.asn for as_obj in as_objs}
+
+        up_asns = get_asns(x for rank in up_ranks for x in rank)
+        down_asns = get_asns(x for rank in down_ranks for x in rank)
+        assert up_asns == {1, 2, 4}
+        assert get_asns(peer_ases) == {1, 2, 4, 5}
+        assert down_asns == {1, 2, 3, 4, 5, 8, 9}
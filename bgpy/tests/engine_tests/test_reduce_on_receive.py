@@ -0,0 +1,38 @@
+import pytest
+
+from bgpy.enums import Prefixes, Relationships
+from bgpy.simulation_engine import Announcement
+from bgpy.simulation_engine import BestRecvQueue
+from bgpy.simulation_engine import BGP
+from bgpy.simulation_engine import BGPFull
+from bgpy.simulation_engine import ROV
+
+
+@pytest.mark.engine
+class TestReduceOnReceive:
+    """Tests the BestRecvQueue that reduce_on_receive gives policies"""
+
+    def test_best_recv_q(self):
+        """Tests that ties keep the first ann, like processing the full list"""
+
+        anns = [
+            Announcement(
+                prefix=Prefixes.PREFIX.value,
+                as_path=(asn, 1),
+                next_hop_asn=asn,
+                recv_relationship=Relationships.CUSTOMERS,
+            )
+            for asn in (2, 3, 4)
+        ]
+        recv_q = BestRecvQueue()
+        recv_q.add_best_ann(anns[0], 1)
+        recv_q.add_best_ann(anns[1], 2)
+        recv_q.add_best_ann(anns[2], 2)
+        assert recv_q.get_ann_list(Prefixes.PREFIX.value) == [anns[1]]
+        recv_q.clear()
+        assert not recv_q and not recv_q.keys_by_prefix
+
+    def test_best_recv_q_supported(self):
+        assert BGP.best_recv_q_supported()
+        assert ROV.best_recv_q_supported()
+        assert not BGPFull.best_recv_q_supported()
@@ -0,0 +1,83 @@
+from dataclasses import replace
+from pathlib import Path
+
+from frozendict import frozendict
+import pytest
+
+from bgpy.enums import Prefixes, Relationships
+from bgpy.simulation_engine import Announcement
+from bgpy.simulation_engine import LocalRIB
+from bgpy.simulation_engine import LocalRIBView
+from bgpy.simulation_engine import RIBStore
+from bgpy.utils import BinaryCodec
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestRIBStore:
+    """Tests the RIBStore and the LocalRIBViews into it"""
+
+    def test_local_rib_view(self):
+        """Tests that the views act like LocalRIBs and share the store"""
+
+        anns = [
+            Announcement(
+                prefix=prefix,
+                as_path=(1,),
+                recv_relationship=Relationships.ORIGIN,
+            )
+            for prefix in (Prefixes.PREFIX.value, Prefixes.SUBPREFIX.value)
+        ]
+        rib_store = RIBStore(3)
+        view = rib_store.local_ribs[1]
+        local_rib = LocalRIB()
+        for rib in (view, local_rib):
+            for ann in anns:
+                rib.add_ann(ann)
+            rib.pop(Prefixes.PREFIX.value)
+        assert view == local_rib
+        assert list(view.items()) == list(local_rib.items())
+        assert Prefixes.SUBPREFIX.value in view
+        assert Prefixes.PREFIX.value not in view
+        assert view.get(Prefixes.PREFIX.value) is None
+        assert len(view) == 1
+        assert not rib_store.local_ribs[0]
+        assert rib_store.get_column(Prefixes.SUBPREFIX.value) == [None, anns[1], None]
+        assert isinstance(view.copy(), LocalRIB)
+        assert not isinstance(view.copy(), LocalRIBView)
+
+        columns = rib_store.columns
+        rib_store.clear()
+        assert not view
+        assert rib_store.get_column(Prefixes.SUBPREFIX.value) is None
+        # Columns are reused after clearing
+        view.add_ann(anns[0])
+        assert rib_store.columns is columns
+        assert len(columns) == 2
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_rib_store_restore(self, conf: EngineTestConfig, tmp_path: Path):
+        """Tests that restored policies get moved into the store"""
+
+        engine, _ = InMemoryEngineRunner.run(
+            replace(
+                InMemoryEngineRunner.get_run_config(conf),
+                simulation_engine_kwargs=frozendict({"use_rib_store": True}),
+            ),
+            tmp_path,
+        )
+        assert engine.rib_store is not None, "mypy type check"
+        local_ribs = {
+            as_obj.asn: as_obj.policy._local_rib.copy() for as_obj in engine.as_graph
+        }
+
+        path = tmp_path / "engine.bin"
+        BinaryCodec().dump_engine(engine, path)
+        engine.rib_store.clear()
+        BinaryCodec().load_engine(engine, path)
+        for as_obj in engine.as_graph:
+            assert isinstance(as_obj.policy._local_rib, LocalRIBView)
+            assert as_obj.policy._local_rib == local_ribs[as_obj.asn]
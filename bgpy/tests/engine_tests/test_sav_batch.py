@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from bgpy.as_graphs import ASGraph
+from bgpy.simulation_engine import BaseSAVPolicy
+from bgpy.simulation_engine import EnhancedFeasiblePath
+from bgpy.simulation_engine import FeasiblePathuRPF
+from bgpy.simulation_engine import OriginIndexedLocalRIB
+from bgpy.simulation_engine import StrictuRPF
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestSAVBatch:
+    """Tests that validate_batch agrees with validating one packet at a time"""
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    def test_validate_batch(self, conf: EngineTestConfig, tmp_path: Path):
+        """Validates every (AS, neighbor, source) packet both ways"""
+
+        engine, _, _, _ = InMemoryEngineRunner(
+            base_dir=tmp_path, conf=InMemoryEngineRunner.get_run_config(conf)
+        ).run_engine()
+        as_graph = engine.as_graph
+        # Every origin, and a (32 bit) ASN that isn't in the graph
+        sources = {
+            ann.origin
+            for as_obj in as_graph
+            for ann in as_obj.policy._local_rib.values()
+        } | {4_200_000_000}
+
+        SAVClses: list[type[BaseSAVPolicy]] = [StrictuRPF]
+        if all(hasattr(as_obj.policy, "_ribs_in") for as_obj in as_graph):
+            SAVClses.extend([FeasiblePathuRPF, EnhancedFeasiblePath])
+        for SAVCls in SAVClses:
+            self._assert_batch_matches(SAVCls, as_graph, sources)
+
+        # Strict uRPF with origin indexes
+        for as_obj in as_graph:
+            as_obj.policy._local_rib = OriginIndexedLocalRIB(as_obj.policy._local_rib)
+        self._assert_batch_matches(StrictuRPF, as_graph, sources)
+
+    def _assert_batch_matches(
+        self, SAVCls: type[BaseSAVPolicy], as_graph: ASGraph, sources: set[int]
+    ) -> None:
+        """Validates every packet that validate doesn't raise on both ways"""
+
+        packets = list()
+        expected = list()
+        for as_obj in as_graph:
+            for neighbor in as_obj.neighbors:
+                for source in sorted(sources):
+                    try:
+                        valid = SAVCls.validate(  # type: ignore
+                            as_obj.policy, as_obj, neighbor, source
+                        )
+                    # Strict uRPF with no route to the source
+                    except TypeError:
+                        with pytest.raises(TypeError):
+                            SAVCls.validate_batch(
+                                as_graph, [as_obj.asn], [source], [neighbor.asn]
+                            )
+                        continue
+                    packets.append((as_obj.asn, source, neighbor.asn))
+                    expected.append(valid)
+        reflector_asns, source_asns, prev_hop_asns = zip(*packets)
+        valid_arr = SAVCls.validate_batch(
+            as_graph, reflector_asns, source_asns, prev_hop_asns
+        )
+        assert valid_arr.dtype == np.bool_
+        assert valid_arr.tolist() == expected
@@ -0,0 +1,47 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from frozendict import frozendict
+import pytest
+
+from .engine_test_configs import engine_test_configs
+from .utils import EngineTestConfig
+from .utils import InMemoryEngineRunner
+
+
+@pytest.mark.engine
+class TestSimulationEngineKwargs:
+    """Tests that the SimulationEngine's optimizations don't change anything"""
+
+    @pytest.mark.parametrize("conf", engine_test_configs)
+    @pytest.mark.parametrize(
+        "simulation_engine_kwargs",
+        (
+            {"worklists": True},
+            {"reachability_pruning": True},
+            {"reduce_on_receive": True},
+            {"use_rib_store": True},
+        ),
+    )
+    def test_simulation_engine_kwargs(
+        self,
+        conf: EngineTestConfig,
+        simulation_engine_kwargs: dict[str, Any],
+        tmp_path: Path,
+    ):
+        """Runs the engine test configs with and without the kwargs and compares"""
+
+        run_conf = InMemoryEngineRunner.get_run_config(conf)
+        engine, outcomes = InMemoryEngineRunner.run(run_conf, tmp_path)
+        kwargs_engine, kwargs_outcomes = InMemoryEngineRunner.run(
+            replace(
+                run_conf,
+                simulation_engine_kwargs=frozendict(simulation_engine_kwargs),
+            ),
+            tmp_path,
+        )
+        for name, value in simulation_engine_kwargs.items():
+            assert kwargs_engine.__to_yaml_dict__()[name] == value
+        assert kwargs_engine == engine
+        assert kwargs_outcomes == outcomes
@@ -0,0 +1,117 @@
+from frozendict import frozendict
+import pytest
+
+from bgpy.as_graphs import ASGraphInfo
+from bgpy.as_graphs import CAIDAASGraph
+from bgpy.as_graphs.base.links import CustomerProviderLink as CPLink
+from bgpy.as_graphs.base.links import PeerLink
+from bgpy.enums import Relationships
+from bgpy.simulation_engine import BGP
+from bgpy.simulation_engine import SimulationEngine
+from bgpy.simulation_framework import ScenarioConfig
+from bgpy.simulation_framework import ValidPrefix
+
+
+class VisitRecordingBGP(BGP):
+    """BGP that records every call to process_incoming_anns"""
+
+    name: str = "Visit Recording BGP"
+    # (ASN, relationship, whether anns were queued) of every visit
+    visits: list[tuple[int, Relationships, bool]] = list()
+
+    def process_incoming_anns(self, *, from_rel, **kwargs) -> None:  # type: ignore
+        self.visits.append((self.as_.asn, from_rel, bool(self._recv_q)))
+        super().process_incoming_anns(from_rel=from_rel, **kwargs)
+
+
+@pytest.mark.engine
+class TestWorklists:
+    """Tests that only the ASes that received anns are visited"""
+
+    def test_recv_worklist(self):
+        """Tests that after one rank, only the receivers are on the worklist"""
+
+        engine = self._get_engine()
+        scenario = self._get_scenario(engine)
+        engine.setup(scenario.announcements, BGP)
+        worklist = engine._recv_worklist
+        for as_obj in engine.as_graph:
+            assert as_obj.policy.recv_worklist is worklist
+        assert not any(worklist)
+
+        # AS 1 is the only AS with anns in the first rank
+        engine.as_graph.as_dict[1].policy.propagate_to_providers()
+        assert [set(x) for x in worklist] == [
+            {2} if i == engine.as_graph.as_dict[2].propagation_rank else set()
+            for i in range(len(worklist))
+        ]
+
+    def test_worklist_visits(self):
+        """Tests that ASes with nothing queued are never visited"""
+
+        engine = self._get_engine()
+        scenario = self._get_scenario(engine)
+        engine.setup(scenario.announcements, VisitRecordingBGP)
+        VisitRecordingBGP.visits.clear()
+        engine.run(propagation_round=0, scenario=scenario)
+
+        visits = list(VisitRecordingBGP.visits)
+        assert all(queued for _, _, queued in visits)
+        assert {(asn, from_rel) for asn, from_rel, _ in visits} == {
+            (2, Relationships.CUSTOMERS),
+            (4, Relationships.CUSTOMERS),
+            (5, Relationships.PEERS),
+            (1, Relationships.PROVIDERS),
+            (2, Relationships.PROVIDERS),
+            (3, Relationships.PROVIDERS),
+            (8, Relationships.PROVIDERS),
+            (9, Relationships.PROVIDERS),
+        }
+        # Every AS with a route was visited (or seeded)
+        for as_obj in engine.as_graph:
+            has_route = bool(as_obj.policy._local_rib)
+            assert has_route == (as_obj.asn in {1, 2, 3, 4, 5, 8, 9})
+
+    def _get_engine(self) -> SimulationEngine:
+        """Returns an engine with worklists for a graph seeded at AS 1
+
+        1 -> 2 -> 4 are providers, 2 peers with 5, 4 has the customer 3
+        (with the customer 8) and 5 has the customer 9. 6, 7, 10 and 11
+        never get the anns
+        """
+
+        return SimulationEngine(
+            CAIDAASGraph(
+                ASGraphInfo(
+                    customer_provider_links=frozenset(
+                        CPLink(customer_asn=customer_asn, provider_asn=provider_asn)
+                        for customer_asn, provider_asn in (
+                            (1, 2),
+                            (2, 4),
+                            (3, 4),
+                            (8, 3),
+                            (3, 11),
+                            (9, 5),
+                            (5, 6),
+                            (10, 6),
+                        )
+                    ),
+                    peer_links=frozenset((PeerLink(2, 5), PeerLink(6, 7))),
+                )
+            ),
+            worklists=True,
+        )
+
+    def _get_scenario(self, engine: SimulationEngine) -> ValidPrefix:
+        """Returns a valid prefix scenario with AS 1 as the victim"""
+
+        return ValidPrefix(
+            scenario_config=ScenarioConfig(
+                ScenarioCls=ValidPrefix,
+                BasePolicyCls=VisitRecordingBGP,
+                override_victim_asns=frozenset({1}),
+                override_attacker_asns=frozenset(),
+                override_non_default_asn_cls_dict=frozendict(),
+            ),
+            engine=engine,
+        )
@@ -3,9 +3,11 @@ from .engine_test_config import EngineTestConfig
 
 # mypy explodes on this line for some reason
 from .engine_tester import EngineTester  # type: ignore
+from .in_memory_engine_runner import InMemoryEngineRunner
 
 __all__ = [
     "DiagramAggregator",
     "EngineTestConfig",
     "EngineTester",
+    "InMemoryEngineRunner",
 ]
@@ -0,0 +1,42 @@
+from dataclasses import fields
+from pathlib import Path
+
+from bgpy.simulation_engine import BaseSimulationEngine
+from bgpy.utils import EngineRunConfig
+from bgpy.utils import EngineRunner
+
+from .engine_test_config import EngineTestConfig
+
+
+class InMemoryEngineRunner(EngineRunner):
+    """Runs the engine without writing YAML or diagrams
+
+    Useful for comparing different engines or announcement classes
+    against each other using the engine test configs
+    """
+
+    @staticmethod
+    def get_run_config(conf: EngineTestConfig) -> EngineRunConfig:
+        """Returns an EngineRunConfig that can be replaced freely
+
+        Test configs can't be replaced since their names must be unique
+        """
+
+        return EngineRunConfig(
+            **{x.name: getattr(conf, x.name) for x in fields(EngineRunConfig)}
+        )
+
+    @classmethod
+    def run(
+        cls, conf: EngineRunConfig, base_dir: Path
+    ) -> tuple[BaseSimulationEngine, dict[int, int]]:
+        """Returns the engine and outcomes after a run"""
+
+        engine, outcomes, _, _ = cls(base_dir=base_dir, conf=conf).run_engine()
+        return engine, outcomes
+
+    def _store_data(self, *args, **kwargs) -> None:
+        pass
+
+    def _generate_diagrams(self, *args, **kwargs) -> None:  # type: ignore
+        pass
@@ -0,0 +1,164 @@
+from copy import copy
+from pathlib import Path
+import random
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from bgpy.enums import Prefixes, Relationships
+from bgpy.simulation_engine import Announcement, LocalRIB, RIBsIn, RIBsOut
+from bgpy.simulation_engine import OriginIndexedLocalRIB, SendQueue, StrictuRPF
+from bgpy.simulation_engine.ann_containers.ann_container import AnnContainer
+from bgpy.simulation_engine.ann_containers.ann_container import DictAnnContainer
+from bgpy.simulation_engine.ann_containers.ann_container import (
+    UserDictAnnContainer,
+)
+from bgpy.utils import SimulatorCodec
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestAnnContainers:
+    def test_same_api(self):
+        """Tests that the dict container acts just like the UserDict one"""
+
+        results = list()
+        for Cls in (DictAnnContainer, UserDictAnnContainer):
+            container = Cls({1: "a"}, b=2)
+            container[3] = "c"
+            del container[1]
+            container.update({4: "d"})
+            results.append(
+                (
+                    dict(container),
+                    len(container),
+                    list(container),
+                    3 in container,
+                    container.get(5),
+                    container.get(5, "e"),
+                    list(container.keys()),
+                    list(container.values()),
+                    list(container.items()),
+                    container.setdefault(5, "e"),
+                    container.pop(5),
+                    container.pop(5, None),
+                    container.popitem(),
+                    dict(container.copy()),
+                    dict(copy(container)),
+                    container == {"b": 2, 3: "c"},
+                    container == Cls({"b": 2, 3: "c"}),
+                    str(container),
+                )
+            )
+            container.clear()
+            assert not container
+        assert results[0] == results[1]
+
+    def test_subclasses(self):
+        """Tests that the containers use the CPython implementation"""
+
+        assert AnnContainer is DictAnnContainer
+        assert LocalRIB in AnnContainer.subclasses
+        assert DictAnnContainer not in AnnContainer.subclasses
+        # Slots, not a __dict__
+        with pytest.raises(AttributeError):
+            LocalRIB().not_an_attr = 1  # type: ignore
+
+    def test_yaml(self, tmp_path: Path):
+        """Tests that containers round trip through the SimulatorCodec"""
+
+        ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(2, 1),
+            next_hop_asn=2,
+            recv_relationship=Relationships.CUSTOMERS,
+        )
+        local_rib = LocalRIB()
+        local_rib.add_ann(ann)
+        ribs_in = RIBsIn()
+        ribs_in.add_unprocessed_ann(ann, Relationships.CUSTOMERS)
+        path = tmp_path / "containers.yaml"
+        SimulatorCodec().dump({"local_rib": local_rib, "ribs_in": ribs_in}, path)
+        assert "!simulator_codec/LocalRIB" in path.read_text()
+        loaded = SimulatorCodec().load(path)
+        assert isinstance(loaded["local_rib"], LocalRIB)
+        assert loaded["local_rib"] == local_rib
+        assert loaded["ribs_in"] == ribs_in
+        # Dumps the same as the dict inside, and not as a Python object
+        assert "python/object" not in yaml.dump(local_rib)
+
+    def test_prefix_indexes(self):
+        """Tests that the RIBsOut and SendQueue prefix indexes stay in sync"""
+
+        prefix = Prefixes.PREFIX.value
+        ann = Announcement(prefix=prefix, as_path=(1,), next_hop_asn=1)
+        withdraw_ann = Announcement(
+            prefix=prefix, as_path=(1,), next_hop_asn=1, withdraw=True
+        )
+        sub_ann = Announcement(
+            prefix=Prefixes.SUBPREFIX.value, as_path=(1,), next_hop_asn=1
+        )
+
+        ribs_out = RIBsOut()
+        for neighbor_asn in (2, 3):
+            ribs_out.add_ann(neighbor_asn, ann)
+        ribs_out.add_ann(4, sub_ann)
+        ribs_out.remove_entry(2, prefix)
+        assert ribs_out.get_sent_anns(prefix) == [(3, ann)]
+        assert RIBsOut(ribs_out.data).prefix_index == ribs_out.prefix_index
+        ribs_out.clear()
+        assert ribs_out.get_sent_anns(prefix) == []
+
+        send_q = SendQueue()
+        for neighbor_asn in (2, 3):
+            send_q.add_ann(neighbor_asn, ann)
+        send_q.add_ann(4, sub_ann)
+        # A withdrawal of the queued ann cancels it out
+        send_q.add_ann(2, withdraw_ann)
+        assert [x.ann for x in send_q.get_send_infos(prefix)] == [ann]
+        assert SendQueue(send_q.data).prefix_index == send_q.prefix_index
+        assert list(send_q.pop(3)) == [prefix]
+        assert list(send_q.get_send_infos(prefix)) == []
+        assert send_q.pop(3, None) is None
+        send_q.clear()
+        assert not send_q.prefix_index
+
+    def test_origin_indexed_local_rib(self):
+        """Tests that the origin index finds the same ann as searching"""
+
+        rng = random.Random(0)
+        local_rib = OriginIndexedLocalRIB()
+        prefixes = [x.value for x in Prefixes]
+        for _ in range(300):
+            prefix = rng.choice(prefixes)
+            if prefix in local_rib and rng.random() < 0.3:
+                local_rib.pop(prefix)
+            else:
+                next_hop_asn = rng.randint(2, 4)
+                local_rib.add_ann(
+                    Announcement(
+                        prefix=prefix,
+                        as_path=(next_hop_asn, rng.randint(5, 7)),
+                        next_hop_asn=next_hop_asn,
+                    )
+                )
+            for origin_asn in range(5, 8):
+                matches = [x for x in local_rib.values() if x.origin == origin_asn]
+                assert local_rib.get_origin_ann(origin_asn) == (
+                    matches[-1] if matches else None
+                )
+                if matches:
+                    for prev_hop_asn in range(2, 5):
+                        as_obj = SimpleNamespace(
+                            policy=SimpleNamespace(_local_rib=local_rib),
+                            provider_asns=frozenset(),
+                        )
+                        prev_hop = SimpleNamespace(asn=prev_hop_asn)
+                        assert StrictuRPF().validate(as_obj, prev_hop, origin_asn) == (
+                            matches[-1].next_hop_asn == prev_hop_asn
+                        )
+        assert OriginIndexedLocalRIB(local_rib).origin_index == (local_rib.origin_index)
+        assert OriginIndexedLocalRIB.yaml_cls() is LocalRIB
+        local_rib.clear()
+        assert not local_rib.origin_index
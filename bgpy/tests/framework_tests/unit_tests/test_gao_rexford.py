@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from bgpy.enums import Prefixes, Relationships
+from bgpy.simulation_engine import Announcement, BGP
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestGaoRexford:
+    def test_gao_rexford_key(self):
+        """Tests that the keys choose the same anns as the comparisons"""
+
+        policy = BGP()
+        rng = random.Random(0)
+        anns = [
+            Announcement(
+                prefix=Prefixes.PREFIX.value,
+                as_path=tuple(rng.randint(1, 2**32 - 1) for _ in range(length)),
+                next_hop_asn=1,
+                recv_relationship=rng.choice(
+                    [
+                        Relationships.PROVIDERS,
+                        Relationships.PEERS,
+                        Relationships.CUSTOMERS,
+                    ]
+                ),
+            )
+            for length in [rng.randint(2, 4) for _ in range(200)]
+        ]
+        pairs = list(zip(anns, reversed(anns)))
+        # Ties must keep the current ann
+        pairs.extend((ann, ann.copy()) for ann in anns[:20])
+
+        for current_ann, new_ann in pairs:
+            best_ann = policy._get_best_ann_by_gao_rexford(current_ann, new_ann)
+            assert best_ann is self._compare(current_ann, new_ann)
+
+    def _compare(self, current_ann: Announcement, new_ann: Announcement):
+        """Compares by local pref, then AS path length, then neighbor ASN"""
+
+        def key(ann: Announcement) -> tuple[int, int, int]:
+            # Lower is better
+            return (-ann.recv_relationship.value, len(ann.as_path), ann.as_path[1])
+
+        # Ties keep the current ann
+        return new_ann if key(new_ann) < key(current_ann) else current_ann
@@ -0,0 +1,52 @@
+import pytest
+
+from bgpy.enums import Relationships
+from bgpy.simulation_engine import SimulationEngine
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestPropagationSchedule:
+    def test_propagation_schedule(self, engine: SimulationEngine):
+        """Tests that the schedule matches the ranks and neighbors of the ASes"""
+
+        as_graph = engine.as_graph
+        schedule = as_graph.propagation_schedule
+        assert as_graph.propagation_schedule is schedule
+        ases = as_graph.ases
+
+        assert [[ases[i] for i in rank] for rank in schedule.up_ranks] == [
+            list(rank) for rank in as_graph.propagation_ranks
+        ]
+        assert [[ases[i] for i in rank] for rank in schedule.down_ranks] == [
+            list(rank) for rank in reversed(as_graph.propagation_ranks)
+        ]
+        assert [ases[i] for i in schedule.peer_phase] == list(ases)
+
+        for i, as_obj in enumerate(ases):
+            for rel, neighbors in (
+                (Relationships.PROVIDERS, as_obj.providers),
+                (Relationships.PEERS, as_obj.peers),
+                (Relationships.CUSTOMERS, as_obj.customers),
+            ):
+                assert [ases[x] for x in schedule.get_neighbors(i, rel)] == list(
+                    neighbors
+                )
+
+    def test_edges(self, engine: SimulationEngine):
+        """Tests that every rank receives from all of its customers/providers"""
+
+        as_graph = engine.as_graph
+        schedule = as_graph.propagation_schedule
+        ases = as_graph.ases
+        indexes = {x.asn: i for i, x in enumerate(ases)}
+        for edges, ranks, attr in (
+            (schedule.up_edges, schedule.up_ranks[1:], "customers"),
+            (schedule.down_edges, schedule.down_ranks[1:], "providers"),
+        ):
+            for (senders, receivers), rank in zip(edges, ranks, strict=True):
+                assert sorted(zip(senders.tolist(), receivers.tolist())) == sorted(
+                    (indexes[sender.asn], i)
+                    for i in rank.tolist()
+                    for sender in getattr(ases[i], attr)
+                )
@@ -0,0 +1,101 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from bgpy.enums import Prefixes, Relationships
+from bgpy.simulation_engine import Announcement, BGPFull, RIBsIn
+
+
+class LinearBGPFull(BGPFull):
+    """Compares the ann from every neighbor, since _new_ann_better changed"""
+
+    name = "LinearBGPFull"
+
+    def _new_ann_better(self, *args, **kwargs) -> bool:
+        return super()._new_ann_better(*args, **kwargs)
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestRIBsIn:
+    def test_prefix_index(self):
+        """Tests that the prefix index follows adds, removals and loads"""
+
+        ribs_in = RIBsIn()
+        anns = [
+            Announcement(prefix=prefix, as_path=(asn, 1), next_hop_asn=asn)
+            for prefix in (Prefixes.PREFIX.value, Prefixes.SUBPREFIX.value)
+            for asn in (2, 3)
+        ]
+        for ann in anns:
+            ribs_in.add_unprocessed_ann(ann, Relationships.CUSTOMERS)
+        ribs_in.remove_entry(2, Prefixes.PREFIX.value)
+        assert [x.unprocessed_ann for x in ribs_in.get_ann_infos(anns[0].prefix)] == [
+            anns[1]
+        ]
+        assert RIBsIn(ribs_in.data).prefix_index == ribs_in.prefix_index
+        assert list(ribs_in.get_ann_infos(Prefixes.SUPERPREFIX.value)) == []
+        ribs_in.clear()
+        assert not ribs_in.prefix_index
+
+    def test_best_ann_info(self):
+        """Tests that the heap chooses the same anns as comparing them all"""
+
+        rng = random.Random(0)
+        as_ = SimpleNamespace(asn=1)
+        policy = BGPFull(as_=as_)  # type: ignore
+        linear_policy = LinearBGPFull(as_=as_)  # type: ignore
+        prefix = Prefixes.PREFIX.value
+        rels = [Relationships.PROVIDERS, Relationships.PEERS, Relationships.CUSTOMERS]
+        for _ in range(300):
+            neighbor_asn = rng.randint(2, 40)
+            if policy._ribs_in.get_unprocessed_ann_recv_rel(neighbor_asn, prefix):
+                for x in (policy, linear_policy):
+                    x._ribs_in.remove_entry(neighbor_asn, prefix)
+            else:
+                ann = Announcement(
+                    prefix=prefix,
+                    as_path=(neighbor_asn,) + (100,) * rng.randint(0, 3),
+                    next_hop_asn=neighbor_asn,
+                )
+                rel = rng.choice(rels)
+                for x in (policy, linear_policy):
+                    x._ribs_in.add_unprocessed_ann(ann, rel)
+            assert policy._select_best_ribs_in(prefix) == (
+                linear_policy._select_best_ribs_in(prefix)
+            )
+
+    def test_origin_index(self):
+        """Tests that the origin index matches searching every AnnInfo"""
+
+        rng = random.Random(0)
+        ribs_in = RIBsIn()
+        prefixes = [x.value for x in Prefixes]
+        for _ in range(300):
+            neighbor_asn = rng.randint(2, 6)
+            prefix = rng.choice(prefixes)
+            if ribs_in.get_unprocessed_ann_recv_rel(neighbor_asn, prefix) and (
+                rng.random() < 0.5
+            ):
+                ribs_in.remove_entry(neighbor_asn, prefix)
+            else:
+                # Adds (or replaces) the ann from the neighbor
+                ann = Announcement(
+                    prefix=prefix,
+                    as_path=(neighbor_asn, rng.randint(7, 9)),
+                    next_hop_asn=neighbor_asn,
+                )
+                ribs_in.add_unprocessed_ann(ann, Relationships.CUSTOMERS)
+            for origin_asn in range(7, 10):
+                for next_hop_asn in range(2, 7):
+                    assert ribs_in.has_origin_next_hop(origin_asn, next_hop_asn) == any(
+                        x.unprocessed_ann is not None
+                        and x.unprocessed_ann.origin == origin_asn
+                        and x.unprocessed_ann.next_hop_asn == next_hop_asn
+                        for prefix_ann_infos in ribs_in.data.values()
+                        for x in prefix_ann_infos.values()
+                    )
+        assert RIBsIn(ribs_in.data).origin_index == ribs_in.origin_index
+        ribs_in.clear()
+        assert not ribs_in.origin_index
@@ -3,7 +3,7 @@ import random
 from frozendict import frozendict
 import pytest
 
-from bgpy.enums import ASNs, Prefixes
+from bgpy.enums import ASNs, Prefixes, ROAValidity
 from bgpy.simulation_framework import (
     ScenarioConfig,
     ROAInfo,
@@ -315,12 +315,21 @@ class TestScenario:
         assert valid.roa_origin == victim
         assert valid.roa_valid_length
         assert valid.valid_by_roa
+        assert valid.roa_validity == ROAValidity.VALID
 
         # Second announcement, from a different origin and more specific prefix, should
         # be invalidated
         assert malicious.roa_origin == victim
         assert not malicious.roa_valid_length
         assert malicious.invalid_by_roa
+        assert malicious.roa_validity == ROAValidity.INVALID
+
+        # Validity is kept by propagation, but reset if the origin changes
+        assert valid.copy({"as_path": (2, victim)}).roa_validity == ROAValidity.VALID
+        forged = malicious.copy({"as_path": (malicious.origin, victim)})
+        assert forged.roa_validity is None
+        # Still too specific
+        assert forged.invalid_by_roa
 
     #######################
     # Adopting ASNs funcs #
@@ -0,0 +1,81 @@
+from frozendict import frozendict
+import pytest
+
+from bgpy.enums import Prefixes, Relationships, Timestamps
+from bgpy.simulation_engine import Announcement, BGP, BGPFull, ROV, SimulationEngine
+
+
+class StatefulROV(ROV):
+    """ROV with state that BGP.reset doesn't know about"""
+
+    name: str = "Stateful ROV"
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore
+        super().__init__(*args, **kwargs)
+        self.state: list[int] = list()
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestSimulationEngine:
+    def test_setup_reuses_policies(self, engine: SimulationEngine):
+        """Tests policies are reset in place when their class doesn't change"""
+
+        as_obj, changed_as_obj = engine.as_graph.ases[:2]
+        ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(as_obj.asn,),
+            timestamp=Timestamps.VICTIM.value,
+            seed_asn=as_obj.asn,
+            recv_relationship=Relationships.ORIGIN,
+        )
+        engine.setup((ann,), BGP)
+        policy = as_obj.policy
+        changed_policy = changed_as_obj.policy
+        assert policy._local_rib.get(ann.prefix) == ann
+
+        engine.setup((), BGP, frozendict({changed_as_obj.asn: ROV}))
+        assert as_obj.policy is policy
+        assert not policy._local_rib
+        assert as_obj.policy.as_.asn == as_obj.asn
+        assert changed_as_obj.policy is not changed_policy
+        assert isinstance(changed_as_obj.policy, ROV)
+
+    def test_setup_without_reset(self, engine: SimulationEngine):
+        """Tests policies are replaced when reset could miss their state"""
+
+        engine.setup((), StatefulROV)
+        policies = [as_obj.policy for as_obj in engine.as_graph]
+        engine.setup((), StatefulROV)
+        for as_obj, policy in zip(engine.as_graph, policies):
+            assert isinstance(as_obj.policy, StatefulROV)
+            assert as_obj.policy is not policy
+        # Its __init__ is newer than the reset that it inherits
+        assert not SimulationEngine._reset_supported(StatefulROV)
+        assert SimulationEngine._reset_supported(ROV)
+        assert SimulationEngine._reset_supported(BGPFull)
+
+    def test_bgp_full_reset(self):
+        """Tests that every BGPFull container is cleared"""
+
+        policy = BGPFull()
+        ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(1,),
+            timestamp=Timestamps.VICTIM.value,
+            recv_relationship=Relationships.CUSTOMERS,
+        )
+        policy._local_rib.add_ann(ann)
+        policy._recv_q.add_ann(ann)
+        policy._ribs_in.add_unprocessed_ann(ann, Relationships.CUSTOMERS)
+        policy._ribs_out.add_ann(2, ann)
+        policy._send_q.add_ann(2, ann)
+        policy.reset()
+        for container in (
+            policy._local_rib,
+            policy._recv_q,
+            policy._ribs_in,
+            policy._ribs_out,
+            policy._send_q,
+        ):
+            assert not container
@@ -0,0 +1,45 @@
+import pytest
+
+from bgpy.enums import Prefixes, Relationships, Timestamps
+from bgpy.simulation_engine import Announcement, BGP, get_wire_ann_cls
+
+
+@pytest.mark.framework
+@pytest.mark.unit_tests
+class TestWireAnnouncement:
+    def test_wire_ann(self):
+        """Tests that a wire ann reads like the copy it stands in for"""
+
+        ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(1,),
+            timestamp=Timestamps.VICTIM.value,
+            seed_asn=1,
+            roa_valid_length=True,
+            roa_origin=1,
+            recv_relationship=Relationships.ORIGIN,
+        )
+        kwargs = {"as_path": (2, 1), "recv_relationship": Relationships.CUSTOMERS}
+        wire_ann = get_wire_ann_cls(Announcement)(ann, kwargs)
+        ann_copy = ann.copy(kwargs)
+
+        for attr in ("prefix", "as_path", "recv_relationship", "seed_asn"):
+            assert getattr(wire_ann, attr) == getattr(ann_copy, attr)
+        assert wire_ann.origin == 1
+        assert wire_ann.valid_by_roa
+        assert wire_ann.copy() == ann_copy
+        assert wire_ann.copy({"next_hop_asn": 2}) == ann_copy.copy({"next_hop_asn": 2})
+
+    def test_shared_send_ann(self):
+        """Tests that the send ann is only copied once for the same kwargs"""
+
+        policy = BGP()
+        ann = Announcement(
+            prefix=Prefixes.PREFIX.value,
+            as_path=(1,),
+            timestamp=Timestamps.VICTIM.value,
+        )
+        send_ann = policy._get_shared_send_ann(ann, {"only_to_customers": 1})
+        assert send_ann.only_to_customers == 1
+        assert policy._get_shared_send_ann(ann, {"only_to_customers": 1}) is send_ann
+        assert policy._get_shared_send_ann(ann, {"only_to_customers": 2}) != send_ann
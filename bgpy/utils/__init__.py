@@ -2,11 +2,13 @@ from .diagram import Diagram
 from .engine_run_config import EngineRunConfig
 from .engine_runner import EngineRunner
 from .simulator_codec import SimulatorCodec
+from .binary_codec import BinaryCodec
 
 __all__ = [
     "Diagram",
     "EngineRunConfig",
     "EngineRunner",
     "SimulatorCodec",
+    "BinaryCodec",
     "get_country_asns",
 ]
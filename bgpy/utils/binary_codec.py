@@ -0,0 +1,550 @@
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from importlib import import_module
+from pathlib import Path
+from struct import Struct
+from typing import Any, Callable, TYPE_CHECKING
+from weakref import proxy
+
+from bgpy.simulation_engine.ann_containers.ann_container import AnnContainer
+from bgpy.simulation_engine.ann_containers.ann_container import (
+    AnnContainerYamlAdapter,
+)
+from bgpy.simulation_engine.announcement import Announcement
+from bgpy.simulation_engine.announcement_family import CoreAnnouncement
+from bgpy.simulation_engine.announcement_family import get_ann_cls
+from bgpy.simulation_engine.lazy_path_announcement import LazyASPath
+from bgpy.simulation_engine.policies import Policy
+from bgpy.simulation_engine.simulation_engines import SimulationEngine
+
+if TYPE_CHECKING:
+    from bgpy.simulation_engine import BaseSimulationEngine
+
+
+_MAGIC = b"BGPY"
+_VERSION = 1
+_DOUBLE = Struct("<d")
+
+# Value tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_NEG_INT = 4
+_FLOAT = 5
+_STR = 6
+_PATH = 7
+_TUPLE = 8
+_LIST = 9
+_DICT = 10
+_SET = 11
+_FROZENSET = 12
+_ENUM = 13
+_CLS = 14
+_RECORD = 15
+_CONTAINER = 16
+
+# Kinds of classes in the class table
+_PLAIN_CLS = 0
+_DATACLASS = 1
+_ANN_FAMILY_CLS = 2
+
+
+class BinaryCodec:
+    """Compact binary encoding of anns, AnnContainers, and engine RIBs
+
+    YAML (see SimulatorCodec) is readable, but much too slow and large
+    for shipping RIBs between processes or snapshotting full engines.
+    This encodes the same objects losslessly into bytes:
+
+    * Every value starts with a one byte tag
+    * Ints (including ASNs) are varints, and AS paths are a length
+      followed by the varint ASNs (LazyASPaths are written as tuples, and
+      the ann class converts them back)
+    * Strings (mostly prefixes), classes, and enum classes are written
+      once to tables at the start, and then referred to by index
+    * Anns (and other dataclasses, such as AnnInfo) are written as their
+      field values, in the order of the field names in the class table.
+      Anns from get_ann_cls are recreated from their mixins.
+    * AnnContainers go through the AnnContainerYamlAdapter, just like
+      in the SimulatorCodec
+
+    Classes are stored by their import path. When decoding, only
+    classes from bgpy modules are imported. Classes from other modules
+    must already be defined as a Policy, ann, or AnnContainer subclass,
+    so data can't make the decoder import arbitrary modules. Decoding
+    still creates any of those classes with any field values, so only
+    load data from trusted sources.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes the obj into bytes"""
+
+        return _Encoder().encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decodes bytes from dumps
+
+        Only for trusted data (see the class docstring)
+        """
+
+        return _Decoder(data).decode()
+
+    def dump(self, obj: Any, path: Path) -> None:
+        """Writes the encoded obj to the path"""
+
+        path.write_bytes(self.dumps(obj))
+
+    def load(self, path: Path) -> Any:
+        """Reads an obj written with dump"""
+
+        return self.loads(path.read_bytes())
+
+    ###################
+    # Engine snapshot #
+    ###################
+
+    def dumps_engine(self, engine: "BaseSimulationEngine") -> bytes:
+        """Encodes the policy class and RIBs of every AS in the engine"""
+
+        return self.dumps(
+            {
+                as_obj.asn: (as_obj.policy.__class__, as_obj.policy.__to_yaml_dict__())
+                for as_obj in engine.as_graph
+            }
+        )
+
+    def loads_engine(self, engine: "BaseSimulationEngine", data: bytes) -> None:
+        """Restores the policies from dumps_engine into an engine
+
+        The engine must have the same AS graph as the one that was dumped.
+        Only for trusted data (see the class docstring)
+        """
+
+        for asn, (PolicyCls, policy_dict) in self.loads(data).items():
+            as_obj = engine.as_graph.as_dict[asn]
+            policy = PolicyCls.__from_yaml_dict__(policy_dict, PolicyCls.__name__)
+            policy.as_ = proxy(as_obj)
+            as_obj.policy = policy
+        if isinstance(engine, SimulationEngine):
+            if engine.rib_store is not None:
+                engine.add_local_ribs_to_rib_store()
+            engine.clear_forwarding_trees()
+
+    def dump_engine(self, engine: "BaseSimulationEngine", path: Path) -> None:
+        """Writes a snapshot of the engine's RIBs to the path"""
+
+        path.write_bytes(self.dumps_engine(engine))
+
+    def load_engine(self, engine: "BaseSimulationEngine", path: Path) -> None:
+        """Restores a snapshot written with dump_engine"""
+
+        self.loads_engine(engine, path.read_bytes())
+
+
+############
+# Encoding #
+############
+
+
+class _Encoder:
+    """Encodes one obj, building the tables as it goes"""
+
+    def __init__(self) -> None:
+        self.body: bytearray = bytearray()
+        self.strs: dict[str, int] = dict()
+        self.classes: dict[type, int] = dict()
+        # Field names of every record class
+        self.record_fields: dict[type, tuple[str, ...]] = dict()
+        self.writers: dict[type, Callable[[Any], None]] = {
+            type(None): self._write_none,
+            bool: self._write_bool,
+            int: self._write_int,
+            float: self._write_float,
+            str: self._write_str,
+            tuple: self._write_tuple,
+            list: self._write_list,
+            dict: self._write_dict,
+            set: self._write_set,
+            frozenset: self._write_set,
+        }
+
+    def encode(self, obj: Any) -> bytes:
+        """Returns the header, tables, and then the encoded obj"""
+
+        self.write(obj)
+        out = bytearray(_MAGIC)
+        _write_varint(out, _VERSION)
+        _write_varint(out, len(self.strs))
+        for string in self.strs:
+            encoded = string.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, len(self.classes))
+        for Cls in self.classes:
+            self._write_cls_spec(out, Cls)
+        out += self.body
+        return bytes(out)
+
+    def write(self, value: Any) -> None:
+        """Writes any supported value"""
+
+        writer = self.writers.get(type(value))
+        if writer is None:
+            writer = self._get_writer(type(value))
+            self.writers[type(value)] = writer
+        writer(value)
+
+    def _get_writer(self, Cls: type) -> Callable[[Any], None]:
+        """Returns the writer for classes that aren't builtins"""
+
+        if issubclass(Cls, Enum):
+            return self._write_enum
+        elif issubclass(Cls, LazyASPath):
+            return self._write_lazy_as_path
+        elif issubclass(Cls, AnnContainer):
+            return self._write_container
+        elif issubclass(Cls, CoreAnnouncement):
+            self.record_fields[Cls] = tuple(x for x, _ in Cls._ann_fields)
+            return self._write_ann_family_record
+        elif is_dataclass(Cls):
+            self.record_fields[Cls] = tuple(x.name for x in fields(Cls))
+            return self._write_record
+        elif issubclass(Cls, type):
+            return self._write_cls
+        else:
+            raise TypeError(f"BinaryCodec can't encode {Cls}")
+
+    ##########
+    # Values #
+    ##########
+
+    def _write_none(self, value: None) -> None:
+        self.body.append(_NONE)
+
+    def _write_bool(self, value: bool) -> None:
+        self.body.append(_TRUE if value else _FALSE)
+
+    def _write_int(self, value: int) -> None:
+        body = self.body
+        if value >= 0:
+            body.append(_INT)
+            _write_varint(body, value)
+        else:
+            body.append(_NEG_INT)
+            _write_varint(body, -value)
+
+    def _write_float(self, value: float) -> None:
+        self.body.append(_FLOAT)
+        self.body += _DOUBLE.pack(value)
+
+    def _write_str(self, value: str) -> None:
+        self.body.append(_STR)
+        _write_varint(self.body, self._get_str_id(value))
+
+    def _write_tuple(self, value: tuple[Any, ...]) -> None:
+        """Tuples of non-negative ints (AS paths) are just varints"""
+
+        body = self.body
+        for x in value:
+            if not isinstance(x, int) or isinstance(x, bool) or x < 0:
+                body.append(_TUPLE)
+                self._write_items(value)
+                return
+        body.append(_PATH)
+        _write_varint(body, len(value))
+        for asn in value:
+            _write_varint(body, asn)
+
+    def _write_lazy_as_path(self, value: LazyASPath) -> None:
+        self._write_tuple(value.to_tuple())
+
+    def _write_list(self, value: list[Any]) -> None:
+        self.body.append(_LIST)
+        self._write_items(value)
+
+    def _write_set(self, value: set[Any] | frozenset[Any]) -> None:
+        self.body.append(_SET if isinstance(value, set) else _FROZENSET)
+        self._write_items(value)
+
+    def _write_items(self, value: Any) -> None:
+        _write_varint(self.body, len(value))
+        write = self.write
+        for x in value:
+            write(x)
+
+    def _write_dict(self, value: dict[Any, Any]) -> None:
+        self.body.append(_DICT)
+        _write_varint(self.body, len(value))
+        write = self.write
+        for k, v in value.items():
+            write(k)
+            write(v)
+
+    def _write_enum(self, value: Enum) -> None:
+        self.body.append(_ENUM)
+        _write_varint(self.body, self._get_cls_id(value.__class__))
+        self.write(value._value_)
+
+    def _write_cls(self, value: type) -> None:
+        self.body.append(_CLS)
+        _write_varint(self.body, self._get_cls_id(value))
+
+    def _write_record(self, value: Any) -> None:
+        """Writes the field values of a dataclass"""
+
+        Cls = value.__class__
+        self.body.append(_RECORD)
+        _write_varint(self.body, self._get_cls_id(Cls))
+        write = self.write
+        for name in self.record_fields[Cls]:
+            write(getattr(value, name))
+
+    def _write_ann_family_record(self, value: CoreAnnouncement) -> None:
+        """Family anns are tuples of their field values"""
+
+        self.body.append(_RECORD)
+        _write_varint(self.body, self._get_cls_id(value.__class__))
+        write = self.write
+        for x in value:
+            write(x)
+
+    def _write_container(self, value: AnnContainer[Any, Any]) -> None:
+        self.body.append(_CONTAINER)
+        Cls = AnnContainerYamlAdapter.get_yaml_cls(value)
+        _write_varint(self.body, self._get_cls_id(Cls))
+        self.write(AnnContainerYamlAdapter.to_yaml_dict(value))
+
+    ##########
+    # Tables #
+    ##########
+
+    def _get_str_id(self, value: str) -> int:
+        str_id = self.strs.get(value)
+        if str_id is None:
+            str_id = self.strs[value] = len(self.strs)
+        return str_id
+
+    def _get_cls_id(self, Cls: type) -> int:
+        cls_id = self.classes.get(Cls)
+        if cls_id is None:
+            cls_id = self.classes[Cls] = len(self.classes)
+        return cls_id
+
+    def _write_cls_spec(self, out: bytearray, Cls: type) -> None:
+        """Writes the kind of class, where to import it from, and its fields
+
+        Anns from get_ann_cls are created at runtime, so their mixins
+        are written instead
+        """
+
+        if issubclass(Cls, CoreAnnouncement):
+            out.append(_ANN_FAMILY_CLS)
+            names = [_get_import_path(x) for x in Cls.__mro__ if _is_mixin(x)]
+        elif Cls in self.record_fields:
+            out.append(_DATACLASS)
+            names = [_get_import_path(Cls)]
+        else:
+            out.append(_PLAIN_CLS)
+            names = [_get_import_path(Cls)]
+        names.extend(self.record_fields.get(Cls, ()))
+        _write_varint(out, len(names))
+        for name in names:
+            encoded = name.encode()
+            _write_varint(out, len(encoded))
+            out += encoded
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Writes 7 bits per byte, with the high bit set if more bytes follow"""
+
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_import_path(Cls: type) -> str:
+    return f"{Cls.__module__}:{Cls.__qualname__}"
+
+
+def _is_mixin(Cls: type) -> bool:
+    """Returns True for the ann mixins of a class from get_ann_cls"""
+
+    return "_ann_fields" in vars(Cls) and not issubclass(Cls, CoreAnnouncement)
+
+
+############
+# Decoding #
+############
+
+
+class _Decoder:
+    """Decodes bytes from the _Encoder"""
+
+    def __init__(self, data: bytes) -> None:
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not encoded with the BinaryCodec")
+        self.data: bytes = data
+        self.pos: int = len(_MAGIC)
+        version = self._read_varint()
+        if version != _VERSION:
+            raise ValueError(f"Unsupported BinaryCodec version {version}")
+        self.strs: list[str] = [self._read_raw_str() for _ in self._range()]
+        # (kind, class, field names)
+        self.classes: list[tuple[int, type, tuple[str, ...]]] = [
+            self._read_cls_spec() for _ in self._range()
+        ]
+        self.readers: list[Callable[[], Any]] = [
+            lambda: None,
+            lambda: False,
+            lambda: True,
+            self._read_varint,
+            lambda: -self._read_varint(),
+            self._read_float,
+            lambda: self.strs[self._read_varint()],
+            self._read_path,
+            lambda: tuple(self._read_items()),
+            self._read_items,
+            self._read_dict,
+            lambda: set(self._read_items()),
+            lambda: frozenset(self._read_items()),
+            self._read_enum,
+            lambda: self.classes[self._read_varint()][1],
+            self._read_record,
+            self._read_container,
+        ]
+
+    def decode(self) -> Any:
+        obj = self.read()
+        if self.pos != len(self.data):
+            raise ValueError("Trailing bytes after the BinaryCodec data")
+        return obj
+
+    def read(self) -> Any:
+        """Reads any value"""
+
+        tag = self.data[self.pos]
+        self.pos += 1
+        return self.readers[tag]()
+
+    def _read_varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        byte = data[pos]
+        pos += 1
+        value = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        self.pos = pos
+        return value
+
+    def _range(self) -> range:
+        return range(self._read_varint())
+
+    ##########
+    # Values #
+    ##########
+
+    def _read_float(self) -> float:
+        (value,) = _DOUBLE.unpack_from(self.data, self.pos)
+        self.pos += _DOUBLE.size
+        return value  # type: ignore
+
+    def _read_path(self) -> tuple[int, ...]:
+        read_varint = self._read_varint
+        return tuple([read_varint() for _ in self._range()])
+
+    def _read_items(self) -> list[Any]:
+        read = self.read
+        return [read() for _ in self._range()]
+
+    def _read_dict(self) -> dict[Any, Any]:
+        read = self.read
+        dct = dict()
+        for _ in self._range():
+            key = read()
+            dct[key] = read()
+        return dct
+
+    def _read_enum(self) -> Enum:
+        EnumCls = self.classes[self._read_varint()][1]
+        return EnumCls(self.read())  # type: ignore
+
+    def _read_record(self) -> Any:
+        _, Cls, names = self.classes[self._read_varint()]
+        read = self.read
+        kwargs = {name: read() for name in names}
+        return Cls(**kwargs)
+
+    def _read_container(self) -> AnnContainer[Any, Any]:
+        Cls = self.classes[self._read_varint()][1]
+        return AnnContainerYamlAdapter.from_yaml_dict(Cls, self.read())
+
+    ##########
+    # Tables #
+    ##########
+
+    def _read_raw_str(self) -> str:
+        length = self._read_varint()
+        start = self.pos
+        self.pos += length
+        return self.data[start : self.pos].decode()
+
+    def _read_cls_spec(self) -> tuple[int, type, tuple[str, ...]]:
+        kind = self.data[self.pos]
+        self.pos += 1
+        names = [self._read_raw_str() for _ in self._range()]
+        if kind == _ANN_FAMILY_CLS:
+            mixins = [x for x in names if ":" in x]
+            Cls = get_ann_cls(*[_import(x) for x in mixins])
+            return kind, Cls, tuple(names[len(mixins) :])
+        else:
+            return kind, _import(names[0]), tuple(names[1:])
+
+
+def _import(import_path: str) -> type:
+    """Returns the class at module:qualname
+
+    Only bgpy modules are imported. Classes from any other module must
+    already be defined as a subclass of one of the _REGISTERED_BASES
+    """
+
+    module_name, qualname = import_path.split(":")
+    if module_name == "bgpy" or module_name.startswith("bgpy."):
+        obj: Any = import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+        if isinstance(obj, type):
+            return obj
+    else:
+        for Base in _REGISTERED_BASES:
+            for Cls in _get_subclasses(Base):
+                if _get_import_path(Cls) == import_path:
+                    return Cls
+    raise ValueError(f"BinaryCodec won't load {import_path}")
+
+
+def _get_subclasses(Cls: type) -> list[type]:
+    """Returns every subclass of Cls that has been defined"""
+
+    subclasses = list()
+    stack = [Cls]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            subclasses.append(subclass)
+            stack.append(subclass)
+    return subclasses
+
+
+# Classes outside of bgpy that the decoder may return (see _import)
+_REGISTERED_BASES: tuple[type, ...] = (
+    Policy,
+    Announcement,
+    CoreAnnouncement,
+    AnnContainer,
+)
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Any
+
+from frozendict import frozendict
 
 from bgpy.as_graphs import ASGraphInfo, ASGraph, CAIDAASGraph
 from bgpy.simulation_framework.scenarios import ScenarioConfig
@@ -27,3 +30,5 @@ class EngineRunConfig:
     MetricTrackerCls: type[MetricTracker] = MetricTracker
     ASGraphAnalyzerCls: type[BaseASGraphAnalyzer] = ASGraphAnalyzer
     DiagramCls: type[Diagram] = Diagram
+    # Such as frozendict({"reachability_pruning": True})
+    simulation_engine_kwargs: frozendict[str, Any] = frozendict()  # type: ignore
@@ -92,7 +92,9 @@ class EngineRunner:
             BasePolicyCls=self.conf.scenario_config.BasePolicyCls,
         )
 
-        return self.conf.SimulationEngineCls(as_graph)
+        return self.conf.SimulationEngineCls(
+            as_graph, **self.conf.simulation_engine_kwargs
+        )
 
     def _get_trial_metrics(
         self,
@@ -6,6 +6,9 @@ import yaml
 from .simulator_loader import SimulatorLoader
 from bgpy.enums import YamlAbleEnum
 from bgpy.simulation_engine.ann_containers.ann_container import AnnContainer
+from bgpy.simulation_engine.ann_containers.ann_container import (
+    AnnContainerYamlAdapter,
+)
 
 # 2-way mappings between the types and the yaml tags
 types_to_yaml_tags = {X: X.yaml_suffix() for X in YamlAbleEnum.yamlable_enums()}
@@ -45,7 +48,7 @@ class SimulatorCodec(YamlCodec):
                 # Don't use unessecary name
                 return typ(value=dct["value"])
             elif issubclass(typ, AnnContainer):
-                return typ.__from_yaml_dict__(dct=dct, yaml_tag=yaml_tag_suffix)
+                return AnnContainerYamlAdapter.from_yaml_dict(typ, dct)
             else:
                 return typ(**dct)
         except Exception as e:
@@ -60,8 +63,10 @@ class SimulatorCodec(YamlCodec):
         if isinstance(obj, YamlAbleEnum):
             return types_to_yaml_tags[type(obj)], {"value": obj.value, "name": obj.name}
         elif isinstance(obj, AnnContainer):
-            rv = types_to_yaml_tags[type(obj)], obj.__to_yaml_dict__()
-            return rv
+            return (
+                types_to_yaml_tags[AnnContainerYamlAdapter.get_yaml_cls(obj)],
+                AnnContainerYamlAdapter.to_yaml_dict(obj),
+            )
         else:
             # Encode the given object and also return the tag it should have
             return types_to_yaml_tags[type(obj)], vars(obj)